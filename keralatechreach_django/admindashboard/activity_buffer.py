@@ -0,0 +1,94 @@
+"""
+Batched ActivityLog writes.
+
+log_activity() hands entries to this buffer instead of inserting them one
+by one inside the admin request. The buffer is written with a single
+bulk_create when it holds ACTIVITY_LOG_BATCH_SIZE entries, when the oldest
+entry is ACTIVITY_LOG_FLUSH_INTERVAL seconds old (a timer thread), and at
+interpreter exit. With ACTIVITY_LOG_SYNC = True every entry is saved
+immediately.
+"""
+import atexit
+import logging
+import threading
+
+from django.conf import settings
+from django.db import connection
+
+from .models import ActivityLog
+
+logger = logging.getLogger(__name__)
+
+
+class ActivityLogBuffer:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = []
+        self.timer = None
+
+    def add(self, entry):
+        if getattr(settings, 'ACTIVITY_LOG_SYNC', False):
+            entry.save()
+            return
+
+        with self.lock:
+            self.entries.append(entry)
+            full = len(self.entries) >= getattr(settings, 'ACTIVITY_LOG_BATCH_SIZE', 100)
+            if not full and self.timer is None:
+                self.timer = threading.Timer(
+                    getattr(settings, 'ACTIVITY_LOG_FLUSH_INTERVAL', 5), self.flush_from_timer
+                )
+                self.timer.daemon = True
+                self.timer.start()
+        if full:
+            self.flush()
+
+    def take(self):
+        with self.lock:
+            entries, self.entries = self.entries, []
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+        return entries
+
+    def flush(self):
+        """Write all buffered entries. Returns the number written."""
+        entries = self.take()
+        if not entries:
+            return 0
+        try:
+            ActivityLog.objects.bulk_create(entries)
+            return len(entries)
+        except Exception:
+            # One bad row (e.g. its user was deleted meanwhile) must not
+            # lose the whole batch
+            logger.exception('Bulk activity log write failed; saving %d entries one by one', len(entries))
+            written = 0
+            for entry in entries:
+                try:
+                    entry.save()
+                    written += 1
+                except Exception:
+                    logger.exception('Dropping activity log entry %r', entry.action)
+            return written
+
+    def flush_from_timer(self):
+        try:
+            self.flush()
+        finally:
+            # The timer thread has its own connection
+            connection.close()
+
+
+buffer = ActivityLogBuffer()
+
+
+def add(entry):
+    buffer.add(entry)
+
+
+def flush():
+    return buffer.flush()
+
+
+atexit.register(flush)
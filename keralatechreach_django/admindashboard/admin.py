@@ -2,7 +2,7 @@ from django.contrib import admin
 from .models import (
     QuestionPaper, University, Degree, Exam, Job, District,
     Initiative, EventCategory, Event, News, ContactMessage,
-    Gallery, SiteSetting, UserProfile
+    Gallery, SiteSetting, UserProfile, FailedTask
 )
 
 @admin.register(QuestionPaper)
@@ -98,3 +98,9 @@ class UserProfileAdmin(admin.ModelAdmin):
     )
     search_fields = ('user__username', 'email', 'phone', 'bio')
     list_editable = ('is_verified', 'is_approved')
+
+@admin.register(FailedTask)
+class FailedTaskAdmin(admin.ModelAdmin):
+    list_display = ('task', 'attempts', 'created_at', 'failed_at')
+    list_filter = ('task',)
+    readonly_fields = ('task', 'payload', 'attempts', 'error', 'created_at', 'failed_at')
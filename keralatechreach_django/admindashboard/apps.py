@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class AdmindashboardConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'admindashboard'
+
+    def ready(self):
+        from . import images, pdfs, search, stats  # noqa: F401  connect the image, PDF, search index and stats signals
@@ -0,0 +1,121 @@
+"""
+Write-behind counters for hot integer columns (views, likes).
+
+increment() only adds to an in-process buffer; the buffer is written back
+with one UPDATE ... SET field = field + n per (model, field, n) group when
+COUNTER_FLUSH_THRESHOLD increments are pending (the request that crosses
+the limit pays for the flush), when the oldest pending increment is
+COUNTER_FLUSH_INTERVAL seconds old (a timer thread), and at interpreter
+exit. Readers never take the write lock and concurrent increments are
+never lost, at the cost of the stored value lagging by up to one flush
+interval. Each worker process keeps and flushes its own buffer, so only a
+killed worker loses its pending views.
+"""
+import atexit
+import logging
+import threading
+from collections import defaultdict
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connection
+from django.db.models import F
+
+from .models import News, Event, QuestionPaper, Note
+
+logger = logging.getLogger(__name__)
+
+COUNTED_FIELDS = {
+    News: ('views_count', 'likes_count'),
+    Event: ('views_count',),
+    QuestionPaper: ('views_count',),
+    Note: ('views_count',),
+}
+
+
+class CounterBuffer:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pending = defaultdict(int)  # (model label, field, lookup, key) -> increment
+        self.pending_total = 0
+        self.timer = None
+
+    def increment(self, model, key, field, amount=1, lookup='pk'):
+        if field not in COUNTED_FIELDS.get(model, ()):
+            raise ValueError(f'{model.__name__}.{field} is not a buffered counter')
+        if lookup == 'pk':
+            key = int(key)
+        with self.lock:
+            self.pending[(model._meta.label, field, lookup, key)] += amount
+            self.pending_total += amount
+            due = self.pending_total >= getattr(settings, 'COUNTER_FLUSH_THRESHOLD', 1000)
+            if not due:
+                self.schedule()
+        if due:
+            self.flush()
+
+    def schedule(self):
+        # Called with the lock held
+        if self.timer is None:
+            self.timer = threading.Timer(getattr(settings, 'COUNTER_FLUSH_INTERVAL', 10), self.flush_from_timer)
+            self.timer.daemon = True
+            self.timer.start()
+
+    def take(self):
+        with self.lock:
+            pending, self.pending = self.pending, defaultdict(int)
+            self.pending_total = 0
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+        return pending
+
+    def flush(self):
+        """Write every pending increment to the database. Returns the number of rows updated."""
+        pending = self.take()
+        groups = defaultdict(list)  # (model label, field, lookup, amount) -> keys
+        for (label, field, lookup, key), amount in pending.items():
+            groups[(label, field, lookup, amount)].append(key)
+
+        updated = 0
+        for (label, field, lookup, amount), keys in groups.items():
+            model = apps.get_model(label)
+            try:
+                updated += model.objects.filter(**{f'{lookup}__in': keys}).update(**{field: F(field) + amount})
+            except Exception:
+                # Put the increments back so a later flush retries them
+                logger.exception('Flushing %s.%s counters failed', label, field)
+                with self.lock:
+                    for key in keys:
+                        self.pending[(label, field, lookup, key)] += amount
+                        self.pending_total += amount
+                    self.schedule()
+        return updated
+
+    def flush_from_timer(self):
+        try:
+            self.flush()
+        finally:
+            # The timer thread has its own connection
+            connection.close()
+
+
+buffer = CounterBuffer()
+
+
+def increment(instance_or_model, field, key=None, amount=1, lookup='pk'):
+    """
+    Add `amount` to `field` of a model instance, or of the row of a model
+    class whose `lookup` field (the pk by default) equals `key`.
+    """
+    if isinstance(instance_or_model, type):
+        buffer.increment(instance_or_model, key, field, amount, lookup)
+    else:
+        buffer.increment(type(instance_or_model), instance_or_model.pk, field, amount)
+
+
+def flush():
+    return buffer.flush()
+
+
+atexit.register(flush)
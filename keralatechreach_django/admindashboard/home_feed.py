@@ -0,0 +1,96 @@
+"""
+Home page content shared by the public landing page and the /api/home/
+endpoint. Each section is a single query; the assembled feed is cached for
+HOME_FEED_CACHE_TIMEOUT seconds.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from .models import (
+    Event, News, Exam, Job, Initiative, EntranceNotification,
+    Testimonial, FAQ, University,
+)
+
+
+def _featured_jobs(now):
+    return Job.objects.filter(is_published=True).select_related('created_by__user').order_by('-updated_at')
+
+
+def _featured_events(now):
+    return Event.objects.filter(is_published=True).select_related('category', 'district').order_by('event_start')
+
+
+def _featured_news(now):
+    return News.objects.filter(is_published=True).select_related('created_by__user').order_by('-created_at')
+
+
+def _featured_exams(now):
+    return Exam.objects.filter(show_on_home=True, is_published=True).select_related(
+        'degree_name', 'university'
+    ).order_by('exam_date')
+
+
+def _upcoming_events(now):
+    return _featured_events(now).filter(event_start__gte=now)
+
+
+def _latest_exams(now):
+    return Exam.objects.filter(is_published=True, exam_date__gte=now.date()).select_related(
+        'degree_name', 'university'
+    ).order_by('exam_date')
+
+
+def _initiatives(now):
+    return Initiative.objects.filter(is_published=True).order_by('-updated_at')
+
+
+def _entrance_notifications(now):
+    return EntranceNotification.objects.filter(is_published=True, deadline__gte=now.date()).order_by('deadline')
+
+
+def _testimonials(now):
+    return Testimonial.objects.filter(is_approved=True).order_by('-created_at')
+
+
+def _faqs(now):
+    return FAQ.objects.filter(is_published=True).order_by('display_order')
+
+
+def _universities(now):
+    return University.objects.order_by('name')
+
+
+SECTIONS = {
+    'featured_jobs': _featured_jobs,
+    'featured_events': _featured_events,
+    'featured_news': _featured_news,
+    'featured_exams': _featured_exams,
+    'upcoming_events': _upcoming_events,
+    'latest_news': _featured_news,
+    'latest_exams': _latest_exams,
+    'initiatives': _initiatives,
+    'entrance_notifications': _entrance_notifications,
+    'testimonials': _testimonials,
+    'faqs': _faqs,
+    'universities': _universities,
+}
+
+
+def build_home_feed(limits):
+    """
+    Return {section: [objects]} for the requested sections.
+
+    `limits` maps a section name from SECTIONS to the maximum number of rows
+    (None for no limit). Results are cached per set of limits.
+    """
+    cache_key = 'home_feed:' + ','.join(f'{name}={limit}' for name, limit in sorted(limits.items()))
+    feed = cache.get(cache_key)
+    if feed is None:
+        now = timezone.now()
+        feed = {}
+        for name, limit in limits.items():
+            queryset = SECTIONS[name](now)
+            feed[name] = list(queryset[:limit] if limit is not None else queryset)
+        cache.set(cache_key, feed, getattr(settings, 'HOME_FEED_CACHE_TIMEOUT', 60))
+    return feed
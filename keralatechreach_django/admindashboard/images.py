@@ -0,0 +1,160 @@
+"""
+Resized WebP/JPEG variants of uploaded images.
+
+News.image, Gallery.image, Initiative.photo and UserProfile.profile_picture
+are served at IMAGE_VARIANT_WIDTHS through /images/<width>/<format>/<name>.
+A variant is rendered with Pillow the first time it is asked for, or ahead
+of time by the generate_image_variants task queued when an image is saved,
+and written to MEDIA_ROOT/variants/ under the SHA-256 of the source file, so
+re-uploading the same picture reuses its variants. The bytes are then sent
+by admindashboard.media.serve_media (Range, ETag, proxy handoff).
+"""
+import hashlib
+import os
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import post_init, post_save
+from django.http import Http404
+from django.urls import reverse
+from django.views.decorators.http import require_safe
+from PIL import Image, ImageOps
+
+from .media import media_path, serve_media
+from .models import News, Gallery, Initiative, UserProfile
+from .task_queue import enqueue
+
+FORMATS = {
+    'webp': ('WEBP', 'webp', {'quality': 80, 'method': 4}),
+    'jpeg': ('JPEG', 'jpg', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+
+# model -> image fields that get variants
+IMAGE_FIELDS = {
+    News: ('image',),
+    Gallery: ('image',),
+    Initiative: ('photo',),
+    UserProfile: ('profile_picture',),
+}
+
+SOURCE_DIRS = ('news/', 'gallery/', 'initiatives/', 'profiles/')
+
+
+def widths():
+    return getattr(settings, 'IMAGE_VARIANT_WIDTHS', (320, 640, 1280))
+
+
+def source_sha256(name):
+    """SHA-256 of the media file `name`, cached until the file changes."""
+    path = media_path(name)
+    stat = os.stat(path)
+    key = f'image_sha256:{hashlib.md5(name.encode()).hexdigest()}:{stat.st_mtime_ns}:{stat.st_size}'
+    sha256 = cache.get(key)
+    if sha256 is None:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as source:
+            for block in iter(lambda: source.read(64 * 1024), b''):
+                digest.update(block)
+        sha256 = digest.hexdigest()
+        cache.set(key, sha256, None)
+    return sha256
+
+
+def variant_name(sha256, width, fmt):
+    return f'variants/{sha256[:2]}/{sha256}-{width}.{FORMATS[fmt][1]}'
+
+
+def render_variant(source_path, destination, width, fmt):
+    pil_format, _, options = FORMATS[fmt]
+    with Image.open(source_path) as image:
+        # Lets the JPEG decoder skip detail we are about to throw away
+        image.draft('RGB', (width, width * image.height // max(image.width, 1)))
+        image = ImageOps.exif_transpose(image)
+        if image.width > width:
+            image = image.resize((width, round(image.height * width / image.width)), Image.LANCZOS)
+        if fmt == 'jpeg' and image.has_transparency_data:
+            # JPEG has no alpha: flatten onto white rather than black
+            background = Image.new('RGB', image.size, 'white')
+            background.paste(image.convert('RGBA'), mask=image.convert('RGBA'))
+            image = background
+        elif image.mode not in ('RGB', 'RGBA') or fmt == 'jpeg':
+            image = image.convert('RGBA' if image.has_transparency_data else 'RGB')
+
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        # Write under a temporary name so a concurrent reader never sees half a file
+        partial = f'{destination}.{os.getpid()}.tmp'
+        image.save(partial, pil_format, **options)
+        os.replace(partial, destination)
+
+
+def generate_variants(name):
+    """Render every missing variant of media file `name`; returns their names."""
+    return [ensure_variant(name, width, fmt) for width in widths() for fmt in FORMATS]
+
+
+def ensure_variant(name, width, fmt):
+    """Name of the `width`/`fmt` variant of media file `name`, rendering it if needed."""
+    variant = variant_name(source_sha256(name), width, fmt)
+    destination = os.path.join(settings.MEDIA_ROOT, variant)
+    if not os.path.exists(destination):
+        render_variant(media_path(name), destination, width, fmt)
+    return variant
+
+
+def variant_url(field_file, width, fmt='webp'):
+    if not field_file:
+        return None
+    return reverse('image_variant', kwargs={'width': width, 'fmt': fmt, 'path': field_file.name})
+
+
+def variant_urls(field_file):
+    """{format: [{'width', 'url'}]} for an ImageField value; None when it is empty."""
+    if not field_file:
+        return None
+    return {
+        fmt: [{'width': width, 'url': variant_url(field_file, width, fmt)} for width in widths()]
+        for fmt in FORMATS
+    }
+
+
+@require_safe
+def image_variant(request, width, fmt, path):
+    if width not in widths() or fmt not in FORMATS or not path.startswith(SOURCE_DIRS):
+        raise Http404('Not found')
+    try:
+        variant = ensure_variant(path, width, fmt)
+    except (OSError, Image.DecompressionBombError):
+        # Not an image Pillow can read
+        raise Http404('Not found')
+    return serve_media(request, variant)
+
+
+def _stored_names(sender, instance):
+    # Read the raw attribute values: a deferred field must not cost a query
+    names = {}
+    for field in IMAGE_FIELDS[sender]:
+        if field in instance.__dict__:
+            value = instance.__dict__[field]
+            names[field] = getattr(value, 'name', value) or ''
+    return names
+
+
+def remember_images(sender, instance, **kwargs):
+    instance._image_names = _stored_names(sender, instance)
+
+
+def queue_variants(sender, instance, created=False, raw=False, **kwargs):
+    """Render the variants of newly saved images in the background."""
+    if raw:
+        return
+    previous = {} if created else getattr(instance, '_image_names', {})
+    current = _stored_names(sender, instance)
+    for field, name in current.items():
+        if name and name != previous.get(field):
+            enqueue('generate_image_variants', path=name)
+    instance._image_names = current
+
+
+for _model in IMAGE_FIELDS:
+    post_init.connect(remember_images, sender=_model, dispatch_uid=f'image_variants_{_model._meta.label_lower}_init')
+    post_save.connect(queue_variants, sender=_model, dispatch_uid=f'image_variants_{_model._meta.label_lower}_save')
@@ -0,0 +1,54 @@
+import gzip
+import json
+import os
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from admindashboard.models import ActivityLog
+
+
+class Command(BaseCommand):
+    help = 'Moves activity log entries older than --days into gzipped monthly archive files'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=getattr(settings, 'ACTIVITY_LOG_RETENTION_DAYS', 90))
+        parser.add_argument('--dir', default=getattr(settings, 'ACTIVITY_LOG_ARCHIVE_DIR', None))
+        parser.add_argument('--batch', type=int, default=1000)
+
+    def archive_path(self, directory, timestamp):
+        return os.path.join(directory, f'activity-{timestamp:%Y-%m}.jsonl.gz')
+
+    def handle(self, *args, **options):
+        directory = options['dir']
+        os.makedirs(directory, exist_ok=True)
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        old = ActivityLog.objects.filter(timestamp__lt=cutoff).order_by('timestamp', 'id')
+
+        archived = 0
+        while True:
+            batch = list(old.values(
+                'id', 'user_id', 'user__username', 'action', 'details', 'ip_address', 'timestamp',
+            )[:options['batch']])
+            if not batch:
+                break
+
+            # Appending gzip members keeps every monthly file a valid .gz.
+            # Rows are written before they are deleted, so an interrupted
+            # run can duplicate lines but never lose them.
+            by_month = {}
+            for row in batch:
+                by_month.setdefault(self.archive_path(directory, row['timestamp']), []).append(row)
+            for path, rows in by_month.items():
+                with gzip.open(path, 'at', encoding='utf-8') as archive:
+                    for row in rows:
+                        archive.write(json.dumps({**row, 'timestamp': row['timestamp'].isoformat()}) + '\n')
+
+            with transaction.atomic():
+                ActivityLog.objects.filter(pk__in=[row['id'] for row in batch]).delete()
+            archived += len(batch)
+
+        self.stdout.write(self.style.SUCCESS(f'Successfully archived {archived} activity log entries to {directory}'))
@@ -0,0 +1,143 @@
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connections, transaction
+from django.db.models import F
+import os
+import random
+import tempfile
+import threading
+import time
+
+from admindashboard.models import ActivityLog, News, UserProfile
+from keralatechreach.database import postgres_database, sqlite_database
+
+ALIAS = 'benchmark'
+PROFILES = ('sqlite-default', 'sqlite-tuned', 'postgres')
+
+
+class Command(BaseCommand):
+    help = 'Compares read/write throughput of the SQLite (plain and tuned) and PostgreSQL configurations'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--profile', action='append', dest='profiles', choices=PROFILES,
+            help='Configuration to benchmark (repeatable). Defaults to both SQLite profiles, '
+                 'plus postgres when DB_ENGINE=postgres',
+        )
+        parser.add_argument('--seconds', type=float, default=5.0, help='Duration of each run')
+        parser.add_argument('--readers', type=int, default=4)
+        parser.add_argument('--writers', type=int, default=2)
+        parser.add_argument('--rows', type=int, default=500, help='News rows to seed')
+
+    def database(self, profile, directory):
+        if profile == 'postgres':
+            database = postgres_database(os.environ, conn_max_age=0)
+            database['OPTIONS'].pop('pool', None)
+            return database
+        database = sqlite_database(
+            os.path.join(directory, f'{profile}.sqlite3'), tuned=profile == 'sqlite-tuned', conn_max_age=0,
+        )
+        # A file, not the in-memory default, so threads share one database
+        database['TEST'] = {'NAME': database['NAME']}
+        return database
+
+    def seed(self, rows):
+        user = User(username='benchmark')
+        User.objects.using(ALIAS).bulk_create([user])
+        user = User.objects.using(ALIAS).get(username='benchmark')
+        profile = UserProfile(user=user, email='benchmark@example.com')
+        UserProfile.objects.using(ALIAS).bulk_create([profile])
+        profile = UserProfile.objects.using(ALIAS).get(user=user)
+        # bulk_create skips the post_save handlers, so only the database is measured
+        News.objects.using(ALIAS).bulk_create(
+            News(title=f'News {i}', slug=f'news-{i}', content='x' * 2000, is_published=True, created_by=profile)
+            for i in range(rows)
+        )
+        return user.pk, list(News.objects.using(ALIAS).values_list('pk', flat=True))
+
+    def read(self, news_ids):
+        list(News.objects.using(ALIAS).filter(is_published=True).order_by('-created_at')[:20])
+        News.objects.using(ALIAS).get(pk=random.choice(news_ids))
+
+    def write(self, user_id, news_ids):
+        with transaction.atomic(using=ALIAS):
+            News.objects.using(ALIAS).filter(pk=random.choice(news_ids)).update(views_count=F('views_count') + 1)
+            ActivityLog.objects.using(ALIAS).bulk_create([ActivityLog(user_id=user_id, action='benchmark')])
+
+    def worker(self, operation, stop, counts, key):
+        done = errors = 0
+        try:
+            while not stop.is_set():
+                try:
+                    operation()
+                    done += 1
+                except OperationalError:
+                    # "database is locked" once busy_timeout (or the driver timeout) runs out
+                    errors += 1
+        finally:
+            connections[ALIAS].close()
+            counts[key].append((done, errors))
+
+    def run(self, user_id, news_ids, options):
+        stop = threading.Event()
+        counts = {'read': [], 'write': []}
+        threads = [
+            threading.Thread(target=self.worker, args=(lambda: self.read(news_ids), stop, counts, 'read'))
+            for _ in range(options['readers'])
+        ] + [
+            threading.Thread(target=self.worker, args=(lambda: self.write(user_id, news_ids), stop, counts, 'write'))
+            for _ in range(options['writers'])
+        ]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        time.sleep(options['seconds'])
+        stop.set()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        return {
+            key: (sum(done for done, _ in results) / elapsed, sum(errors for _, errors in results))
+            for key, results in counts.items()
+        }
+
+    def benchmark(self, profile, directory, options):
+        # configure_settings fills in the defaults; it insists on a 'default' key
+        database = connections.configure_settings({'default': self.database(profile, directory)})['default']
+        connections.settings[ALIAS] = settings.DATABASES[ALIAS] = database
+        creation = connections[ALIAS].creation
+        creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            user_id, news_ids = self.seed(options['rows'])
+            return self.run(user_id, news_ids, options)
+        finally:
+            creation.destroy_test_db(connections[ALIAS].settings_dict['NAME'], verbosity=0)
+            del connections[ALIAS]
+            del connections.settings[ALIAS]
+            settings.DATABASES.pop(ALIAS, None)
+
+    def handle(self, *args, **options):
+        profiles = options['profiles'] or [
+            'sqlite-default', 'sqlite-tuned', *(['postgres'] if os.environ.get('DB_ENGINE') == 'postgres' else []),
+        ]
+        if 'postgres' in profiles:
+            try:
+                import psycopg  # noqa: F401
+            except ImportError:
+                raise CommandError('The postgres profile needs psycopg: pip install "psycopg[binary]"')
+
+        with tempfile.TemporaryDirectory() as directory:
+            for profile in profiles:
+                result = self.benchmark(profile, directory, options)
+                reads, read_errors = result['read']
+                writes, write_errors = result['write']
+                self.stdout.write(
+                    f'{profile:<15} reads {reads:10.1f}/s  writes {writes:9.1f}/s  '
+                    f'lock errors {read_errors + write_errors}'
+                )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Ran {options['readers']} readers and {options['writers']} writers "
+            f"for {options['seconds']:g}s per profile"
+        ))
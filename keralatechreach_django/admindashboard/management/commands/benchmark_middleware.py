@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+import time
+
+from admindashboard.middleware import SecurityMiddleware
+
+# Large enough that the benchmark never trips the limiter
+UNLIMITED_RULES = [{'prefix': '/', 'anon': 10 ** 9, 'user': 10 ** 9, 'period': 60}]
+
+
+class Command(BaseCommand):
+    help = 'Measures the per-request overhead of SecurityMiddleware'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20000)
+        parser.add_argument(
+            '--path', action='append', dest='paths',
+            help='Request path to benchmark (repeatable). Defaults to /, /api/news/ and /media/x.pdf',
+        )
+
+    def time_per_request(self, handler, request, iterations):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            handler(request)
+        return (time.perf_counter() - start) / iterations * 1e6
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        paths = options['paths'] or ['/', '/api/news/', '/media/x.pdf']
+        factory = RequestFactory()
+
+        def view(request):
+            return HttpResponse('ok')
+
+        with override_settings(RATE_LIMIT_RULES=UNLIMITED_RULES):
+            middleware = SecurityMiddleware(view)
+            for path in paths:
+                request = factory.get(path)
+                baseline = self.time_per_request(view, request, iterations)
+                wrapped = self.time_per_request(middleware, request, iterations)
+                self.stdout.write(
+                    f'{path:<20} view {baseline:8.2f} us  with middleware {wrapped:8.2f} us  '
+                    f'overhead {wrapped - baseline:8.2f} us/request'
+                )
+
+        self.stdout.write(self.style.SUCCESS(f'Ran {iterations} iterations per path'))
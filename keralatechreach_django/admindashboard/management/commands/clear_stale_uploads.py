@@ -0,0 +1,24 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from admindashboard.models import ChunkedUpload
+from api.uploads import discard_chunks
+
+
+class Command(BaseCommand):
+    help = 'Deletes chunked uploads that have not received data for a while'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--hours', type=int, default=24)
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(hours=options['hours'])
+        stale = ChunkedUpload.objects.filter(updated_at__lt=cutoff)
+        count = 0
+        for upload in stale:
+            discard_chunks(upload)
+            upload.delete()
+            count += 1
+        self.stdout.write(self.style.SUCCESS(f'Successfully removed {count} stale uploads'))
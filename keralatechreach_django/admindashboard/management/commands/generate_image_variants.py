@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from admindashboard.images import IMAGE_FIELDS
+from admindashboard.task_queue import enqueue
+
+
+class Command(BaseCommand):
+    help = 'Queues variant generation for every stored image (run once after deploying, or after changing IMAGE_VARIANT_WIDTHS)'
+
+    def handle(self, *args, **options):
+        queued = 0
+        for model, fields in IMAGE_FIELDS.items():
+            for field in fields:
+                names = model.objects.exclude(**{field: ''}).exclude(**{f'{field}__isnull': True}).values_list(field, flat=True)
+                for name in names.distinct().iterator():
+                    enqueue('generate_image_variants', path=name)
+                    queued += 1
+        self.stdout.write(self.style.SUCCESS(f'Successfully queued variants for {queued} images'))
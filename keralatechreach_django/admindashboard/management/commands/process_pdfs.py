@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.http import Http404
+
+from admindashboard import pdfs
+
+
+class Command(BaseCommand):
+    help = 'Linearizes question paper and note PDFs and records their page count, size and preview'
+
+    def add_arguments(self, parser):
+        parser.add_argument('kinds', nargs='*', help=f"Subset of: {', '.join(pdfs.PDF_FIELDS)}")
+        parser.add_argument('--all', action='store_true', help='Reprocess files that were already processed')
+
+    def handle(self, *args, **options):
+        if pdfs.pikepdf is None:
+            raise CommandError('pikepdf is not installed')
+        kinds = options['kinds'] or list(pdfs.PDF_FIELDS)
+        unknown = set(kinds) - set(pdfs.PDF_FIELDS)
+        if unknown:
+            raise CommandError(f"Unknown kinds: {', '.join(sorted(unknown))}")
+
+        processed = skipped = 0
+        for kind in kinds:
+            model, field = pdfs.PDF_FIELDS[kind]
+            objects = model.objects.exclude(**{field: ''}).exclude(**{f'{field}__isnull': True})
+            if not options['all']:
+                objects = objects.filter(processed_at__isnull=True)
+            for obj in objects.order_by('pk').iterator():
+                try:
+                    done = pdfs.process(obj)
+                except Http404:
+                    done = False
+                if done:
+                    processed += 1
+                else:
+                    skipped += 1
+                    self.stdout.write(f'Skipped {kind} #{obj.pk} ({getattr(obj, field).name})')
+
+        self.stdout.write(self.style.SUCCESS(f'Successfully processed {processed} PDFs ({skipped} skipped)'))
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand, CommandError
+from admindashboard.search import SEARCHABLE, rebuild_index
+
+class Command(BaseCommand):
+    help = 'Rebuilds the full-text search documents (run after bulk updates that skip signals)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('kinds', nargs='*', help=f"Subset of: {', '.join(SEARCHABLE)}")
+
+    def handle(self, *args, **options):
+        kinds = options['kinds']
+        unknown = set(kinds) - set(SEARCHABLE)
+        if unknown:
+            raise CommandError(f"Unknown kinds: {', '.join(sorted(unknown))}")
+
+        indexed = rebuild_index(kinds)
+        self.stdout.write(self.style.SUCCESS(f'Successfully indexed {indexed} objects'))
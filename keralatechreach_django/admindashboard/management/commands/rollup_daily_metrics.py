@@ -0,0 +1,19 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand
+
+from admindashboard.metrics import METRIC_SOURCES, rollup
+
+
+class Command(BaseCommand):
+    help = 'Aggregates the days not yet in DailyContentMetrics (up to yesterday by default)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--until', type=date.fromisoformat, help='Last day to roll up (YYYY-MM-DD)')
+        parser.add_argument('--kind', action='append', choices=sorted(METRIC_SOURCES), dest='kinds')
+
+    def handle(self, *args, **options):
+        written = rollup(until=options['until'], kinds=options['kinds'])
+        for kind, rows in written.items():
+            self.stdout.write(f'{kind}: {rows} days')
+        self.stdout.write(self.style.SUCCESS(f'Successfully rolled up {sum(written.values())} daily metric rows'))
@@ -0,0 +1,26 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from admindashboard.task_queue import run_pending
+
+
+class Command(BaseCommand):
+    help = 'Runs queued background tasks (verification emails etc.)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Run the due tasks once and exit')
+        parser.add_argument('--batch', type=int, default=50, help='Tasks claimed per poll')
+        parser.add_argument('--sleep', type=float, default=2, help='Seconds to wait when the queue is empty')
+
+    def handle(self, *args, **options):
+        while True:
+            succeeded, failed = run_pending(options['batch'])
+            if succeeded or failed:
+                self.stdout.write(f'Ran {succeeded + failed} tasks ({failed} failed)')
+            if options['once']:
+                break
+            if not succeeded and not failed:
+                time.sleep(options['sleep'])
+
+        self.stdout.write(self.style.SUCCESS('Successfully ran queued tasks'))
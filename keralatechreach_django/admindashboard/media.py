@@ -0,0 +1,170 @@
+"""
+Delivery of uploaded media (question paper and note PDFs, images).
+
+serve_media answers MEDIA_URL requests in every environment, with:
+
+- HTTP Range support (a single byte range, with If-Range), so viewers can
+  fetch the first pages of a large PDF and interrupted downloads resume;
+- strong ETags and Last-Modified, answering If-None-Match and
+  If-Modified-Since with 304;
+- long Cache-Control lifetimes: files under files/ are named by their
+  SHA-256 (see api.uploads.blob_name) and never change, so they are marked
+  immutable.
+
+With MEDIA_SENDFILE set to 'x-accel-redirect' (nginx) or 'x-sendfile'
+(Apache, lighttpd) the view only checks the request and hands the file
+back to the front proxy, which then does the byte copying and the ranges.
+"""
+import mimetypes
+import os
+import re
+from email.utils import formatdate
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseNotModified, StreamingHttpResponse
+from django.utils._os import safe_join
+from django.utils.http import parse_http_date_safe
+from django.views.decorators.http import require_safe
+
+BLOCK_SIZE = 64 * 1024
+
+CONTENT_ADDRESSED = re.compile(r'^files/[0-9a-f]{2}/(?P<sha256>[0-9a-f]{64})(\.\w+)?$')
+RANGE = re.compile(r'^bytes=(?P<start>\d*)-(?P<end>\d*)$')
+
+
+def media_path(name):
+    """Absolute path of the media file `name`; Http404 if it is missing or outside MEDIA_ROOT."""
+    try:
+        path = safe_join(settings.MEDIA_ROOT, name)
+    except SuspiciousFileOperation:
+        raise Http404('Not found')
+    if not os.path.isfile(path):
+        raise Http404('Not found')
+    return path
+
+
+def etag(name, stat):
+    match = CONTENT_ADDRESSED.match(name)
+    if match:
+        return f'"{match.group("sha256")}"'
+    return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+
+def parse_range(header, size):
+    """
+    (start, end) of a single `bytes=` range, end inclusive; None when the
+    header should be ignored (absent, malformed, several ranges) and
+    'unsatisfiable' when it starts past the end of the file.
+    """
+    match = RANGE.match(header.replace(' ', '')) if header else None
+    if not match or (not match['start'] and not match['end']):
+        return None
+    if not match['start']:
+        # bytes=-N: the last N bytes
+        length = int(match['end'])
+        if length == 0:
+            return 'unsatisfiable'
+        return max(size - length, 0), size - 1
+    start = int(match['start'])
+    if start >= size:
+        return 'unsatisfiable'
+    end = int(match['end']) if match['end'] else size - 1
+    if end < start:
+        return None
+    return start, min(end, size - 1)
+
+
+def not_modified(request, tag, mtime):
+    if_none_match = request.headers.get('If-None-Match')
+    if if_none_match is not None:
+        return if_none_match.strip() == '*' or tag in [value.strip() for value in if_none_match.split(',')]
+    since = parse_http_date_safe(request.headers.get('If-Modified-Since', ''))
+    return since is not None and int(mtime) <= since
+
+
+def range_applies(request, tag, mtime):
+    """If-Range: only honour Range when the client's copy is still current."""
+    if_range = request.headers.get('If-Range')
+    if not if_range:
+        return True
+    if if_range.startswith('"'):
+        return if_range == tag
+    since = parse_http_date_safe(if_range)
+    return since is not None and int(mtime) <= since
+
+
+def read_range(path, start, length):
+    with open(path, 'rb') as source:
+        source.seek(start)
+        while length > 0:
+            block = source.read(min(BLOCK_SIZE, length))
+            if not block:
+                break
+            length -= len(block)
+            yield block
+
+
+def cache_control(name):
+    if CONTENT_ADDRESSED.match(name):
+        return 'public, max-age=31536000, immutable'
+    return f"public, max-age={getattr(settings, 'MEDIA_CACHE_MAX_AGE', 86400)}"
+
+
+def sendfile_response(name, path):
+    mode = getattr(settings, 'MEDIA_SENDFILE', None)
+    if mode == 'x-accel-redirect':
+        response = HttpResponse()
+        response['X-Accel-Redirect'] = getattr(settings, 'MEDIA_ACCEL_REDIRECT_PREFIX', '/protected-media/') + name
+    elif mode == 'x-sendfile':
+        response = HttpResponse()
+        response['X-Sendfile'] = path
+    else:
+        return None
+    # Let the proxy fill in the length and type from the file
+    del response['Content-Type']
+    return response
+
+
+def file_response(request, path, size, tag, mtime):
+    """The whole file, or the requested range of it."""
+    byte_range = None
+    if range_applies(request, tag, mtime):
+        byte_range = parse_range(request.headers.get('Range'), size)
+
+    if byte_range == 'unsatisfiable':
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{size}'
+        return response
+    if byte_range is None:
+        # FileResponse lets the WSGI server use sendfile() for the body
+        return FileResponse(open(path, 'rb'))
+
+    start, end = byte_range
+    response = StreamingHttpResponse(
+        read_range(path, start, end - start + 1), status=206,
+        content_type=mimetypes.guess_type(path)[0] or 'application/octet-stream',
+    )
+    response['Content-Range'] = f'bytes {start}-{end}/{size}'
+    response['Content-Length'] = str(end - start + 1)
+    return response
+
+
+@require_safe
+def serve_media(request, path):
+    path_on_disk = media_path(path)
+    stat = os.stat(path_on_disk)
+    tag = etag(path, stat)
+
+    if not_modified(request, tag, stat.st_mtime):
+        response = HttpResponseNotModified()
+    else:
+        response = sendfile_response(path, path_on_disk) or file_response(
+            request, path_on_disk, stat.st_size, tag, stat.st_mtime,
+        )
+
+    response['ETag'] = tag
+    response['Last-Modified'] = formatdate(stat.st_mtime, usegmt=True)
+    response['Cache-Control'] = cache_control(path)
+    response['Accept-Ranges'] = 'bytes'
+    return response
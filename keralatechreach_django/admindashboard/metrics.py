@@ -0,0 +1,128 @@
+"""
+Daily content metrics for the dashboard trend charts.
+
+rollup() turns the content tables into one DailyContentMetrics row per
+(day, kind): how many rows were created (uploads for notes and question
+papers, registrations for users), how many of those are published, and
+the views recorded since the previous rollup. Each run only aggregates
+the days after the last one already stored, with one GROUP BY query per
+kind, so the rollup_daily_metrics command can run as often as wanted and
+the charts read a few hundred small rows instead of the content tables.
+
+views_count is a running total without history, so views are measured as
+the difference between the current sum and the previous rollup's
+views_total and credited to the last day rolled up.
+"""
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Count, Max, Min, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import News, Event, QuestionPaper, Note, DailyContentMetrics
+
+
+class MetricSource:
+    """Where one kind's daily numbers come from."""
+
+    def __init__(self, model, timestamp, published=None, views=None):
+        self.model = model
+        self.timestamp = timestamp
+        self.published = published
+        self.views = views
+
+
+METRIC_SOURCES = {
+    'news': MetricSource(News, 'created_at', Q(is_published=True), 'views_count'),
+    'event': MetricSource(Event, 'created_at', Q(is_published=True), 'views_count'),
+    'question_paper': MetricSource(QuestionPaper, 'created_at', Q(is_published=True), 'views_count'),
+    'note': MetricSource(Note, 'uploaded_at', Q(is_published=True), 'views_count'),
+    'user': MetricSource(User, 'date_joined', Q(is_active=True)),
+}
+
+
+def _first_day(source):
+    first = source.model.objects.aggregate(first=Min(source.timestamp))['first']
+    return timezone.localdate(first) if first else None
+
+
+def _daily_counts(source, start, until):
+    """{day: (created, published)} for the days in [start, until] with any rows."""
+    aggregates = {'created': Count('pk')}
+    if source.published is not None:
+        aggregates['published'] = Count('pk', filter=source.published)
+    rows = (
+        source.model.objects
+        .filter(**{f'{source.timestamp}__date__gte': start, f'{source.timestamp}__date__lte': until})
+        .annotate(day=TruncDate(source.timestamp))
+        .order_by()
+        .values('day')
+        .annotate(**aggregates)
+    )
+    return {row['day']: (row['created'], row.get('published', 0)) for row in rows}
+
+
+def rollup_kind(kind, until):
+    """Store the missing days of `kind` up to and including `until`. Returns the number of rows written."""
+    source = METRIC_SOURCES[kind]
+    last = DailyContentMetrics.objects.filter(kind=kind).order_by('-day').first()
+    start = last.day + timedelta(days=1) if last else _first_day(source) or until
+    if start > until:
+        return 0
+
+    counts = _daily_counts(source, start, until)
+
+    views_total = previous_total = last.views_total if last else 0
+    if source.views:
+        views_total = source.model.objects.aggregate(total=Sum(source.views))['total'] or 0
+        if last is None:
+            # No earlier snapshot to measure against
+            previous_total = views_total
+
+    rows = []
+    day = start
+    while day <= until:
+        created, published = counts.get(day, (0, 0))
+        rows.append(DailyContentMetrics(
+            day=day, kind=kind, created=created, published=published,
+            views=max(views_total - previous_total, 0) if day == until else 0,
+            views_total=views_total if day == until else previous_total,
+        ))
+        day += timedelta(days=1)
+
+    with transaction.atomic():
+        DailyContentMetrics.objects.bulk_create(rows)
+    return len(rows)
+
+
+def rollup(until=None, kinds=None):
+    """
+    Roll every kind (or `kinds`) up to `until`, by default yesterday: the
+    current day is still changing. Returns {kind: rows written}.
+    """
+    until = until or timezone.localdate() - timedelta(days=1)
+    return {kind: rollup_kind(kind, until) for kind in kinds or METRIC_SOURCES}
+
+
+def trends(days=30, kinds=None):
+    """
+    Chart data for the last `days` rolled-up days:
+    {'labels': [day, ...], 'created': {kind: [...]}, 'views': {kind: [...]}}.
+    """
+    kinds = list(kinds or METRIC_SOURCES)
+    last_day = DailyContentMetrics.objects.aggregate(last=Max('day'))['last']
+    if last_day is None:
+        return {'labels': [], 'created': {}, 'views': {}}
+
+    labels = [last_day - timedelta(days=offset) for offset in range(days - 1, -1, -1)]
+    position = {day: i for i, day in enumerate(labels)}
+    created = {kind: [0] * days for kind in kinds}
+    views = {kind: [0] * days for kind in kinds}
+    for row in DailyContentMetrics.objects.filter(kind__in=kinds, day__gte=labels[0]).values(
+        'day', 'kind', 'created', 'views'
+    ):
+        created[row['kind']][position[row['day']]] = row['created']
+        views[row['kind']][position[row['day']]] = row['views']
+    return {'labels': [day.isoformat() for day in labels], 'created': created, 'views': views}
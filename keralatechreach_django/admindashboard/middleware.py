@@ -1,80 +1,199 @@
-from django.core.cache import cache
-from django.http import HttpResponseForbidden
+from django.core.cache import caches
+from django.http import HttpResponse, HttpResponseForbidden
 from django.conf import settings
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
 import time
 
+# Default budgets, matched by longest path prefix. "anon" applies per client
+# IP, "user" per authenticated user; both are requests per "period" seconds.
+DEFAULT_RATE_LIMIT_RULES = [
+    {'prefix': '/', 'anon': 100, 'user': 300, 'period': 60},
+]
+
+# Every third-party origin a template loads from: Bootstrap and flatpickr
+# (jsdelivr), TinyMCE, highlight.js and Font Awesome (cdnjs), the Font
+# Awesome kit (kit / ka-f.fontawesome.com), GitHub buttons, Google Fonts and
+# the Google Maps embed on the contact page.
+DEFAULT_CSP_POLICIES = [
+    "default-src 'self'",
+    "script-src 'self' 'unsafe-inline' 'unsafe-eval' https://cdn.jsdelivr.net https://cdnjs.cloudflare.com "
+    "https://kit.fontawesome.com https://buttons.github.io",
+    "style-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net https://cdnjs.cloudflare.com "
+    "https://fonts.googleapis.com https://ka-f.fontawesome.com",
+    "font-src 'self' data: https://fonts.gstatic.com https://cdnjs.cloudflare.com https://ka-f.fontawesome.com",
+    "img-src 'self' data: blob: https:",
+    "connect-src 'self' https://ka-f.fontawesome.com https://api.github.com",
+    "frame-src 'self' https://www.google.com",
+    "object-src 'none'",
+    "base-uri 'self'",
+    "form-action 'self'",
+]
+
+DEFAULT_SECURITY_HEADERS = {
+    'X-Content-Type-Options': 'nosniff',
+    'X-Frame-Options': 'DENY',
+    'X-XSS-Protection': '1; mode=block',
+    'Strict-Transport-Security': 'max-age=31536000; includeSubDomains',
+    'Referrer-Policy': 'strict-origin-when-cross-origin',
+    'Permissions-Policy': 'geolocation=(), microphone=(), camera=()',
+}
+
+# Per-path changes to the header block; a value of None drops the header.
+# JSON is never rendered as HTML, so the API skips the CSP. Uploaded files
+# are user content: if one is opened as a document it may show images and
+# inline styles but never run scripts, load anything else or submit forms.
+# (No `sandbox`: Chromium's PDF viewer refuses to render sandboxed PDFs.)
+MEDIA_CSP_POLICIES = [
+    "default-src 'none'",
+    "img-src 'self' data:",
+    "style-src 'unsafe-inline'",
+    "form-action 'none'",
+    "base-uri 'none'",
+]
+
+DEFAULT_SECURITY_HEADER_OVERRIDES = {
+    '/api/': {'Content-Security-Policy': None},
+    '/media/': {'Content-Security-Policy': '; '.join(MEDIA_CSP_POLICIES)},
+}
+
+def get_client_ip(request):
+    """
+    REMOTE_ADDR, or with TRUSTED_PROXY_COUNT proxies in front of the app the
+    address the outermost trusted proxy saw. Entries left of that in
+    X-Forwarded-For come from the client and can be anything.
+    """
+    proxies = getattr(settings, 'TRUSTED_PROXY_COUNT', 0)
+    forwarded = [ip.strip() for ip in request.META.get('HTTP_X_FORWARDED_FOR', '').split(',') if ip.strip()]
+    if proxies and len(forwarded) >= proxies:
+        return forwarded[-proxies]
+    return request.META.get('REMOTE_ADDR')
+
+
 class SecurityMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
+        self.rate_limit_cache = caches[getattr(settings, 'RATE_LIMIT_CACHE', 'default')]
+        self.rate_limit_rules = sorted(
+            getattr(settings, 'RATE_LIMIT_RULES', DEFAULT_RATE_LIMIT_RULES),
+            key=lambda rule: len(rule['prefix']),
+            reverse=True,
+        )
+        self.header_blocks = self.build_header_blocks()
+        self.jwt_authentication = JWTAuthentication()
 
     def __call__(self, request):
         # Rate limiting
         if not request.path.startswith('/static/') and not request.path.startswith('/media/'):
-            ip = self.get_client_ip(request)
-            if self.is_rate_limited(ip):
-                return HttpResponseForbidden('Too many requests. Please try again later.')
+            retry_after = self.is_rate_limited(request)
+            if retry_after:
+                response = HttpResponse('Too many requests. Please try again later.', status=429)
+                response['Retry-After'] = str(retry_after)
+                return response
 
         response = self.get_response(request)
 
         # Add security headers
-        response['X-Content-Type-Options'] = 'nosniff'
-        response['X-Frame-Options'] = 'DENY'
-        response['X-XSS-Protection'] = '1; mode=block'
-        response['Strict-Transport-Security'] = 'max-age=31536000; includeSubDomains'
-        response['Content-Security-Policy'] = self.get_csp_policy()
-        response['Referrer-Policy'] = 'strict-origin-when-cross-origin'
-        response['Permissions-Policy'] = 'geolocation=(), microphone=(), camera=()'
+        for header, value in self.get_security_headers(request.path):
+            response[header] = value
 
         return response
 
-    def get_client_ip(self, request):
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            ip = x_forwarded_for.split(',')[0]
+    def build_header_blocks(self):
+        """
+        Build the security headers once per process: a default block plus one
+        block per overridden path prefix, longest prefix first.
+        """
+        headers = dict(getattr(settings, 'SECURITY_HEADERS', DEFAULT_SECURITY_HEADERS))
+        headers['Content-Security-Policy'] = self.get_csp_policy()
+        overrides = getattr(settings, 'SECURITY_HEADER_OVERRIDES', DEFAULT_SECURITY_HEADER_OVERRIDES)
+
+        blocks = []
+        for prefix in sorted(overrides, key=len, reverse=True):
+            block = dict(headers)
+            for header, value in overrides[prefix].items():
+                if value is None:
+                    block.pop(header, None)
+                else:
+                    block[header] = value
+            blocks.append((prefix, tuple(block.items())))
+        blocks.append(('', tuple(headers.items())))
+        return blocks
+
+    def get_security_headers(self, path):
+        for prefix, headers in self.header_blocks:
+            if path.startswith(prefix):
+                return headers
+        return ()
+
+    def get_token_user_id(self, request):
+        """
+        The user id in a valid JWT bearer token. DRF authenticates API
+        requests inside the view, after this middleware, so request.user is
+        still anonymous for them. Checks the signature and expiry only; no
+        query.
+        """
+        header = self.jwt_authentication.get_header(request)
+        if header is None:
+            return None
+        try:
+            raw_token = self.jwt_authentication.get_raw_token(header)
+            if raw_token is None:
+                return None
+            return self.jwt_authentication.get_validated_token(raw_token).get(jwt_settings.USER_ID_CLAIM)
+        except AuthenticationFailed:
+            # Malformed or expired: the view will reject it; budget it by IP
+            return None
+
+    def get_rate_limit_rule(self, path):
+        for rule in self.rate_limit_rules:
+            if path.startswith(rule['prefix']):
+                return rule
+        return None
+
+    def is_rate_limited(self, request):
+        """
+        Sliding-window counter: one atomic incr on the current fixed window,
+        with the previous window's count weighted by how much of it still
+        overlaps the sliding window. Returns the seconds to wait when the
+        budget is spent, otherwise 0.
+        """
+        rule = self.get_rate_limit_rule(request.path)
+        if rule is None:
+            return 0
+
+        user = getattr(request, 'user', None)
+        user_id = user.pk if user is not None and user.is_authenticated else self.get_token_user_id(request)
+        if user_id is not None:
+            identity, limit = f'user:{user_id}', rule['user']
         else:
-            ip = request.META.get('REMOTE_ADDR')
-        return ip
-
-    def is_rate_limited(self, ip):
-        # Rate limit settings
-        RATE_LIMIT = 100  # Number of requests
-        RATE_LIMIT_PERIOD = 60  # Time period in seconds
+            identity, limit = f'ip:{get_client_ip(request)}', rule['anon']
 
-        # Get the current timestamp
+        period = rule['period']
         now = time.time()
-
-        # Create a unique cache key for this IP
-        cache_key = f'rate_limit_{ip}'
-
-        # Get the request history for this IP
-        requests = cache.get(cache_key, [])
-
-        # Remove old requests outside the time window
-        requests = [req_time for req_time in requests if req_time > now - RATE_LIMIT_PERIOD]
-
-        # Add current request
-        requests.append(now)
-
-        # Update the cache
-        cache.set(cache_key, requests, RATE_LIMIT_PERIOD)
-
-        # Check if the number of requests exceeds the limit
-        return len(requests) > RATE_LIMIT
+        window = int(now // period)
+        elapsed = (now % period) / period
+        key_prefix = f"rate_limit:{rule['prefix']}:{identity}"
+        current_key = f'{key_prefix}:{window}'
+
+        cache = self.rate_limit_cache
+        # Keys outlive their window so the next window can still weigh them
+        cache.add(current_key, 0, period * 2)
+        try:
+            current = cache.incr(current_key)
+        except ValueError:
+            # The key expired between add() and incr()
+            cache.set(current_key, 1, period * 2)
+            current = 1
+        previous = cache.get(f'{key_prefix}:{window - 1}', 0)
+
+        if previous * (1 - elapsed) + current > limit:
+            return max(1, int(period * (1 - elapsed)))
+        return 0
 
     def get_csp_policy(self):
-        # Define CSP policy
-        csp_policies = [
-            "default-src 'self'",
-            "script-src 'self' 'unsafe-inline' 'unsafe-eval' https://kit.fontawesome.com https://buttons.github.io",
-            "style-src 'self' 'unsafe-inline' https://fonts.googleapis.com",
-            "font-src 'self' https://fonts.gstatic.com",
-            "img-src 'self' data: https:",
-            "connect-src 'self'",
-            "frame-src 'self'",
-            "object-src 'none'",
-            "base-uri 'self'",
-            "form-action 'self'",
-        ]
+        csp_policies = getattr(settings, 'CONTENT_SECURITY_POLICY', DEFAULT_CSP_POLICIES)
         return "; ".join(csp_policies)
 
 class AdminIPRestrictionMiddleware:
@@ -85,17 +204,9 @@ class AdminIPRestrictionMiddleware:
         # Check if the request is for the admin area
         if request.path.startswith('/admin/') or request.path.startswith('/admindashboard/'):
             ALLOWED_IPS = getattr(settings, 'ADMIN_ALLOWED_IPS', [])
-            ip = self.get_client_ip(request)
+            ip = get_client_ip(request)
             
             if ALLOWED_IPS and ip not in ALLOWED_IPS:
                 return HttpResponseForbidden('Access denied. Your IP is not allowed.')
 
-        return self.get_response(request)
-
-    def get_client_ip(self, request):
-        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-        if x_forwarded_for:
-            ip = x_forwarded_for.split(',')[0]
-        else:
-            ip = request.META.get('REMOTE_ADDR')
-        return ip 
\ No newline at end of file
+        return self.get_response(request) 
\ No newline at end of file
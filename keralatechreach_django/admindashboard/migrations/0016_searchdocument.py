@@ -0,0 +1,86 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:01
+
+from django.db import migrations, models
+
+SQLITE_CREATE = [
+    """
+    CREATE VIRTUAL TABLE admindashboard_searchindex USING fts5(
+        title, body,
+        content='admindashboard_searchdocument', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER admindashboard_searchdocument_ai AFTER INSERT ON admindashboard_searchdocument BEGIN
+        INSERT INTO admindashboard_searchindex(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+    """
+    CREATE TRIGGER admindashboard_searchdocument_ad AFTER DELETE ON admindashboard_searchdocument BEGIN
+        INSERT INTO admindashboard_searchindex(admindashboard_searchindex, rowid, title, body)
+        VALUES ('delete', old.id, old.title, old.body);
+    END
+    """,
+    """
+    CREATE TRIGGER admindashboard_searchdocument_au AFTER UPDATE ON admindashboard_searchdocument BEGIN
+        INSERT INTO admindashboard_searchindex(admindashboard_searchindex, rowid, title, body)
+        VALUES ('delete', old.id, old.title, old.body);
+        INSERT INTO admindashboard_searchindex(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+]
+
+SQLITE_DROP = [
+    'DROP TRIGGER IF EXISTS admindashboard_searchdocument_au',
+    'DROP TRIGGER IF EXISTS admindashboard_searchdocument_ad',
+    'DROP TRIGGER IF EXISTS admindashboard_searchdocument_ai',
+    'DROP TABLE IF EXISTS admindashboard_searchindex',
+]
+
+# Must stay identical to the expression queried in admindashboard.search
+POSTGRES_CREATE = [
+    """
+    CREATE INDEX admindashboard_searchdocument_tsv ON admindashboard_searchdocument USING GIN (
+        (setweight(to_tsvector('simple', title), 'A') || setweight(to_tsvector('simple', body), 'B'))
+    )
+    """,
+]
+
+POSTGRES_DROP = ['DROP INDEX IF EXISTS admindashboard_searchdocument_tsv']
+
+
+def run_for_vendor(statements):
+    def run(apps, schema_editor):
+        for sql in statements.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(sql)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admindashboard', '0015_remove_userprofile_is_active'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(max_length=30)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('title', models.CharField(max_length=255)),
+                ('body', models.TextField(blank=True)),
+                ('is_public', models.BooleanField(default=False)),
+                ('available_until', models.DateTimeField(blank=True, help_text='Hidden from current-only searches after this time', null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'unique_together': {('kind', 'object_id')},
+            },
+        ),
+        migrations.RunPython(
+            run_for_vendor({'sqlite': SQLITE_CREATE, 'postgresql': POSTGRES_CREATE}),
+            reverse_code=run_for_vendor({'sqlite': SQLITE_DROP, 'postgresql': POSTGRES_DROP}),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admindashboard', '0016_searchdocument'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='views_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='note',
+            name='views_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='questionpaper',
+            name='views_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
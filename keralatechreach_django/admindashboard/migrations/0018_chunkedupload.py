@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:07
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admindashboard', '0017_views_count'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChunkedUpload',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('kind', models.CharField(choices=[('question_paper', 'Question Paper'), ('note', 'Note')], max_length=20)),
+                ('filename', models.CharField(max_length=255)),
+                ('size', models.PositiveBigIntegerField(help_text='Total size in bytes')),
+                ('sha256', models.CharField(help_text='Hex SHA-256 of the complete file', max_length=64)),
+                ('received', models.PositiveBigIntegerField(default=0, help_text='Bytes received so far')),
+                ('metadata', models.JSONField(default=dict, help_text='Form fields for the object created on completion')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:02
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def copy_updated_at(apps, schema_editor):
+    # Best available approximation of when existing rows were created
+    for name in ('QuestionPaper', 'Event'):
+        model = apps.get_model('admindashboard', name)
+        model.objects.using(schema_editor.connection.alias).update(created_at=models.F('updated_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admindashboard', '0021_activitylog_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='questionpaper',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.RunPython(copy_updated_at, migrations.RunPython.noop),
+        migrations.CreateModel(
+            name='DailyContentMetrics',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('kind', models.CharField(max_length=30)),
+                ('created', models.PositiveIntegerField(default=0, help_text='Rows created that day: uploads for notes and question papers, registrations for users')),
+                ('published', models.PositiveIntegerField(default=0, help_text='Of those, how many are published')),
+                ('views', models.PositiveIntegerField(default=0, help_text='Views recorded since the previous rollup')),
+                ('views_total', models.PositiveBigIntegerField(default=0, help_text='Sum of views_count when the day was rolled up')),
+            ],
+            options={
+                'ordering': ['day', 'kind'],
+                'unique_together': {('day', 'kind')},
+            },
+        ),
+    ]
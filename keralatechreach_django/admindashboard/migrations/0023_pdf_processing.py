@@ -0,0 +1,53 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admindashboard', '0022_daily_content_metrics'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='note',
+            name='file_size',
+            field=models.PositiveBigIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='note',
+            name='page_count',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='note',
+            name='preview',
+            field=models.ImageField(blank=True, editable=False, help_text='First page, rendered by admindashboard.pdfs', null=True, upload_to='previews/'),
+        ),
+        migrations.AddField(
+            model_name='note',
+            name='processed_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='questionpaper',
+            name='file_size',
+            field=models.PositiveBigIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='questionpaper',
+            name='page_count',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='questionpaper',
+            name='preview',
+            field=models.ImageField(blank=True, editable=False, help_text='First page, rendered by admindashboard.pdfs', null=True, upload_to='previews/'),
+        ),
+        migrations.AddField(
+            model_name='questionpaper',
+            name='processed_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+    ]
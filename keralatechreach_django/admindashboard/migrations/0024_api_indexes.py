@@ -0,0 +1,69 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admindashboard', '0023_pdf_processing'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='entrancenotification',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['-published_date', '-id'], name='entrance_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['-updated_at', '-id'], name='event_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['event_start'], name='event_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='exam',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['-updated_at', '-id'], name='exam_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='exam',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['degree_name', 'semester', 'admission_year', '-updated_at', '-id'], name='exam_course_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='exam',
+            index=models.Index(condition=models.Q(('is_published', True), ('show_on_home', True)), fields=['exam_date'], name='exam_home_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='faq',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['display_order', 'id'], name='faq_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='initiative',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['-updated_at', '-id'], name='initiative_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['-updated_at', '-id'], name='job_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['-created_at', '-id'], name='news_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='note',
+            index=models.Index(fields=['-uploaded_at', '-id'], name='note_uploaded_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='note',
+            index=models.Index(fields=['degree', 'semester', 'year', '-uploaded_at', '-id'], name='note_course_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='questionpaper',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['-updated_at', '-id'], name='questionpaper_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='questionpaper',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['degree', 'semester', 'year', '-updated_at', '-id'], name='questionpaper_course_idx'),
+        ),
+    ]
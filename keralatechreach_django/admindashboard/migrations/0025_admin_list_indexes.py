@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admindashboard', '0024_api_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['event_start', 'id'], name='event_admin_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['name', 'id'], name='event_admin_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(fields=['created_at', 'id'], name='news_admin_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(fields=['title', 'id'], name='news_admin_title_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='questionpaper',
+            index=models.Index(fields=['updated_at', 'id'], name='questionpaper_admin_upd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='questionpaper',
+            index=models.Index(fields=['subject', 'id'], name='questionpaper_admin_subj_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+from django.db import migrations
+
+
+def index_existing(apps, schema_editor):
+    # Same code path as `manage.py rebuild_search_index`, so content saved
+    # before 0016 is searchable as soon as the deploy has migrated
+    from admindashboard.search import rebuild_index
+    rebuild_index(apps=apps)
+
+
+def clear_index(apps, schema_editor):
+    apps.get_model('admindashboard', 'SearchDocument').objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admindashboard', '0025_admin_list_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(index_existing, reverse_code=clear_index),
+    ]
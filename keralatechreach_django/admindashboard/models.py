@@ -1,5 +1,7 @@
 # api/models.py
 
+import uuid
+
 from django.db import models
 from django.db.models.signals import post_save
 from django.dispatch import receiver
@@ -14,9 +16,30 @@ class QuestionPaper(models.Model):
     file_path = models.FileField(upload_to='question_papers/', blank=True, null=True)
     year = models.PositiveIntegerField()
     university_id = models.ForeignKey('University', on_delete=models.CASCADE)
+    created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     is_published = models.BooleanField(default=False)
     created_by = models.ForeignKey('UserProfile', on_delete=models.CASCADE)
+    views_count = models.PositiveIntegerField(default=0)
+    page_count = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    file_size = models.PositiveBigIntegerField(null=True, blank=True, editable=False)
+    preview = models.ImageField(upload_to='previews/', blank=True, null=True, editable=False, help_text="First page, rendered by admindashboard.pdfs")
+    processed_at = models.DateTimeField(null=True, blank=True, editable=False)
+
+    class Meta:
+        # The API lists published papers newest first, narrowed by course
+        # (degree, then semester, then year). Partial, so drafts cost nothing.
+        # The admin table lists drafts too and sorts by update time or subject.
+        indexes = [
+            models.Index(fields=['-updated_at', '-id'], condition=models.Q(is_published=True), name='questionpaper_published_idx'),
+            models.Index(
+                fields=['degree', 'semester', 'year', '-updated_at', '-id'],
+                condition=models.Q(is_published=True), name='questionpaper_course_idx',
+            ),
+            models.Index(fields=['updated_at', 'id'], name='questionpaper_admin_upd_idx'),
+            models.Index(fields=['subject', 'id'], name='questionpaper_admin_subj_idx'),
+        ]
+
     def __str__(self):
         return f"{self.degree} | Sem {self.semester} | {self.subject} ({self.year})"
     
@@ -47,6 +70,19 @@ class Exam(models.Model):
     created_by = models.ForeignKey('UserProfile', on_delete=models.CASCADE)
     show_on_home = models.BooleanField(default=False, help_text="Display this exam on the home page")
 
+    class Meta:
+        # Same shape as QuestionPaper, plus the home page's next featured exams
+        indexes = [
+            models.Index(fields=['-updated_at', '-id'], condition=models.Q(is_published=True), name='exam_published_idx'),
+            models.Index(
+                fields=['degree_name', 'semester', 'admission_year', '-updated_at', '-id'],
+                condition=models.Q(is_published=True), name='exam_course_idx',
+            ),
+            models.Index(
+                fields=['exam_date'], condition=models.Q(is_published=True, show_on_home=True), name='exam_home_idx',
+            ),
+        ]
+
 
 class Job(models.Model):
     title = models.CharField(max_length=255)
@@ -55,6 +91,12 @@ class Job(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     is_published = models.BooleanField(default=False)
     created_by = models.ForeignKey('UserProfile', on_delete=models.CASCADE)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-updated_at', '-id'], condition=models.Q(is_published=True), name='job_published_idx'),
+        ]
+
     def __str__(self):
         return self.title
 
@@ -74,6 +116,12 @@ class Initiative(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     is_published = models.BooleanField(default=False)
     created_by = models.ForeignKey('UserProfile', on_delete=models.CASCADE)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-updated_at', '-id'], condition=models.Q(is_published=True), name='initiative_published_idx'),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -93,9 +141,22 @@ class Event(models.Model):
     map_link = models.URLField(blank=True, null=True)
     district = models.ForeignKey(District, on_delete=models.SET_NULL, null=True, blank=True)
     category = models.ForeignKey(EventCategory, on_delete=models.SET_NULL, null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     is_published = models.BooleanField(default=False)
     created_by = models.ForeignKey('UserProfile', on_delete=models.CASCADE)
+    views_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        # Newest first, and upcoming events by start (also the ?event_start= filter);
+        # the admin table sorts every event by start or name
+        indexes = [
+            models.Index(fields=['-updated_at', '-id'], condition=models.Q(is_published=True), name='event_published_idx'),
+            models.Index(fields=['event_start'], condition=models.Q(is_published=True), name='event_start_idx'),
+            models.Index(fields=['event_start', 'id'], name='event_admin_start_idx'),
+            models.Index(fields=['name', 'id'], name='event_admin_name_idx'),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -124,25 +185,55 @@ class News(models.Model):
     class Meta:
         verbose_name_plural = 'News'
         ordering = ['-created_at']
+        # Published news for the API; every row by date or title for the admin table
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], condition=models.Q(is_published=True), name='news_published_idx'),
+            models.Index(fields=['created_at', 'id'], name='news_admin_created_idx'),
+            models.Index(fields=['title', 'id'], name='news_admin_title_idx'),
+        ]
     
     def __str__(self):
         return self.title
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def has_changed(self, field):
+        """True if `field` differs from the value loaded from the database (always for new rows)."""
+        loaded = getattr(self, '_loaded_values', None)
+        if loaded is None:
+            return True
+        if field in self.get_deferred_fields():
+            return False
+        return getattr(self, field) != loaded.get(field)
+
+    def unique_slug(self, base_slug):
+        """Lowest free `base_slug[-n]`, resolved with a single prefix query."""
+        taken = set(
+            News.objects.filter(slug__startswith=base_slug).exclude(pk=self.pk).values_list('slug', flat=True)
+        )
+        slug = base_slug
+        counter = 1
+        while slug in taken:
+            slug = f"{base_slug}-{counter}"
+            counter += 1
+        return slug
+
     def save(self, *args, **kwargs):
+        # Derived fields are only recomputed when their source fields changed
         # Generate slug if not provided
         if not self.slug:
-            base_slug = slugify(self.title)
-            slug = base_slug
-            counter = 1
-            # Check if slug exists and generate a unique one
-            while News.objects.filter(slug=slug).exclude(pk=self.pk).exists():
-                slug = f"{base_slug}-{counter}"
-                counter += 1
-            self.slug = slug
+            # slugify() drops every non-ASCII character, so a Malayalam title
+            # yields '' (and a prefix query over the whole table)
+            self.slug = self.unique_slug(slugify(self.title) or 'news')
         
         # Calculate reading time
-        words = len(self.content.split())
-        self.reading_time = max(1, int(words / 200))  # Assuming 200 words per minute reading speed
+        if self.has_changed('content'):
+            words = len(self.content.split())
+            self.reading_time = max(1, int(words / 200))  # Assuming 200 words per minute reading speed
         
         # Set meta title and description if not provided
         if not self.meta_title:
@@ -153,6 +244,11 @@ class News(models.Model):
             self.meta_description = self.content[:160]
             
         super().save(*args, **kwargs)
+        self._loaded_values = {
+            field.attname: getattr(self, field.attname)
+            for field in self._meta.concrete_fields
+            if field.attname not in self.get_deferred_fields()
+        }
 
 class ContactMessage(models.Model):
     name = models.CharField(max_length=100)
@@ -224,7 +320,11 @@ def create_user_profile(sender, instance, created, **kwargs):
         )
 
 @receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
+def save_user_profile(sender, instance, update_fields=None, **kwargs):
+    # A login only saves last_login; rewriting the profile would also bump
+    # the API generations of every response that shows an author
+    if update_fields and set(update_fields) <= {'last_login'}:
+        return
     if hasattr(instance, 'userprofile'):
         instance.userprofile.save()
 
@@ -237,6 +337,12 @@ class ActivityLog(models.Model):
     
     class Meta:
         ordering = ['-timestamp']
+        # Newest-first browsing, optionally narrowed to one user or action
+        indexes = [
+            models.Index(fields=['-timestamp', '-id'], name='activitylog_time_idx'),
+            models.Index(fields=['user', '-timestamp', '-id'], name='activitylog_user_time_idx'),
+            models.Index(fields=['action', '-timestamp', '-id'], name='activitylog_action_time_idx'),
+        ]
         
     def __str__(self):
         return f"{self.user.username} - {self.action} - {self.timestamp}"
@@ -252,6 +358,18 @@ class Note(models.Model):
     uploaded_by = models.ForeignKey('UserProfile', on_delete=models.CASCADE)
     uploaded_at = models.DateTimeField(auto_now_add=True)
     is_published = models.BooleanField(default=False)
+    views_count = models.PositiveIntegerField(default=0)
+    page_count = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    file_size = models.PositiveBigIntegerField(null=True, blank=True, editable=False)
+    preview = models.ImageField(upload_to='previews/', blank=True, null=True, editable=False, help_text="First page, rendered by admindashboard.pdfs")
+    processed_at = models.DateTimeField(null=True, blank=True, editable=False)
+
+    class Meta:
+        # The notes API lists every note, newest upload first
+        indexes = [
+            models.Index(fields=['-uploaded_at', '-id'], name='note_uploaded_idx'),
+            models.Index(fields=['degree', 'semester', 'year', '-uploaded_at', '-id'], name='note_course_idx'),
+        ]
 
     def __str__(self):
         return f"Note: {self.title} ({self.university} - {self.degree} Sem {self.semester})"
@@ -265,6 +383,13 @@ class EntranceNotification(models.Model):
     is_published = models.BooleanField(default=False)
     created_by = models.ForeignKey('UserProfile', on_delete=models.CASCADE)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['-published_date', '-id'], condition=models.Q(is_published=True), name='entrance_published_idx',
+            ),
+        ]
+
     def __str__(self):
         return self.title
 
@@ -337,6 +462,9 @@ class FAQ(models.Model):
 
     class Meta:
         ordering = ['display_order', 'created_at']
+        indexes = [
+            models.Index(fields=['display_order', 'id'], condition=models.Q(is_published=True), name='faq_published_idx'),
+        ]
 
 class ContactUs(models.Model):
     name = models.CharField(max_length=100)
@@ -375,4 +503,111 @@ class AdSettings(models.Model):
         ordering = ['location', '-created_at']
 
     def __str__(self):
-        return f"{self.name} ({self.get_location_display()})"
\ No newline at end of file
+        return f"{self.name} ({self.get_location_display()})"
+
+class SearchDocument(models.Model):
+    """
+    Denormalized searchable text for one published object. Kept current by
+    the signal handlers in admindashboard.search and indexed with FTS5 on
+    SQLite or a tsvector GIN index on PostgreSQL.
+    """
+    kind = models.CharField(max_length=30)
+    object_id = models.PositiveBigIntegerField()
+    title = models.CharField(max_length=255)
+    body = models.TextField(blank=True)
+    is_public = models.BooleanField(default=False)
+    available_until = models.DateTimeField(blank=True, null=True, help_text="Hidden from current-only searches after this time")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('kind', 'object_id')
+
+    def __str__(self):
+        return f"{self.kind}:{self.object_id} {self.title}"
+
+class ChunkedUpload(models.Model):
+    """
+    A resumable upload in progress. Chunks are written to a temporary file
+    (api.uploads.chunk_path); the QuestionPaper or Note is created from it
+    on completion.
+    """
+    KIND_CHOICES = [
+        ('question_paper', 'Question Paper'),
+        ('note', 'Note'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    filename = models.CharField(max_length=255)
+    size = models.PositiveBigIntegerField(help_text="Total size in bytes")
+    sha256 = models.CharField(max_length=64, help_text="Hex SHA-256 of the complete file")
+    received = models.PositiveBigIntegerField(default=0, help_text="Bytes received so far")
+    metadata = models.JSONField(default=dict, help_text="Form fields for the object created on completion")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.filename} ({self.received}/{self.size})"
+
+class FileBlob(models.Model):
+    """
+    One stored copy of an uploaded file, addressed by its SHA-256. Every
+    QuestionPaper.file_path / Note.file pointing at `name` holds one
+    reference; the file is deleted with the last one (api.uploads).
+    """
+    sha256 = models.CharField(max_length=64, unique=True)
+    name = models.CharField(max_length=255, help_text="Path in default storage")
+    size = models.PositiveBigIntegerField()
+    ref_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.sha256[:12]} ({self.ref_count} refs)"
+
+class QueuedTask(models.Model):
+    """A unit of background work for the run_tasks worker (admindashboard.task_queue)."""
+    task = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict)
+    attempts = models.PositiveIntegerField(default=0)
+    run_at = models.DateTimeField(default=timezone.now, help_text="Not picked up before this time")
+    locked_until = models.DateTimeField(blank=True, null=True, help_text="Claimed by a worker until this time")
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [models.Index(fields=['run_at'])]
+
+    def __str__(self):
+        return f"{self.task} #{self.pk} (attempt {self.attempts})"
+
+class FailedTask(models.Model):
+    """Dead letter: a QueuedTask that used up its attempts."""
+    task = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict)
+    attempts = models.PositiveIntegerField()
+    error = models.TextField()
+    created_at = models.DateTimeField()
+    failed_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.task} failed after {self.attempts} attempts"
+
+class DailyContentMetrics(models.Model):
+    """
+    Per-day totals for one kind of content, written by the
+    rollup_daily_metrics command (admindashboard.metrics) so trend charts
+    never scan the content tables.
+    """
+    day = models.DateField()
+    kind = models.CharField(max_length=30)
+    created = models.PositiveIntegerField(default=0, help_text="Rows created that day: uploads for notes and question papers, registrations for users")
+    published = models.PositiveIntegerField(default=0, help_text="Of those, how many are published")
+    views = models.PositiveIntegerField(default=0, help_text="Views recorded since the previous rollup")
+    views_total = models.PositiveBigIntegerField(default=0, help_text="Sum of views_count when the day was rolled up")
+
+    class Meta:
+        unique_together = ('day', 'kind')
+        ordering = ['day', 'kind']
+
+    def __str__(self):
+        return f"{self.day} {self.kind}"
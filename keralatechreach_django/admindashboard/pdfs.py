@@ -0,0 +1,194 @@
+"""
+Post-upload processing of question paper and note PDFs.
+
+When a QuestionPaper or Note gets a new file, the process_pdf task (run by
+the task queue, off the request path):
+
+- records page_count and file_size on the object;
+- rewrites the PDF linearized ("fast web view") with pikepdf, so a viewer
+  fetching byte ranges (admindashboard.media) can show page 1 before the
+  rest arrives;
+- renders the first page to a JPEG preview with poppler's pdftoppm.
+
+Content-addressed files (files/xx/<sha256>.pdf, see api.uploads) are
+immutable once served, so a linearized copy is stored under its own hash;
+the FileBlob keeps the hash of the original upload for de-duplication and
+every object referencing it moves to the new name (a queryset update, so
+the API cache generations of both models are bumped by hand). Other files
+are rewritten in place.
+
+pikepdf and pdftoppm are optional: without pikepdf nothing is processed,
+without pdftoppm there is no preview. `manage.py process_pdfs` processes
+the files uploaded before either was installed.
+"""
+import hashlib
+import io
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import post_init, post_save
+from django.utils import timezone
+from PIL import Image
+
+from api.cache import bump_generation
+
+from .media import CONTENT_ADDRESSED, media_path
+from .models import QuestionPaper, Note, FileBlob
+from .task_queue import enqueue
+
+try:
+    import pikepdf
+except ImportError:
+    pikepdf = None
+
+logger = logging.getLogger(__name__)
+
+# kind -> (model, file field)
+PDF_FIELDS = {
+    'question_paper': (QuestionPaper, 'file_path'),
+    'note': (Note, 'file'),
+}
+
+KIND_BY_MODEL = {model: kind for kind, (model, _) in PDF_FIELDS.items()}
+
+PROCESSED_FIELDS = ['page_count', 'file_size', 'preview', 'processed_at']
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as source:
+        for block in iter(lambda: source.read(64 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def linearize(path):
+    """
+    Linearize the PDF at `path` into a temporary file next to it. Returns
+    (page_count, temporary path or None when it already was linearized).
+    """
+    with pikepdf.open(path) as pdf:
+        page_count = len(pdf.pages)
+        if pdf.is_linearized:
+            return page_count, None
+        fd, temporary = tempfile.mkstemp(suffix='.pdf', dir=os.path.dirname(path))
+        os.close(fd)
+        pdf.save(temporary, linearize=True)
+    return page_count, temporary
+
+
+def render_preview(path):
+    """JPEG bytes of the first page, or None when pdftoppm is unavailable or fails."""
+    pdftoppm = getattr(settings, 'PDFTOPPM', None) or shutil.which('pdftoppm')
+    if not pdftoppm:
+        return None
+    with tempfile.TemporaryDirectory() as directory:
+        prefix = os.path.join(directory, 'preview')
+        try:
+            subprocess.run(
+                [pdftoppm, '-f', '1', '-l', '1', '-singlefile', '-png',
+                 '-scale-to', str(getattr(settings, 'PDF_PREVIEW_WIDTH', 640)), path, prefix],
+                check=True, capture_output=True, timeout=60,
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.warning('Could not render a preview of %s: %s', path, e)
+            return None
+        output = io.BytesIO()
+        with Image.open(f'{prefix}.png') as page:
+            page.convert('RGB').save(output, 'JPEG', quality=80, optimize=True)
+        return output.getvalue()
+
+
+def _move_blob(old_name, temporary):
+    """Store the linearized `temporary` under its own hash and repoint everything at it."""
+    sha256 = _sha256(temporary)
+    new_name = f'files/{sha256[:2]}/{sha256}{os.path.splitext(old_name)[1]}'
+    destination = os.path.join(settings.MEDIA_ROOT, new_name)
+    os.makedirs(os.path.dirname(destination), exist_ok=True)
+    os.replace(temporary, destination)
+
+    with transaction.atomic():
+        blob = FileBlob.objects.select_for_update().filter(name=old_name).first()
+        existing = FileBlob.objects.filter(name=new_name).exclude(pk=getattr(blob, 'pk', None)).first()
+        if blob is not None and existing is not None:
+            # The linearized bytes were uploaded on their own before: merge the references
+            FileBlob.objects.filter(pk=existing.pk).update(ref_count=F('ref_count') + blob.ref_count)
+            blob.delete()
+        elif blob is not None:
+            blob.name, blob.size = new_name, os.path.getsize(destination)
+            blob.save(update_fields=['name', 'size'])
+        for model, field in PDF_FIELDS.values():
+            model.objects.filter(**{field: old_name}).update(**{field: new_name})
+    # update() sends no post_save, and a note and a paper can share the blob
+    for model, _ in PDF_FIELDS.values():
+        bump_generation(model)
+    os.remove(media_path(old_name))
+    return new_name
+
+
+def process(obj):
+    """Process the PDF of a QuestionPaper or Note. Returns False when it could not be."""
+    kind = KIND_BY_MODEL[type(obj)]
+    model, field = PDF_FIELDS[kind]
+    name = getattr(obj, field).name
+    if not name or pikepdf is None:
+        return False
+    path = media_path(name)
+
+    try:
+        page_count, temporary = linearize(path)
+    except pikepdf.PdfError as e:
+        logger.warning('Not processing %s #%s, %s is not a readable PDF: %s', model.__name__, obj.pk, name, e)
+        return False
+
+    if temporary is not None:
+        if CONTENT_ADDRESSED.match(name):
+            name = _move_blob(name, temporary)
+        else:
+            os.replace(temporary, path)
+        setattr(obj, field, name)
+        path = media_path(name)
+
+    obj.page_count = page_count
+    obj.file_size = os.path.getsize(path)
+    preview = render_preview(path)
+    if preview is not None:
+        if obj.preview:
+            obj.preview.delete(save=False)
+        obj.preview.save(f'{kind}-{obj.pk}.jpg', ContentFile(preview), save=False)
+    obj.processed_at = timezone.now()
+    # update_fields skips auto_now, and tells queue_processing this is not a new upload
+    obj.save(update_fields=[field, *PROCESSED_FIELDS])
+    return True
+
+
+def _file_name(sender, instance):
+    # The raw attribute: a deferred file field must not cost a query
+    value = instance.__dict__.get(PDF_FIELDS[KIND_BY_MODEL[sender]][1])
+    return getattr(value, 'name', value) or ''
+
+
+def remember_file(sender, instance, **kwargs):
+    instance._pdf_name = _file_name(sender, instance)
+
+
+def queue_processing(sender, instance, created=False, raw=False, update_fields=None, **kwargs):
+    """Process newly uploaded files in the background."""
+    if raw or (update_fields and 'processed_at' in update_fields):
+        return
+    name = _file_name(sender, instance)
+    if name and (created or name != getattr(instance, '_pdf_name', None)):
+        enqueue('process_pdf', kind=KIND_BY_MODEL[sender], pk=instance.pk)
+    instance._pdf_name = name
+
+
+for _kind, (_model, _) in PDF_FIELDS.items():
+    post_init.connect(remember_file, sender=_model, dispatch_uid=f'pdf_{_kind}_init')
+    post_save.connect(queue_processing, sender=_model, dispatch_uid=f'pdf_{_kind}_save')
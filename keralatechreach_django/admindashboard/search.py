@@ -0,0 +1,327 @@
+"""
+Full-text search over published content.
+
+Every searchable object has one SearchDocument row, refreshed by the
+post_save / post_delete handlers below (migration 0026 indexed the rows
+that predate them). The text is indexed by an FTS5 table on SQLite and by
+a tsvector GIN index on PostgreSQL (see migration 0016); other backends
+fall back to icontains over SearchDocument. Queries match every word as a
+prefix and are ranked title-first.
+"""
+import datetime
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+
+from .models import (
+    News, Event, Exam, Note, QuestionPaper, Initiative, EntranceNotification,
+    SearchDocument,
+)
+
+
+def _end_of_day(day):
+    return timezone.make_aware(datetime.datetime.combine(day, datetime.time.max))
+
+
+class Searchable:
+    """How one model is turned into a SearchDocument."""
+
+    def __init__(self, model, title, body, available_until=None, related=()):
+        self.model = model
+        self.title = title
+        self.body = body
+        self.available_until = available_until
+        self.related = related
+
+    def queryset(self):
+        return self.model.objects.select_related(*self.related)
+
+
+SEARCHABLE = {
+    'news': Searchable(
+        News,
+        title=lambda o: o.title,
+        body=lambda o: ' '.join([o.excerpt, o.keywords, o.content]),
+        related=('created_by__user',),
+    ),
+    'event': Searchable(
+        Event,
+        title=lambda o: o.name,
+        body=lambda o: ' '.join([o.place, o.description or '']),
+        available_until=lambda o: o.event_start,
+        related=('category', 'district'),
+    ),
+    'exam': Searchable(
+        Exam,
+        title=lambda o: o.exam_name,
+        body=lambda o: f'{o.degree_name.name} {o.university.name} semester {o.semester}',
+        available_until=lambda o: _end_of_day(o.exam_date),
+        related=('degree_name', 'university'),
+    ),
+    'note': Searchable(
+        Note,
+        title=lambda o: o.title,
+        body=lambda o: f'{o.subject} {o.degree.name} {o.university.name}',
+        related=('degree', 'university'),
+    ),
+    'question_paper': Searchable(
+        QuestionPaper,
+        title=lambda o: o.subject,
+        body=lambda o: f'{o.degree.name} {o.university_id.name} {o.year}',
+        related=('degree', 'university_id'),
+    ),
+    'initiative': Searchable(
+        Initiative,
+        title=lambda o: o.name,
+        body=lambda o: o.description,
+    ),
+    'entrance_notification': Searchable(
+        EntranceNotification,
+        title=lambda o: o.title,
+        body=lambda o: o.description or '',
+        available_until=lambda o: _end_of_day(o.deadline),
+    ),
+}
+
+KIND_BY_MODEL = {searchable.model: kind for kind, searchable in SEARCHABLE.items()}
+
+
+# Indexing
+
+def _document_fields(searchable, instance):
+    return {
+        'title': searchable.title(instance)[:255],
+        'body': searchable.body(instance),
+        'is_public': instance.is_published,
+        'available_until': searchable.available_until(instance) if searchable.available_until else None,
+    }
+
+
+def index_object(instance):
+    kind = KIND_BY_MODEL[type(instance)]
+    SearchDocument.objects.update_or_create(
+        kind=kind, object_id=instance.pk, defaults=_document_fields(SEARCHABLE[kind], instance),
+    )
+
+
+def remove_object(instance):
+    SearchDocument.objects.filter(kind=KIND_BY_MODEL[type(instance)], object_id=instance.pk).delete()
+
+
+def rebuild_index(kinds=None, apps=None):
+    """
+    Re-create the documents for `kinds` (default: all). Returns the number indexed.
+
+    A data migration passes its historical `apps` so the rows are read
+    through the models as they were at that migration.
+    """
+    documents = apps.get_model('admindashboard', 'SearchDocument') if apps else SearchDocument
+    indexed = 0
+    for kind in kinds or SEARCHABLE:
+        searchable = SEARCHABLE[kind]
+        model = apps.get_model(searchable.model._meta.label) if apps else searchable.model
+        documents.objects.filter(kind=kind).delete()
+        created = documents.objects.bulk_create(
+            (
+                documents(kind=kind, object_id=instance.pk, **_document_fields(searchable, instance))
+                for instance in model.objects.select_related(*searchable.related).iterator()
+            ),
+            batch_size=500,
+        )
+        indexed += len(created)
+    return indexed
+
+
+def _on_save(sender, instance, raw=False, **kwargs):
+    if not raw:
+        index_object(instance)
+
+
+def _on_delete(sender, instance, **kwargs):
+    remove_object(instance)
+
+
+for _kind, _searchable in SEARCHABLE.items():
+    post_save.connect(_on_save, sender=_searchable.model, dispatch_uid=f'search_index_{_kind}_save')
+    post_delete.connect(_on_delete, sender=_searchable.model, dispatch_uid=f'search_index_{_kind}_delete')
+
+
+# Querying
+
+def tokenize(query):
+    return re.findall(r'\w+', query.lower())
+
+
+def _filters(kinds, current_only):
+    """SQL conditions on the SearchDocument table aliased as d."""
+    clauses, params = ['d.is_public'], []
+    if kinds:
+        clauses.append('d.kind IN (%s)' % ', '.join(['%s'] * len(kinds)))
+        params.extend(kinds)
+    if current_only:
+        clauses.append('(d.available_until IS NULL OR d.available_until >= %s)')
+        params.append(connection.ops.adapt_datetimefield_value(timezone.now()))
+    return clauses, params
+
+
+def _sqlite_match(terms, kinds, current_only):
+    match = ' '.join(f'"{term}"*' for term in terms)
+    clauses, params = _filters(kinds, current_only)
+    sql = f"""
+        FROM admindashboard_searchindex
+        JOIN admindashboard_searchdocument d ON d.id = admindashboard_searchindex.rowid
+        WHERE admindashboard_searchindex MATCH %s AND {' AND '.join(clauses)}
+    """
+    return '-bm25(admindashboard_searchindex, 10.0, 1.0)', sql, [match, *params]
+
+
+POSTGRES_VECTOR = "(setweight(to_tsvector('simple', d.title), 'A') || setweight(to_tsvector('simple', d.body), 'B'))"
+
+
+def _postgres_match(terms, kinds, current_only):
+    tsquery = ' & '.join(f'{term}:*' for term in terms)
+    clauses, params = _filters(kinds, current_only)
+    sql = f"""
+        FROM admindashboard_searchdocument d, to_tsquery('simple', %s) query
+        WHERE {POSTGRES_VECTOR} @@ query AND {' AND '.join(clauses)}
+    """
+    return f'ts_rank({POSTGRES_VECTOR}, query)', sql, [tsquery, *params]
+
+
+BACKENDS = {
+    'sqlite': _sqlite_match,
+    'postgresql': _postgres_match,
+}
+
+
+def _fallback_documents(terms, kinds, current_only):
+    documents = SearchDocument.objects.filter(is_public=True)
+    if kinds:
+        documents = documents.filter(kind__in=kinds)
+    if current_only:
+        documents = documents.filter(Q(available_until__isnull=True) | Q(available_until__gte=timezone.now()))
+    for term in terms:
+        documents = documents.filter(Q(title__icontains=term) | Q(body__icontains=term))
+    return documents
+
+
+def search(query, kinds=None, current_only=False, limit=20, offset=0):
+    """
+    Return up to `limit` ranked (kind, object_id, score) hits for `query`.
+
+    `kinds` restricts the result to some SEARCHABLE keys; `current_only`
+    drops events, exams and notifications whose date has passed.
+    """
+    terms = tokenize(query)
+    if not terms:
+        return []
+    kinds = list(kinds or [])
+    backend = BACKENDS.get(connection.vendor)
+    if backend is None:
+        rows = _fallback_documents(terms, kinds, current_only).order_by('-updated_at').values_list(
+            'kind', 'object_id'
+        )[offset:offset + limit]
+        return [(kind, object_id, 0.0) for kind, object_id in rows]
+
+    score, sql, params = backend(terms, kinds, current_only)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'SELECT d.kind, d.object_id, {score} AS score {sql} ORDER BY score DESC LIMIT %s OFFSET %s',
+            [*params, limit, offset],
+        )
+        return cursor.fetchall()
+
+
+def count(query, kinds=None, current_only=False, cap=100):
+    """
+    Count the hits for `query`, stopping at cap + 1.
+
+    The inner LIMIT keeps a broad query from counting the whole index; a
+    result above `cap` means "more than cap".
+    """
+    terms = tokenize(query)
+    if not terms:
+        return 0
+    kinds = list(kinds or [])
+    backend = BACKENDS.get(connection.vendor)
+    if backend is None:
+        return _fallback_documents(terms, kinds, current_only)[:cap + 1].count()
+
+    _, sql, params = backend(terms, kinds, current_only)
+    with connection.cursor() as cursor:
+        cursor.execute(f'SELECT COUNT(*) FROM (SELECT 1 {sql} LIMIT %s) capped', [*params, cap + 1])
+        return cursor.fetchone()[0]
+
+
+_pool = (0, None)  # (SEARCH_WORKERS it was built for, executor)
+_pool_lock = threading.Lock()
+
+
+def _executor(workers):
+    """The process-wide search pool, rebuilt only if SEARCH_WORKERS changes."""
+    global _pool
+    with _pool_lock:
+        size, pool = _pool
+        if size != workers:
+            if pool is not None:
+                pool.shutdown(wait=False)
+            pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='search')
+            _pool = (workers, pool)
+        return pool
+
+
+def _in_worker(func, *args, **kwargs):
+    try:
+        return func(*args, **kwargs)
+    finally:
+        # Each pool thread keeps its connection like a request thread would:
+        # reused until CONN_MAX_AGE, dropped if it is broken
+        connection.close_if_unusable_or_obsolete()
+
+
+def search_by_kind(query, kinds, current_only=False, limit=5, cap=100):
+    """
+    Run search() and count() for every kind.
+
+    Returns {kind: (hits, count)}. With SEARCH_WORKERS > 1 the sub-queries
+    run concurrently on a process-wide thread pool whose threads keep their
+    database connections, so the latency is that of the slowest query
+    rather than the sum. They run on the calling thread when there is one
+    worker (the SQLite default: its queries are short and serialise on the
+    file anyway) or inside an atomic block, where another connection could
+    not see the uncommitted rows.
+    """
+    workers = getattr(settings, 'SEARCH_WORKERS', 5)
+    if workers <= 1 or connection.in_atomic_block:
+        return {
+            kind: (search(query, [kind], current_only, limit), count(query, [kind], current_only, cap))
+            for kind in kinds
+        }
+
+    pool = _executor(workers)
+    hits = {kind: pool.submit(_in_worker, search, query, [kind], current_only, limit) for kind in kinds}
+    counts = {kind: pool.submit(_in_worker, count, query, [kind], current_only, cap) for kind in kinds}
+    return {kind: (hits[kind].result(), counts[kind].result()) for kind in kinds}
+
+
+def load_objects(hits):
+    """Turn search() hits into [(kind, object, score)], keeping rank order."""
+    ids_by_kind = {}
+    for kind, object_id, score in hits:
+        ids_by_kind.setdefault(kind, []).append(object_id)
+    objects = {
+        (kind, obj.pk): obj
+        for kind, ids in ids_by_kind.items()
+        for obj in SEARCHABLE[kind].queryset().filter(pk__in=ids)
+    }
+    return [
+        (kind, objects[(kind, object_id)], score)
+        for kind, object_id, score in hits
+        if (kind, object_id) in objects
+    ]
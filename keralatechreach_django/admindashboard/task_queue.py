@@ -0,0 +1,114 @@
+"""
+Database-backed background task queue.
+
+Functions decorated with @task are run by the run_tasks management command
+instead of inside the request:
+
+    @task
+    def send_welcome_email(user_id):
+        ...
+
+    enqueue('send_welcome_email', user_id=user.id)
+
+Tasks are modules named ``tasks`` in installed apps. A worker claims a row
+by setting locked_until with a conditional UPDATE, so several workers can
+share the table. Failures are retried after TASK_RETRY_DELAY * 2 ** attempts
+seconds; after TASK_MAX_ATTEMPTS the row is moved to FailedTask. With
+TASK_QUEUE_EAGER = True tasks run immediately on enqueue (tests, local dev).
+"""
+import logging
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.module_loading import autodiscover_modules
+
+from .models import QueuedTask, FailedTask
+
+logger = logging.getLogger(__name__)
+
+TASKS = {}
+
+
+def task(func):
+    """Register `func` under its name."""
+    TASKS[func.__name__] = func
+    return func
+
+
+def enqueue(name, delay=0, **payload):
+    """Queue task `name` with JSON-serializable keyword arguments."""
+    if name not in TASKS:
+        autodiscover_modules('tasks')
+    if name not in TASKS:
+        raise KeyError(f'Unknown task: {name}')
+    if getattr(settings, 'TASK_QUEUE_EAGER', False):
+        TASKS[name](**payload)
+        return None
+    return QueuedTask.objects.create(
+        task=name, payload=payload, run_at=timezone.now() + timedelta(seconds=delay),
+    )
+
+
+def claim(limit):
+    """Lock up to `limit` due tasks for this worker and return them."""
+    now = timezone.now()
+    lease = timedelta(seconds=getattr(settings, 'TASK_LEASE_SECONDS', 300))
+    due = QueuedTask.objects.filter(
+        Q(locked_until__isnull=True) | Q(locked_until__lt=now), run_at__lte=now,
+    ).order_by('run_at')[:limit]
+
+    claimed = []
+    for queued in due:
+        # Only one worker's UPDATE can match the lock value it read
+        if QueuedTask.objects.filter(pk=queued.pk, locked_until=queued.locked_until).update(locked_until=now + lease):
+            claimed.append(queued)
+    return claimed
+
+
+def execute(queued):
+    func = TASKS.get(queued.task)
+    try:
+        if func is None:
+            raise KeyError(f'Unknown task: {queued.task}')
+        func(**queued.payload)
+    except Exception:
+        fail(queued, traceback.format_exc())
+        return False
+    queued.delete()
+    return True
+
+
+def fail(queued, error):
+    queued.attempts += 1
+    if queued.attempts >= getattr(settings, 'TASK_MAX_ATTEMPTS', 5):
+        logger.error('Task %s #%s failed permanently: %s', queued.task, queued.pk, error)
+        with transaction.atomic():
+            FailedTask.objects.create(
+                task=queued.task, payload=queued.payload, attempts=queued.attempts,
+                error=error, created_at=queued.created_at,
+            )
+            queued.delete()
+        return
+
+    delay = getattr(settings, 'TASK_RETRY_DELAY', 30) * 2 ** (queued.attempts - 1)
+    logger.warning('Task %s #%s failed, retrying in %ss', queued.task, queued.pk, delay)
+    queued.run_at = timezone.now() + timedelta(seconds=delay)
+    queued.locked_until = None
+    queued.last_error = error
+    queued.save(update_fields=['attempts', 'run_at', 'locked_until', 'last_error'])
+
+
+def run_pending(limit=50):
+    """Run the tasks that are due. Returns (succeeded, failed)."""
+    autodiscover_modules('tasks')
+    succeeded = failed = 0
+    for queued in claim(limit):
+        if execute(queued):
+            succeeded += 1
+        else:
+            failed += 1
+    return succeeded, failed
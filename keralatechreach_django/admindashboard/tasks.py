@@ -0,0 +1,30 @@
+import logging
+
+from django.http import Http404
+from PIL import Image
+
+from .images import generate_variants
+from .pdfs import PDF_FIELDS, process
+from .task_queue import task
+
+logger = logging.getLogger(__name__)
+
+
+@task
+def generate_image_variants(path):
+    try:
+        generate_variants(path)
+    except (Http404, OSError, Image.DecompressionBombError) as e:
+        # Missing or unreadable: retrying would not help
+        logger.warning('Not generating variants for %s: %s', path, e)
+
+
+@task
+def process_pdf(kind, pk):
+    obj = PDF_FIELDS[kind][0].objects.filter(pk=pk).first()
+    if obj is None:
+        return
+    try:
+        process(obj)
+    except Http404:
+        logger.warning('Not processing %s #%s: its file is missing', kind, pk)
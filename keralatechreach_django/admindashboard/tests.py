@@ -1,3 +1,608 @@
-from django.test import TestCase
+import gzip
+import hashlib
+import io
+import json
+import os
+import re
+import shutil
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from PIL import Image
+from rest_framework_simplejwt.tokens import AccessToken
+
+from api import uploads
+from api.cache import get_generations
+from keralatechreach.database import database_from_env
+
+from . import activity_buffer, images, metrics, middleware, pdfs, task_queue
+from .models import (
+    News, ActivityLog, DailyContentMetrics, QueuedTask, University, Degree, Note, QuestionPaper, FileBlob,
+)
+from .views.activity_log import log_activity
+
+
+class NewsSaveTests(TestCase):
+    def setUp(self):
+        self.profile = User.objects.create_user('author', 'author@example.com', 'x').userprofile
+
+    def create(self, **fields):
+        fields.setdefault('content', 'word ' * 400)
+        return News.objects.create(created_by=self.profile, **fields)
+
+    def test_slug_collisions_resolved_with_one_query(self):
+        self.assertEqual(self.create(title='Exam results').slug, 'exam-results')
+        self.assertEqual(self.create(title='Exam results').slug, 'exam-results-1')
+        self.create(title='Exam results', slug='exam-results-3')
+
+        news = News(title='Exam results', content='x', created_by=self.profile)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(news.unique_slug('exam-results'), 'exam-results-2')
+        self.assertEqual(len(queries), 1)
+
+    def test_non_ascii_title_gets_a_fallback_slug(self):
+        self.create(title='Exam results')
+        self.assertEqual(self.create(title='പരീക്ഷാ ഫലം').slug, 'news')
+        self.assertEqual(self.create(title='പരീക്ഷാ ഫലം').slug, 'news-1')
+
+    def test_reading_time_only_recomputed_when_content_changes(self):
+        news = News.objects.get(pk=self.create(title='Long read').pk)
+        self.assertEqual(news.reading_time, 2)
+
+        news.reading_time = 7  # set by hand; survives saves that leave content alone
+        news.title = 'Renamed'
+        news.save()
+        self.assertFalse(news.has_changed('title'))
+        self.assertEqual(News.objects.get(pk=news.pk).reading_time, 7)
+
+        news.content = 'word ' * 1000
+        news.save()
+        self.assertEqual(News.objects.get(pk=news.pk).reading_time, 5)
+
+
+@override_settings(ACTIVITY_LOG_BATCH_SIZE=3, ACTIVITY_LOG_FLUSH_INTERVAL=3600)
+class ActivityLogBufferTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('staff', 'staff@example.com', 'x')
+        self.addCleanup(activity_buffer.buffer.take)
+
+    def test_entries_are_written_in_one_batch(self):
+        log_activity(self.user, 'Created News')
+        log_activity(self.user, 'Updated News')
+        self.assertFalse(ActivityLog.objects.exists())
+
+        with CaptureQueriesContext(connection) as queries:
+            log_activity(self.user, 'Deleted News')
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(
+            list(ActivityLog.objects.order_by('pk').values_list('action', flat=True)),
+            ['Created News', 'Updated News', 'Deleted News'],
+        )
+
+    def test_flush_writes_a_partial_batch(self):
+        log_activity(self.user, 'Created News')
+        self.assertEqual(activity_buffer.flush(), 1)
+        self.assertEqual(ActivityLog.objects.count(), 1)
+        self.assertEqual(activity_buffer.flush(), 0)
+
+    @override_settings(ACTIVITY_LOG_SYNC=True)
+    def test_sync_mode_saves_each_entry(self):
+        log_activity(self.user, 'Created News')
+        self.assertEqual(ActivityLog.objects.count(), 1)
+        self.assertIsNone(activity_buffer.buffer.timer)
+
+
+class ActivityLogBrowsingTests(TestCase):
+    def setUp(self):
+        self.staff = User.objects.create_user('staff', 'staff@example.com', 'x', is_staff=True)
+        self.editor = User.objects.create_user('editor', 'editor@example.com', 'x')
+        now = timezone.now()
+        ActivityLog.objects.bulk_create([
+            ActivityLog(
+                user=self.staff if i % 2 else self.editor,
+                action='Created News' if i % 3 else 'Deleted News',
+                timestamp=now - timedelta(hours=i),
+            )
+            for i in range(45)
+        ])
+        self.client.force_login(self.staff)
+
+    def page(self, query=''):
+        response = self.client.get('/admindashboard/activity-log/' + query)
+        self.assertEqual(response.status_code, 200)
+        return response.context
+
+    def test_keyset_pages_cover_the_log_once(self):
+        seen = []
+        context = self.page()
+        while True:
+            seen.extend(activity.pk for activity in context['page_obj'])
+            if not context['older_cursor']:
+                break
+            context = self.page('?before=' + context['older_cursor'].replace('+', '%2B'))
+        expected = list(ActivityLog.objects.order_by('-timestamp', '-id').values_list('pk', flat=True))
+        self.assertEqual(seen, expected)
+
+        newer = self.page('?after=' + context['newer_cursor'].replace('+', '%2B'))
+        self.assertEqual([a.pk for a in newer['page_obj']], expected[20:40])
+
+    def test_filters(self):
+        rows = self.page('?user=editor&action=Deleted+News')['page_obj']
+        self.assertTrue(rows)
+        self.assertTrue(all(a.user == self.editor and a.action == 'Deleted News' for a in rows))
+
+    def test_archive_moves_old_rows_to_monthly_files(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        call_command('archive_activity_log', days=1, dir=directory, batch=7, stdout=open(os.devnull, 'w'))
+        self.assertEqual(ActivityLog.objects.count(), 24)  # hours 0-23 stay
+
+        lines = []
+        for name in os.listdir(directory):
+            with gzip.open(os.path.join(directory, name), 'rt') as archive:
+                lines.extend(json.loads(line) for line in archive)
+        self.assertEqual(len(lines), 21)
+        self.assertEqual({line['user__username'] for line in lines}, {'staff', 'editor'})
+
+
+class DashboardStatsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.staff = User.objects.create_user('staff', 'staff@example.com', 'x', is_staff=True)
+        self.client.force_login(self.staff)
+
+    def test_stats_are_cached_and_invalidated_by_saves(self):
+        profile = self.staff.userprofile
+        News.objects.create(title='Draft', content='x', created_by=profile)
+        with CaptureQueriesContext(connection) as cold:
+            context = self.client.get('/admindashboard/').context
+        self.assertEqual((context['total_news'], context['draft_news']), (1, 1))
+
+        # Session and user, then the metrics freshness check and the two
+        # "recent" lists; the counters come from the cache
+        with self.assertNumQueries(5):
+            self.client.get('/admindashboard/')
+        # A miss adds one conditional aggregate per counted table
+        self.assertEqual(len(cold), 5 + 7)
+
+        News.objects.create(title='Live', content='x', created_by=profile, is_published=True)
+        context = self.client.get('/admindashboard/').context
+        self.assertEqual((context['total_news'], context['published_news']), (2, 1))
+
+
+class DailyContentMetricsTests(TestCase):
+    def setUp(self):
+        self.profile = User.objects.create_user('author', 'author@example.com', 'x').userprofile
+        self.today = timezone.localdate()
+
+    def create_news(self, days_ago, **fields):
+        news = News.objects.create(title='Story', content='x', created_by=self.profile, **fields)
+        News.objects.filter(pk=news.pk).update(created_at=timezone.now() - timedelta(days=days_ago))
+        return news
+
+    def test_rollup_only_adds_missing_days(self):
+        self.create_news(3, is_published=True)
+        self.create_news(3)
+        news = self.create_news(1)
+        User.objects.filter(pk=self.profile.user.pk).update(date_joined=timezone.now() - timedelta(days=3))
+
+        self.assertEqual(metrics.rollup(kinds=['news', 'user']), {'news': 3, 'user': 3})
+        rows = {row.day: row for row in DailyContentMetrics.objects.filter(kind='news')}
+        self.assertEqual(
+            [(rows[self.today - timedelta(days=n)].created, rows[self.today - timedelta(days=n)].published) for n in (3, 2, 1)],
+            [(2, 1), (0, 0), (1, 0)],
+        )
+        self.assertEqual(DailyContentMetrics.objects.get(kind='user', day=self.today - timedelta(days=3)).created, 1)
+
+        # A second run has nothing to do; the next day only measures its own views
+        self.assertEqual(metrics.rollup(kinds=['news']), {'news': 0})
+        News.objects.filter(pk=news.pk).update(views_count=7)
+        self.assertEqual(metrics.rollup(until=self.today, kinds=['news']), {'news': 1})
+        latest = DailyContentMetrics.objects.get(kind='news', day=self.today)
+        self.assertEqual((latest.views, latest.views_total), (7, 7))
+
+        chart = metrics.trends(days=4, kinds=['news'])
+        self.assertEqual(chart['labels'][-1], self.today.isoformat())
+        self.assertEqual(chart['created']['news'], [2, 0, 1, 0])
+        self.assertEqual(chart['views']['news'], [0, 0, 0, 7])
+
+
+class AdminListTableTests(TestCase):
+    def setUp(self):
+        self.staff = User.objects.create_user('staff', 'staff@example.com', 'x', is_staff=True)
+        self.client.force_login(self.staff)
+        News.objects.bulk_create([
+            News(title=f'Story {i:02d}', slug=f'story-{i}', content='x', created_by=self.staff.userprofile)
+            for i in range(30)
+        ])
+
+    def test_list_is_paginated_sorted_and_rendered_once(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/admindashboard/news/', {'sort': 'title', 'page': 2})
+        rows = list(response.context['rows'])
+        self.assertEqual([news.title for news in rows], [f'Story {i:02d}' for i in range(25, 30)])
+        self.assertEqual(response.content.decode().count('Story 25'), 1)
+        # The page count and the page itself
+        self.assertLessEqual(len([q for q in queries if 'admindashboard_news' in q['sql']]), 2)
+
+        partial = self.client.get('/admindashboard/news/table/', {'sort': '-title'})
+        self.assertNotContains(partial, '<html')
+        self.assertContains(partial, 'Story 29')
+        self.assertContains(partial, '?sort=title')
+
+    def test_unknown_sort_falls_back_to_default(self):
+        response = self.client.get('/admindashboard/news/', {'sort': 'content'})
+        self.assertEqual(response.context['sort'], '-created')
+        # Columns without an admin index are not sortable
+        self.assertEqual(self.client.get('/admindashboard/news/', {'sort': 'status'}).context['sort'], '-created')
+
+    def test_list_pages_share_the_list_card(self):
+        for url, table_url in [
+            ('/admindashboard/news/', '/admindashboard/news/table/'),
+            ('/admindashboard/events/', '/admindashboard/events/table/'),
+            ('/admindashboard/questions/', '/admindashboard/questions/table/'),
+        ]:
+            response = self.client.get(url)
+            self.assertTemplateUsed(response, 'admindashboard/components/list_card.html')
+            self.assertContains(response, f'data-table-url="{table_url}"')
+
+
+class MediaDeliveryTests(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        override = override_settings(MEDIA_ROOT=self.media_root, MEDIA_SENDFILE=None)
+        override.enable()
+        self.addCleanup(override.disable)
+        self.content = bytes(range(256)) * 40
+        os.makedirs(os.path.join(self.media_root, 'notes'))
+        with open(os.path.join(self.media_root, 'notes', 'syllabus.pdf'), 'wb') as f:
+            f.write(self.content)
+        self.url = '/media/notes/syllabus.pdf'
+
+    def test_full_file_and_conditional_get(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response.streaming_content), self.content)
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertIn('max-age=86400', response['Cache-Control'])
+
+        cached = self.client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(cached.status_code, 304)
+
+    def test_ranges(self):
+        response = self.client.get(self.url, HTTP_RANGE='bytes=100-199')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response['Content-Range'], f'bytes 100-199/{len(self.content)}')
+        self.assertEqual(b''.join(response.streaming_content), self.content[100:200])
+
+        response = self.client.get(self.url, HTTP_RANGE='bytes=-10')
+        self.assertEqual(b''.join(response.streaming_content), self.content[-10:])
+
+        response = self.client.get(self.url, HTTP_RANGE=f'bytes={len(self.content)}-')
+        self.assertEqual(response.status_code, 416)
+
+        # A stale If-Range gets the whole (changed) file instead of a fragment
+        response = self.client.get(self.url, HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE='"stale"')
+        self.assertEqual(response.status_code, 200)
+
+    def test_content_addressed_files_are_immutable(self):
+        sha256 = 'ab' * 32
+        os.makedirs(os.path.join(self.media_root, 'files', 'ab'))
+        with open(os.path.join(self.media_root, 'files', 'ab', f'{sha256}.pdf'), 'wb') as f:
+            f.write(b'%PDF')
+        response = self.client.get(f'/media/files/ab/{sha256}.pdf')
+        self.assertEqual(response['ETag'], f'"{sha256}"')
+        self.assertIn('immutable', response['Cache-Control'])
+
+    def test_proxy_handoff_and_missing_files(self):
+        with override_settings(MEDIA_SENDFILE='x-accel-redirect'):
+            response = self.client.get(self.url)
+        self.assertEqual(response['X-Accel-Redirect'], '/protected-media/notes/syllabus.pdf')
+        self.assertEqual(response.content, b'')
+
+        self.assertEqual(self.client.get('/media/notes/missing.pdf').status_code, 404)
+        self.assertEqual(self.client.get('/media/../settings.py').status_code, 404)
+
+
+@override_settings(IMAGE_VARIANT_WIDTHS=(320, 640))
+class ImageVariantTests(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        override = override_settings(MEDIA_ROOT=self.media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+        self.profile = User.objects.create_user('author', 'author@example.com', 'x').userprofile
+
+    def png(self, width=1000, height=500):
+        data = io.BytesIO()
+        Image.new('RGBA', (width, height), (200, 30, 30, 128)).save(data, 'PNG')
+        return SimpleUploadedFile('photo.png', data.getvalue(), content_type='image/png')
+
+    def test_variants_are_rendered_on_request_and_cached_by_content(self):
+        news = News.objects.create(title='Pic', content='x', created_by=self.profile, image=self.png())
+        url = images.variant_url(news.image, 320)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        with Image.open(io.BytesIO(b''.join(response.streaming_content))) as variant:
+            self.assertEqual((variant.format, variant.size), ('WEBP', (320, 160)))
+
+        sha256 = images.source_sha256(news.image.name)
+        self.assertTrue(os.path.exists(os.path.join(self.media_root, images.variant_name(sha256, 320, 'webp'))))
+        self.assertEqual(self.client.get(images.variant_url(news.image, 321)).status_code, 404)
+
+    def test_saving_a_new_image_queues_all_variants(self):
+        news = News.objects.create(title='Pic', content='x', created_by=self.profile, image=self.png())
+        news.title = 'Same picture'
+        news.save()
+        queued = QueuedTask.objects.get(task='generate_image_variants')
+        self.assertEqual(queued.payload, {'path': news.image.name})
+
+        self.assertEqual(task_queue.run_pending(), (1, 0))
+        jpeg = images.variant_name(images.source_sha256(news.image.name), 640, 'jpeg')
+        with Image.open(os.path.join(self.media_root, jpeg)) as variant:
+            self.assertEqual((variant.format, variant.mode, variant.width), ('JPEG', 'RGB', 640))
+
+    def test_creating_with_a_stored_image_queues_variants(self):
+        # post_init already saw this name, so only `created` tells it apart from an unchanged image
+        News.objects.create(title='Pic', content='x', created_by=self.profile, image='news/stored.png')
+        queued = QueuedTask.objects.get(task='generate_image_variants')
+        self.assertEqual(queued.payload, {'path': 'news/stored.png'})
+
+
+class PdfProcessingTests(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        override = override_settings(MEDIA_ROOT=self.media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+        self.profile = User.objects.create_user('author', 'author@example.com', 'x').userprofile
+        self.university = University.objects.create(name='KTU', created_by=self.profile)
+        self.degree = Degree.objects.create(name='BTech', university=self.university, created_by=self.profile)
+
+    def create_note(self, name):
+        return Note.objects.create(
+            title='Maths', subject='Maths', degree=self.degree, semester=1, year=2024,
+            university=self.university, file=name, uploaded_by=self.profile,
+        )
+
+    def test_new_files_are_queued_once(self):
+        note = self.create_note('notes/maths.pdf')
+        note.title = 'Maths II'
+        note.save()
+        queued = QueuedTask.objects.get(task='process_pdf')
+        self.assertEqual(queued.payload, {'kind': 'note', 'pk': note.pk})
+
+        note.file = 'notes/maths-v2.pdf'
+        note.save()
+        self.assertEqual(QueuedTask.objects.filter(task='process_pdf').count(), 2)
+
+    @skipUnless(pdfs.pikepdf, 'pikepdf is not installed')
+    def test_processing_linearizes_and_records_page_count(self):
+        pdf = pdfs.pikepdf.new()
+        for _ in range(3):
+            pdf.add_blank_page()
+        os.makedirs(os.path.join(self.media_root, 'notes'))
+        pdf.save(os.path.join(self.media_root, 'notes', 'maths.pdf'))
+
+        note = self.create_note('notes/maths.pdf')
+        self.assertEqual(task_queue.run_pending(), (1, 0))
+        note.refresh_from_db()
+        self.assertEqual(note.page_count, 3)
+        self.assertEqual(note.file_size, os.path.getsize(note.file.path))
+        self.assertIsNotNone(note.processed_at)
+        with pdfs.pikepdf.open(note.file.path) as processed:
+            self.assertTrue(processed.is_linearized)
+
+    @skipUnless(pdfs.pikepdf, 'pikepdf is not installed')
+    def test_shared_blob_moves_for_every_owner(self):
+        pdf = pdfs.pikepdf.new()
+        pdf.add_blank_page()
+        content = io.BytesIO()
+        pdf.save(content)
+        sha256 = hashlib.sha256(content.getvalue()).hexdigest()
+        blob = uploads.store_blob(SimpleUploadedFile('maths.pdf', content.getvalue()), sha256)
+        note = self.create_note(blob.name)
+        paper = QuestionPaper.objects.create(
+            degree=self.degree, semester=1, subject='Maths', year=2024,
+            university_id=self.university, file_path=blob.name, created_by=self.profile,
+        )
+        FileBlob.objects.filter(pk=blob.pk).update(ref_count=2)
+        generations = get_generations([Note, QuestionPaper])
+
+        self.assertEqual(task_queue.run_pending(), (2, 0))
+        note.refresh_from_db()
+        paper.refresh_from_db()
+        self.assertNotEqual(note.file.name, blob.name)
+        self.assertEqual(paper.file_path.name, note.file.name)
+        self.assertFalse(os.path.exists(os.path.join(self.media_root, blob.name)))
+        self.assertEqual(paper.page_count, 1)
+        moved = FileBlob.objects.get()
+        self.assertEqual((moved.sha256, moved.name, moved.ref_count), (sha256, note.file.name, 2))
+        for before, after in zip(generations, get_generations([Note, QuestionPaper])):
+            self.assertGreater(after, before)
+
+        # Uploading the linearized bytes themselves reuses the moved file
+        with open(note.file.path, 'rb') as linearized:
+            data = linearized.read()
+        again = uploads.store_blob(SimpleUploadedFile('copy.pdf', data), hashlib.sha256(data).hexdigest())
+        self.assertEqual(again, moved)
+        self.assertEqual(os.listdir(os.path.dirname(note.file.path)), [os.path.basename(note.file.name)])
+
+
+class DatabaseSettingsTests(TestCase):
+    def test_sqlite_is_tuned_by_default(self):
+        database = database_from_env(Path('/srv/app'), env={})
+        self.assertEqual(database['NAME'], Path('/srv/app/db.sqlite3'))
+        self.assertIn('PRAGMA journal_mode=WAL', database['OPTIONS']['init_command'])
+        self.assertIn('PRAGMA busy_timeout=5000', database['OPTIONS']['init_command'])
+        self.assertEqual(database['OPTIONS']['transaction_mode'], 'IMMEDIATE')
+
+        plain = database_from_env(Path('/srv/app'), env={'DB_SQLITE_TUNED': '0'})
+        self.assertEqual(plain['OPTIONS'], {})
+
+    def test_postgres_persistent_connections_or_pool(self):
+        env = {'DB_ENGINE': 'postgres', 'DB_NAME': 'ktr', 'DB_HOST': 'db', 'DB_CONN_MAX_AGE': '300'}
+        database = database_from_env(Path('/srv/app'), env=env)
+        self.assertEqual(database['ENGINE'], 'django.db.backends.postgresql')
+        self.assertEqual((database['NAME'], database['HOST']), ('ktr', 'db'))
+        self.assertEqual(database['CONN_MAX_AGE'], 300)
+        self.assertTrue(database['CONN_HEALTH_CHECKS'])
+
+        pooled = database_from_env(Path('/srv/app'), env={**env, 'DB_POOL': '1', 'DB_POOL_MAX_SIZE': '20'})
+        self.assertEqual(pooled['CONN_MAX_AGE'], 0)
+        self.assertEqual(pooled['OPTIONS']['pool']['max_size'], 20)
+
+    def test_unknown_engine_rejected(self):
+        with self.assertRaises(ValueError):
+            database_from_env(Path('/srv/app'), env={'DB_ENGINE': 'mysql'})
+
+    def test_connection_uses_the_pragmas(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest('SQLite only')
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA synchronous')
+            self.assertEqual(cursor.fetchone()[0], 1)  # NORMAL
+
+
+@override_settings(RATE_LIMIT_RULES=[
+    {'prefix': '/api/', 'anon': 3, 'user': 5, 'period': 60},
+    {'prefix': '/', 'anon': 1000, 'user': 1000, 'period': 60},
+])
+class RateLimitTests(TestCase):
+    url = '/api/faqs/'
+
+    def setUp(self):
+        cache.clear()
+        clock = mock.patch('admindashboard.middleware.time.time', return_value=600.0)
+        self.time = clock.start()
+        self.addCleanup(clock.stop)
+
+    def statuses(self, count, **extra):
+        return [self.client.get(self.url, **extra).status_code for _ in range(count)]
+
+    def test_over_budget_gets_429_with_retry_after(self):
+        self.assertEqual(self.statuses(3), [200, 200, 200])
+        self.time.return_value = 615.0
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response['Retry-After'], '45')
+        # Static and media files are not budgeted
+        self.assertNotEqual(self.client.get('/media/missing.pdf').status_code, 429)
+
+    def test_window_slides(self):
+        self.assertEqual(self.statuses(4), [200, 200, 200, 429])
+        # Three quarters into the next window the previous 4 requests weigh 1
+        self.time.return_value = 705.0
+        self.assertEqual(self.statuses(3), [200, 200, 429])
+        self.assertEqual(self.client.get(self.url)['Retry-After'], '15')
+        # Two windows later the budget is whole again
+        self.time.return_value = 780.0
+        self.assertEqual(self.statuses(3), [200, 200, 200])
+
+    def test_clients_are_counted_separately(self):
+        self.assertEqual(self.statuses(4, REMOTE_ADDR='10.0.0.1'), [200, 200, 200, 429])
+        self.assertEqual(self.statuses(3, REMOTE_ADDR='10.0.0.2'), [200, 200, 200])
+
+        # A signed-in user has their own, larger budget
+        self.client.force_login(User.objects.create_user('reader', 'reader@example.com', 'x'))
+        self.assertEqual(self.statuses(6, REMOTE_ADDR='10.0.0.1'), [200] * 5 + [429])
+
+    def test_jwt_clients_get_the_user_budget(self):
+        token = AccessToken.for_user(User.objects.create_user('app', 'app@example.com', 'x'))
+        bearer = {'HTTP_AUTHORIZATION': f'Bearer {token}', 'REMOTE_ADDR': '10.0.0.1'}
+        self.assertEqual(self.statuses(6, **bearer), [200] * 5 + [429])
+        # The IP budget is untouched, and a forged token is budgeted by IP
+        self.assertEqual(self.statuses(3, REMOTE_ADDR='10.0.0.1'), [200] * 3)
+        forged = {'HTTP_AUTHORIZATION': f'Bearer {token}x', 'REMOTE_ADDR': '10.0.0.1'}
+        self.assertEqual(self.client.get(self.url, **forged).status_code, 429)
+
+    def test_forwarded_for_is_only_trusted_behind_proxies(self):
+        spoofed = [
+            self.client.get(self.url, HTTP_X_FORWARDED_FOR=f'192.0.2.{i}', REMOTE_ADDR='10.0.0.1').status_code
+            for i in range(4)
+        ]
+        self.assertEqual(spoofed, [200, 200, 200, 429])
+
+        with self.settings(TRUSTED_PROXY_COUNT=1):
+            # The proxy appends the address it saw; whatever the client sent stays to its left
+            statuses = [
+                self.client.get(self.url, HTTP_X_FORWARDED_FOR=f'192.0.2.{i}, 198.51.100.7').status_code
+                for i in range(4)
+            ]
+        self.assertEqual(statuses, [200, 200, 200, 429])
+
+
+class SecurityHeaderTests(TestCase):
+    ASSET = re.compile(r'<(script|link|iframe)\b([^>]*)>')
+    DIRECTIVES = {'script': 'script-src', 'link': 'style-src', 'iframe': 'frame-src'}
+
+    def external_assets(self, html):
+        """(CSP directive, origin) for each script, stylesheet and frame loaded from another site."""
+        for tag, attributes in self.ASSET.findall(html):
+            if tag == 'link' and 'stylesheet' not in attributes:
+                continue
+            url = re.search(r'\b(?:src|href)=["\'](https?://[^/"\']+)', attributes)
+            if url:
+                yield self.DIRECTIVES[tag], url.group(1)
+
+    def headers(self, path):
+        response = self.client.get(path)
+        return {name: response.get(name) for name in ('Content-Security-Policy', 'X-Content-Type-Options', 'X-Frame-Options')}
+
+    def test_header_block_per_path_prefix(self):
+        site_csp = '; '.join(middleware.DEFAULT_CSP_POLICIES)
+        self.assertEqual(self.headers('/'), {
+            'Content-Security-Policy': site_csp, 'X-Content-Type-Options': 'nosniff', 'X-Frame-Options': 'DENY',
+        })
+        self.assertEqual(self.headers('/api/faqs/'), {
+            'Content-Security-Policy': None, 'X-Content-Type-Options': 'nosniff', 'X-Frame-Options': 'DENY',
+        })
+        # Uploaded files keep a CSP that forbids scripts
+        media = self.headers('/media/notes/missing.pdf')
+        self.assertEqual(media['Content-Security-Policy'], '; '.join(middleware.MEDIA_CSP_POLICIES))
+        self.assertIn("default-src 'none'", media['Content-Security-Policy'])
+        self.assertEqual(media['X-Content-Type-Options'], 'nosniff')
+
+    def test_policy_allows_the_assets_pages_load(self):
+        staff = User.objects.create_user('staff', 'staff@example.com', 'x', is_staff=True)
+        checked = set()
+        for path in ['/', '/contact/', '/admindashboard/news/create/', '/admindashboard/events/create/']:
+            if path.startswith('/admindashboard/'):
+                self.client.force_login(staff)
+            response = self.client.get(path)
+            self.assertEqual(response.status_code, 200, path)
+            policy = dict(
+                directive.strip().split(' ', 1) for directive in response['Content-Security-Policy'].split(';')
+            )
+            for directive, origin in self.external_assets(response.content.decode()):
+                self.assertIn(origin, policy[directive].split(), f'{path}: {directive} blocks {origin}')
+                checked.add(origin)
+        # Bootstrap, TinyMCE and the map were among them
+        self.assertLessEqual({'https://cdn.jsdelivr.net', 'https://cdnjs.cloudflare.com', 'https://www.google.com'}, checked)
+
+    @override_settings(SECURITY_HEADER_OVERRIDES={
+        '/api/': {'Content-Security-Policy': None},
+        '/api/docs/': {'X-Frame-Options': 'SAMEORIGIN'},
+    })
+    def test_blocks_are_built_once_longest_prefix_first(self):
+        security = middleware.SecurityMiddleware(lambda request: None)
+        self.assertEqual([prefix for prefix, _ in security.header_blocks], ['/api/docs/', '/api/', ''])
+
+        docs = dict(security.get_security_headers('/api/docs/schema'))
+        self.assertEqual(docs['X-Frame-Options'], 'SAMEORIGIN')
+        self.assertIn('Content-Security-Policy', docs)
+        self.assertNotIn('Content-Security-Policy', dict(security.get_security_headers('/api/news/')))
+        self.assertIs(security.get_security_headers('/news/'), security.header_blocks[-1][1])
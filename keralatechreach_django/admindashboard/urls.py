@@ -74,6 +74,7 @@ urlpatterns = [
     
     # Question Paper URLs
     path('questions/', question_list, name='question_list'),
+    path('questions/table/', question_list, {'partial': True}, name='question_table'),
     path('questions/create/', question_create, name='question_create'),
     path('questions/<int:pk>/edit/', question_edit, name='question_edit'),
     path('questions/<int:pk>/delete/', question_delete, name='question_delete'),
@@ -110,6 +111,7 @@ urlpatterns = [
     
     # Event URLs
     path('events/', event_list, name='event_list'),
+    path('events/table/', event_list, {'partial': True}, name='event_table'),
     path('events/create/', event_create, name='event_create'),
     path('events/<int:pk>/edit/', event_edit, name='event_edit'),
     path('events/<int:pk>/delete/', event_delete, name='event_delete'),
@@ -122,6 +124,7 @@ urlpatterns = [
     
     # News URLs
     path('news/', news_list, name='news_list'),
+    path('news/table/', news_list, {'partial': True}, name='news_table'),
     path('news/create/', news_create, name='news_create'),
     path('news/<int:pk>/edit/', news_edit, name='news_edit'),
     path('news/<int:pk>/delete/', news_delete, name='news_delete'),
@@ -4,16 +4,21 @@ from django.contrib import messages
 from ..models import QuestionPaper, University, Degree, Exam, Note
 from ..forms import QuestionPaperForm, UniversityForm, DegreeForm, ExamForm, NoteForm
 from .activity_log import log_activity
+from .admin_table import table_context, render_table
 
 # QuestionPaper Views
 @login_required
-def question_list(request):
-    questions = QuestionPaper.objects.all().order_by('-updated_at')
-    context = {
-        'questions': questions,
-        'question_table': render(request, 'admindashboard/academic/question_table.html', {'questions': questions}).content.decode('utf-8')
-    }
-    return render(request, 'admindashboard/academic/question_list.html', context)
+def question_list(request, partial=False):
+    context = table_context(
+        request,
+        QuestionPaper.objects.select_related('degree', 'university_id'),
+        sort_fields={'subject': 'subject', 'updated': 'updated_at'},
+        default_sort='-updated',
+    )
+    return render_table(
+        request, 'admindashboard/academic/question_list.html', 'admindashboard/academic/question_table.html',
+        context, partial,
+    )
 
 @login_required
 def question_create(request):
@@ -1,23 +1,93 @@
+from datetime import date, datetime, time, timedelta
+
 from django.contrib.auth.decorators import login_required
-from django.core.paginator import Paginator
+from django.contrib.auth.models import User
+from django.db.models import Q
 from django.shortcuts import render
+from django.utils import timezone
+from .. import activity_buffer
 from ..models import ActivityLog
 
+PAGE_SIZE = 20
+
+
+def encode_cursor(activity):
+    return f"{activity.timestamp.isoformat()}|{activity.pk}"
+
+
+def decode_cursor(value):
+    if not value:
+        return None
+    try:
+        timestamp, pk = value.rsplit('|', 1)
+        return datetime.fromisoformat(timestamp), int(pk)
+    except ValueError:
+        return None
+
+
+def filter_activities(activities, params):
+    """Apply the user/action/date filters; each one is served by an ActivityLog index."""
+    username = params.get('user')
+    if username:
+        activities = activities.filter(user_id=User.objects.filter(username=username).values('pk')[:1])
+    if params.get('action'):
+        activities = activities.filter(action=params['action'])
+    for name, lookup in (('date_from', 'timestamp__gte'), ('date_to', 'timestamp__lt')):
+        try:
+            day = date.fromisoformat(params.get(name, ''))
+        except ValueError:
+            continue
+        if name == 'date_to':
+            day += timedelta(days=1)  # inclusive
+        activities = activities.filter(**{lookup: timezone.make_aware(datetime.combine(day, time.min))})
+    return activities
+
+
+def keyset_page(activities, before=None, after=None, page_size=PAGE_SIZE):
+    """
+    One page of `activities`, newest first, starting below the `before`
+    cursor or above the `after` cursor. Seeks on (timestamp, id) instead of
+    OFFSET and never counts the table. Returns (rows, has_newer, has_older).
+    """
+    if after:
+        timestamp, pk = after
+        rows = list(activities.filter(
+            Q(timestamp__gt=timestamp) | Q(timestamp=timestamp, pk__gt=pk)
+        ).order_by('timestamp', 'id')[:page_size + 1])
+        has_newer = len(rows) > page_size
+        return rows[:page_size][::-1], has_newer, True
+
+    if before:
+        timestamp, pk = before
+        activities = activities.filter(Q(timestamp__lt=timestamp) | Q(timestamp=timestamp, pk__lt=pk))
+    rows = list(activities.order_by('-timestamp', '-id')[:page_size + 1])
+    return rows[:page_size], before is not None, len(rows) > page_size
+
+
 @login_required
 def activity_log_view(request):
     if request.user.is_staff:
         # Staff can see all logs
-        activities = ActivityLog.objects.all()
+        activities = filter_activities(ActivityLog.objects.select_related('user'), request.GET)
     else:
         # Regular users can only see their own logs
-        activities = ActivityLog.objects.filter(user=request.user)
-    
-    paginator = Paginator(activities, 20)  # Show 20 activities per page
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+        activities = ActivityLog.objects.filter(user=request.user).select_related('user')
+
+    rows, has_newer, has_older = keyset_page(
+        activities,
+        before=decode_cursor(request.GET.get('before')),
+        after=decode_cursor(request.GET.get('after')),
+    )
+    filters = request.GET.copy()
+    filters.pop('before', None)
+    filters.pop('after', None)
     
     context = {
-        'page_obj': page_obj,
+        'page_obj': rows,
+        'newer_cursor': encode_cursor(rows[0]) if rows and has_newer else None,
+        'older_cursor': encode_cursor(rows[-1]) if rows and has_older else None,
+        'filters': filters,
+        'filter_query': filters.urlencode(),
         'title': 'Activity Log'
     }
     return render(request, 'admindashboard/activity_log.html', context)
@@ -34,9 +104,10 @@ def log_activity(user, action, details=None, request=None):
         else:
             ip_address = request.META.get('REMOTE_ADDR')
             
-    ActivityLog.objects.create(
+    # Written in batches by activity_buffer
+    activity_buffer.add(ActivityLog(
         user=user,
         action=action,
         details=details,
         ip_address=ip_address
-    ) 
\ No newline at end of file
+    )) 
\ No newline at end of file
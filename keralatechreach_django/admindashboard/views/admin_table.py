@@ -0,0 +1,52 @@
+from django.core.paginator import Paginator
+from django.shortcuts import render
+
+PAGE_SIZE = 25
+
+
+def table_context(request, queryset, sort_fields, default_sort, page_size=PAGE_SIZE):
+    """
+    One sorted page of `queryset` for an admin list table.
+
+    `sort_fields` maps the names allowed in ?sort= (prefix "-" for
+    descending) to model fields. List only fields with a (field, id) index
+    over every row, so each page is an index range scan.
+
+    Returns the template context: page_obj, the page's rows, the elided
+    page range, and sort_links ({name: {'url', 'state'}}) for the column
+    headers.
+    """
+    sort = request.GET.get('sort', default_sort)
+    if sort.lstrip('-') not in sort_fields:
+        sort = default_sort
+    descending = sort.startswith('-')
+    field = sort_fields[sort.lstrip('-')]
+    # pk breaks ties so rows never move between pages
+    queryset = queryset.order_by(f'-{field}' if descending else field, '-pk' if descending else 'pk')
+
+    page_obj = Paginator(queryset, page_size).get_page(request.GET.get('page'))
+
+    params = request.GET.copy()
+    params.pop('page', None)
+    sort_links = {}
+    for name in sort_fields:
+        state = ''
+        if sort.lstrip('-') == name:
+            state = 'desc' if descending else 'asc'
+        params['sort'] = f'-{name}' if state == 'asc' else name
+        sort_links[name] = {'url': params.urlencode(), 'state': state}
+    params['sort'] = sort
+
+    return {
+        'page_obj': page_obj,
+        'rows': page_obj.object_list,
+        'page_range': page_obj.paginator.get_elided_page_range(page_obj.number),
+        'sort': sort,
+        'sort_links': sort_links,
+        'query': params.urlencode(),
+    }
+
+
+def render_table(request, page_template, table_template, context, partial=False):
+    """Render the full list page, or only its table for the partial-refresh URL."""
+    return render(request, table_template if partial else page_template, context)
@@ -4,26 +4,27 @@ from django.contrib import messages
 from ..models import News, Event, Gallery, EventCategory, District, Initiative
 from ..forms import NewsForm, EventForm, GalleryForm, EventCategoryForm, DistrictForm, InitiativeForm
 from .activity_log import log_activity
+from .admin_table import table_context, render_table
+import logging
+
+logger = logging.getLogger(__name__)
 
 # News Views
 @login_required
-def news_list(request):
-    news_items = News.objects.all().order_by('-created_at')
-    context = {
-        'news_items': news_items,
-        'news_table': render(request, 'admindashboard/news/table.html', {'news': news_items}).content.decode('utf-8')
-    }
-    return render(request, 'admindashboard/news/list.html', context)
+def news_list(request, partial=False):
+    context = table_context(
+        request,
+        News.objects.all(),
+        sort_fields={'title': 'title', 'created': 'created_at'},
+        default_sort='-created',
+    )
+    return render_table(request, 'admindashboard/news/list.html', 'admindashboard/news/table.html', context, partial)
 
 @login_required
 def news_create(request):
     if request.method == 'POST':
-        print("DEBUG: POST request received")
         form = NewsForm(request.POST, request.FILES)
-        print("DEBUG: Form data:", request.POST)
-        print("DEBUG: Files:", request.FILES)
         if form.is_valid():
-            print("DEBUG: Form is valid")
             news = form.save(commit=False)
             news.created_by = request.user.userprofile
             news.save()
@@ -36,7 +37,7 @@ def news_create(request):
             messages.success(request, 'News article created successfully.')
             return redirect('admindashboard:news_list')
         else:
-            print("DEBUG: Form errors:", form.errors)
+            logger.debug('News form errors: %s', form.errors.as_json())
     else:
         form = NewsForm()
     return render(request, 'admindashboard/news/form.html', {
@@ -85,13 +86,14 @@ def news_delete(request, pk):
 
 # Event Views
 @login_required
-def event_list(request):
-    events = Event.objects.all().order_by('-event_start')
-    context = {
-        'events': events,
-        'event_table': render(request, 'admindashboard/event/table.html', {'events': events}).content.decode('utf-8')
-    }
-    return render(request, 'admindashboard/event/list.html', context)
+def event_list(request, partial=False):
+    context = table_context(
+        request,
+        Event.objects.select_related('district', 'category'),
+        sort_fields={'name': 'name', 'start': 'event_start'},
+        default_sort='-start',
+    )
+    return render_table(request, 'admindashboard/event/list.html', 'admindashboard/event/table.html', context, partial)
 
 @login_required
 def event_create(request):
@@ -110,7 +112,7 @@ def event_create(request):
             messages.success(request, 'Event created successfully.')
             return redirect('admindashboard:event_list')
         else:
-            print("Form errors:", form.errors)
+            logger.debug('Event form errors: %s', form.errors.as_json())
     else:
         form = EventForm()
     
@@ -137,7 +139,7 @@ def event_edit(request, pk):
             messages.success(request, 'Event updated successfully.')
             return redirect('admindashboard:event_list')
         else:
-            print("Form errors:", form.errors)
+            logger.debug('Event form errors: %s', form.errors.as_json())
     else:
         form = EventForm(instance=event)
     
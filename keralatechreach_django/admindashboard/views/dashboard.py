@@ -9,29 +9,38 @@ from ..models import (
     Gallery, SiteSetting, UserProfile
 )
 from ..decorators import staff_required
+from ..stats import dashboard_stats
+from ..metrics import trends
 
 @login_required
 def dashboard(request):
-    # Get current date and last week
+    # Get current date
     now = timezone.now()
-    last_week = now - timedelta(days=7)
     
+    stats = dashboard_stats()
+
     # Basic Statistics
     context = {
-        'total_users': UserProfile.objects.count() if request.user.is_staff else 1,
-        'total_questions': QuestionPaper.objects.count(),
-        'total_events': Event.objects.count(),
-        'total_news': News.objects.count(),
+        'total_users': stats['total_users'] if request.user.is_staff else 1,
+        'total_questions': stats['total_questions'],
+        'total_events': stats['total_events'],
+        'total_news': stats['total_news'],
     }
 
     # Staff-only statistics
     if request.user.is_staff:
         context.update({
-            # Recent counts (last 7 days)
-            'new_users': UserProfile.objects.filter(user__date_joined__gte=last_week).count(),
-            'new_questions': QuestionPaper.objects.filter(updated_at__gte=last_week).count(),
-            'new_events': Event.objects.filter(updated_at__gte=last_week).count(),
-            'new_news': News.objects.filter(created_at__gte=last_week).count(),
+            # Recent counts (last 7 days), content status, messages and
+            # university statistics
+            **{
+                name: stats[name]
+                for name in (
+                    'new_users', 'new_questions', 'new_events', 'new_news',
+                    'published_questions', 'draft_questions', 'published_events',
+                    'draft_events', 'published_news', 'draft_news',
+                    'unread_messages', 'total_messages', 'university_count', 'degree_count',
+                )
+            },
             
             # Upcoming Events
             'upcoming_events': Event.objects.filter(
@@ -42,26 +51,13 @@ def dashboard(request):
             'recent_questions': QuestionPaper.objects.order_by('-updated_at')[:5],
             'recent_news': News.objects.order_by('-created_at')[:5],
             
-            # Content Status
-            'published_questions': QuestionPaper.objects.filter(is_published=True).count(),
-            'draft_questions': QuestionPaper.objects.filter(is_published=False).count(),
-            'published_events': Event.objects.filter(is_published=True).count(),
-            'draft_events': Event.objects.filter(is_published=False).count(),
-            'published_news': News.objects.filter(is_published=True).count(),
-            'draft_news': News.objects.filter(is_published=False).count(),
-            
-            # Messages
-            'unread_messages': ContactMessage.objects.filter(is_read=False).count(),
-            'total_messages': ContactMessage.objects.count(),
-            
-            # University Statistics
-            'university_count': University.objects.count(),
-            'degree_count': Degree.objects.count(),
-            
             # Event Categories
             'event_categories': EventCategory.objects.annotate(
                 event_count=Count('event')
             ).order_by('-event_count')[:5],
+
+            # Daily trends from the rolled-up metrics table
+            'trends': trends(days=30),
         })
     else:
         # Regular user statistics
@@ -0,0 +1,105 @@
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.response import Response
+
+HITS_KEY = 'api_cache:hits'
+MISSES_KEY = 'api_cache:misses'
+
+
+def get_cache():
+    return caches[getattr(settings, 'API_CACHE', 'default')]
+
+
+def generation_key(model):
+    return f'api_cache:generation:{model._meta.label_lower}'
+
+
+def bump_generation(model):
+    """Invalidate every cached response that depends on `model`."""
+    cache = get_cache()
+    key = generation_key(model)
+    # Generations never expire; a missing key simply means generation 0
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, None)
+
+
+def get_generations(models):
+    cache = get_cache()
+    keys = [generation_key(model) for model in models]
+    values = cache.get_many(keys)
+    return [values.get(key, 0) for key in keys]
+
+
+def _count(key):
+    cache = get_cache()
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, None)
+
+
+def cache_stats():
+    cache = get_cache()
+    values = cache.get_many([HITS_KEY, MISSES_KEY])
+    hits = values.get(HITS_KEY, 0)
+    misses = values.get(MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': round(hits / total, 4) if total else None,
+    }
+
+
+class CachedResponseMixin:
+    """
+    Cache list and detail responses of a read-only viewset.
+
+    The key combines the host, path, sorted query parameters and the current
+    generation of every model in ``cache_models``. Saving or deleting any of
+    those models bumps its generation (see api.signals), so stale entries are
+    never read again and simply age out after ``cache_timeout`` seconds.
+    That holds across worker processes only when API_CACHE is shared (Redis,
+    Memcached; see the api.W001 check). With the per-process fallback other
+    workers keep serving their entry for up to API_CACHE_TIMEOUT, which is
+    60 seconds in that setup.
+    """
+    cache_models = ()
+    cache_timeout = None
+
+    def get_cache_models(self):
+        return self.cache_models or (self.queryset.model,)
+
+    def get_response_cache_key(self, request):
+        params = '&'.join(
+            f'{name}={value}'
+            for name, values in sorted(request.query_params.lists())
+            for value in values
+        )
+        generations = '.'.join(str(g) for g in get_generations(self.get_cache_models()))
+        return f'api_cache:response:{request.get_host()}{request.path}?{params}:{generations}'
+
+    def cached_response(self, request, build_response):
+        cache = get_cache()
+        key = self.get_response_cache_key(request)
+        data = cache.get(key)
+        if data is not None:
+            _count(HITS_KEY)
+            return Response(data)
+
+        _count(MISSES_KEY)
+        response = build_response()
+        if response.status_code == 200:
+            timeout = self.cache_timeout or getattr(settings, 'API_CACHE_TIMEOUT', 300)
+            cache.set(key, response.data, timeout)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(request, lambda: super(CachedResponseMixin, self).list(request, *args, **kwargs))
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(request, lambda: super(CachedResponseMixin, self).retrieve(request, *args, **kwargs))
@@ -0,0 +1,25 @@
+from django.conf import settings
+from django.core.checks import Warning, register
+
+PROCESS_LOCAL_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+@register(deploy=True)
+def shared_cache_check(app_configs, **kwargs):
+    """API cache invalidation and rate limits need a cache every worker shares."""
+    if settings.DEBUG:
+        return []
+    aliases = {getattr(settings, 'API_CACHE', 'default'), getattr(settings, 'RATE_LIMIT_CACHE', 'default')}
+    return [
+        Warning(
+            f"The '{alias}' cache is local to each process, so a save only invalidates the "
+            "API responses cached by the worker that handled it, and rate limits are per worker.",
+            hint='Set REDIS_URL or MEMCACHED_LOCATION.',
+            id='api.W001',
+        )
+        for alias in sorted(aliases)
+        if settings.CACHES[alias]['BACKEND'] in PROCESS_LOCAL_BACKENDS
+    ]
@@ -0,0 +1,60 @@
+from collections import OrderedDict
+
+from django.conf import settings
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+
+
+class KeysetCursorPagination(CursorPagination):
+    """
+    Opaque cursor (keyset) pagination for the public API.
+
+    Each viewset declares a stable ``pagination_ordering`` such as
+    ``('-updated_at', '-id')``. Clients follow the ``next`` / ``previous``
+    links, may ask for a smaller or larger page with ``?page_size=`` (capped
+    by ``API_MAX_PAGE_SIZE``) and can opt into a total with ``?count=true``.
+
+    The cursor encodes the position in that ordering, so an ordering that
+    starts with a mutable field such as ``updated_at`` can skip or repeat a
+    row edited while a client is scrolling: the edit moves the row to the
+    front, past the cursor. Feeds that must be exact order on an immutable
+    field (``created_at``, ``id``); the ``updated_at`` feeds accept this so
+    recently edited items surface first.
+    """
+    page_size_query_param = 'page_size'
+    count_query_param = 'count'
+    ordering = ('-id',)
+
+    @property
+    def max_page_size(self):
+        return getattr(settings, 'API_MAX_PAGE_SIZE', 200)
+
+    def get_ordering(self, request, queryset, view):
+        ordering = getattr(view, 'pagination_ordering', None)
+        if ordering:
+            return (ordering,) if isinstance(ordering, str) else tuple(ordering)
+        return super().get_ordering(request, queryset, view)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count = None
+        if request.query_params.get(self.count_query_param, '').lower() in ('1', 'true', 'yes'):
+            self.count = queryset.count()
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        payload = OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+        ])
+        if self.count is not None:
+            payload['count'] = self.count
+        payload['results'] = data
+        return Response(payload)
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema['properties']['count'] = {
+            'type': 'integer',
+            'example': 123,
+        }
+        return response_schema
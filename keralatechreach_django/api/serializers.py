@@ -17,6 +17,7 @@ from admindashboard.models import (
     Initiative,
     FAQ
 )
+from admindashboard.images import variant_url, variant_urls, widths as variant_widths
 
 class UniversitySerializer(serializers.ModelSerializer):
     class Meta:
@@ -40,7 +41,7 @@ class QuestionPaperSerializer(serializers.ModelSerializer):
             'id', 'degree', 'degree_name', 'semester', 
             'subject', 'file_path', 'year', 
             'university_id', 'university_name', 
-            'is_published'
+            'is_published', 'views_count', 'page_count', 'file_size', 'preview'
         ]
 
 class NoteSerializer(serializers.ModelSerializer):
@@ -49,18 +50,13 @@ class NoteSerializer(serializers.ModelSerializer):
     module = serializers.CharField(source='subject', read_only=True)
     subject = serializers.CharField(read_only=True)
     
-    def to_representation(self, instance):
-        print(f"DEBUG - Note instance: id={instance.id}, title={instance.title}, subject={instance.subject}")
-        ret = super().to_representation(instance)
-        print(f"DEBUG - Serialized note: {ret}")
-        return ret
-    
     class Meta:
         model = Note
         fields = [
             'id', 'title', 'module', 'subject', 'degree',
             'degree_name', 'semester', 'year',
-            'university', 'university_name', 'file'
+            'university', 'university_name', 'file', 'views_count',
+            'page_count', 'file_size', 'preview'
         ]
 
 class ExamSerializer(serializers.ModelSerializer):
@@ -83,18 +79,46 @@ class EntranceNotificationSerializer(serializers.ModelSerializer):
             'link', 'published_date', 'is_published'
         ]
 
-class NewsSerializer(serializers.ModelSerializer):
+class ImageVariantsMixin:
+    """Absolute URLs of the resized variants of an image (admindashboard.images)."""
+
+    def absolute(self, url):
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request and url else url
+
+    def image_variants(self, field_file):
+        variants = variant_urls(field_file)
+        if variants is None:
+            return None
+        return {
+            fmt: [{'width': v['width'], 'url': self.absolute(v['url'])} for v in sizes]
+            for fmt, sizes in variants.items()
+        }
+
+
+class NewsSerializer(ImageVariantsMixin, serializers.ModelSerializer):
     created_by_username = serializers.CharField(source='created_by.user.username', read_only=True)
+    image_variants = serializers.SerializerMethodField()
 
     class Meta:
         model = News
         fields = [
-            'id', 'title', 'slug', 'content', 'excerpt', 'image',
+            'id', 'title', 'slug', 'content', 'excerpt', 'image', 'image_variants',
             'thumbnail', 'created_at', 'updated_at', 'is_published',
             'created_by', 'created_by_username', 'meta_title', 'meta_description',
             'keywords', 'reading_time', 'views_count', 'likes_count'
         ]
 
+    def get_image_variants(self, obj):
+        return self.image_variants(obj.image)
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        if not data.get('thumbnail') and instance.image:
+            # No hand-made thumbnail: use the smallest generated variant
+            data['thumbnail'] = self.absolute(variant_url(instance.image, min(variant_widths())))
+        return data
+
 class JobSerializer(serializers.ModelSerializer):
     created_by_username = serializers.CharField(source='created_by.user.username', read_only=True)
 
@@ -170,10 +194,15 @@ class ContactMessageSerializer(serializers.ModelSerializer):
         model = ContactMessage
         fields = ['id', 'name', 'email', 'subject', 'message', 'created_at']
 
-class InitiativeSerializer(serializers.ModelSerializer):
+class InitiativeSerializer(ImageVariantsMixin, serializers.ModelSerializer):
+    photo_variants = serializers.SerializerMethodField()
+
     class Meta:
         model = Initiative
-        fields = ['id', 'name', 'description', 'link', 'photo', 'updated_at', 'is_published']
+        fields = ['id', 'name', 'description', 'link', 'photo', 'photo_variants', 'updated_at', 'is_published']
+
+    def get_photo_variants(self, obj):
+        return self.image_variants(obj.photo)
 
 class FAQSerializer(serializers.ModelSerializer):
     class Meta:
@@ -210,5 +239,5 @@ class EventSerializer(serializers.ModelSerializer):
             'id', 'title', 'name', 'date', 'event_start', 'event_end', 
             'location', 'place', 'description', 'link', 'map_link',
             'category', 'category_name', 'district', 'district_name',
-            'is_published'
+            'is_published', 'views_count'
         ]
\ No newline at end of file
@@ -0,0 +1,41 @@
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+
+from admindashboard.models import QuestionPaper, Note
+from .cache import bump_generation
+from .uploads import release_blob
+
+
+def invalidate_cached_responses(sender, **kwargs):
+    bump_generation(sender)
+
+
+# Every admindashboard model can back a cached API response
+for model in apps.get_app_config('admindashboard').get_models():
+    post_save.connect(invalidate_cached_responses, sender=model, dispatch_uid=f'api_cache_{model._meta.label_lower}_save')
+    post_delete.connect(invalidate_cached_responses, sender=model, dispatch_uid=f'api_cache_{model._meta.label_lower}_delete')
+
+
+def invalidate_author_names(sender, update_fields=None, **kwargs):
+    # Logins only save last_login, which no response shows
+    if update_fields and set(update_fields) <= {'last_login'}:
+        return
+    bump_generation(sender)
+
+
+# News and jobs show their author's username
+post_save.connect(invalidate_author_names, sender=get_user_model(), dispatch_uid='api_cache_user_save')
+post_delete.connect(invalidate_author_names, sender=get_user_model(), dispatch_uid='api_cache_user_delete')
+
+
+def release_question_paper_file(sender, instance, **kwargs):
+    release_blob(instance.file_path.name)
+
+
+def release_note_file(sender, instance, **kwargs):
+    release_blob(instance.file.name)
+
+
+post_delete.connect(release_question_paper_file, sender=QuestionPaper, dispatch_uid='api_release_question_paper_file')
+post_delete.connect(release_note_file, sender=Note, dispatch_uid='api_release_note_file')
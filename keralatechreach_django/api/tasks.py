@@ -0,0 +1,30 @@
+import logging
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.mail import EmailMultiAlternatives
+from django.template.loader import render_to_string
+
+from admindashboard.task_queue import task
+
+logger = logging.getLogger(__name__)
+
+
+@task
+def send_verification_email(user_id, token, subject='Verify Your Email Address'):
+    user = get_user_model().objects.get(pk=user_id)
+
+    # Construct verification URL - **NOTE: Update settings.BASE_URL with your actual domain/IP**
+    base_url = getattr(settings, 'BASE_URL', 'http://localhost:8000') # Default if not set
+    verification_link = f"{base_url}/api/auth/verify-email/{token}/"
+
+    # Render email templates
+    context = {'username': user.username, 'verification_link': verification_link}
+    text_content = render_to_string('emails/verification_email.txt', context)
+    html_content = render_to_string('emails/verification_email.html', context)
+
+    # Create the email with both plain text and HTML parts; errors are retried by the queue
+    email = EmailMultiAlternatives(subject, text_content, settings.DEFAULT_FROM_EMAIL, [user.email])
+    email.attach_alternative(html_content, "text/html")
+    email.send(fail_silently=False)
+    logger.info('Verification email sent to %s', user.email)
@@ -0,0 +1,719 @@
+import hashlib
+import logging.config
+import os
+import tempfile
+import threading
+from datetime import date, timedelta
+from importlib import import_module
+from urllib.parse import urlencode
+from unittest import mock, skipUnless
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core import mail
+from django.core.cache import cache
+from django.db import connection
+from django.db.migrations.loader import MigrationLoader
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.throttling import ScopedRateThrottle
+
+from admindashboard import counters, search, task_queue
+from admindashboard.models import (
+    QuestionPaper, Note, University, Degree, Exam, News, Job,
+    Event, EventCategory, District, FileBlob, QueuedTask, FailedTask, SearchDocument, ChunkedUpload,
+)
+from . import checks, uploads
+
+
+def create_catalogue(rows):
+    """Create `rows` published objects of every API model."""
+    user = User.objects.create_user(f'author{User.objects.count()}', 'author@example.com', 'x')
+    profile = user.userprofile
+    for i in range(rows):
+        university = University.objects.create(name=f'University {i}', created_by=profile)
+        degree = Degree.objects.create(name=f'Degree {i}', university=university, created_by=profile)
+        category = EventCategory.objects.create(category=f'Category {i}', created_by=profile)
+        district = District.objects.create(name=f'District {i}', created_by=profile)
+        QuestionPaper.objects.create(
+            degree=degree, semester=1, subject=f'Subject {i}', year=2024,
+            university_id=university, is_published=True, created_by=profile,
+        )
+        Note.objects.create(
+            title=f'Note {i}', subject=f'Subject {i}', degree=degree, semester=1,
+            year=2024, university=university, file='notes/sample.pdf',
+            uploaded_by=profile, is_published=True,
+        )
+        Exam.objects.create(
+            exam_name=f'Exam {i}', exam_date=date.today() + timedelta(days=i),
+            exam_url='https://example.com', degree_name=degree, semester='1',
+            admission_year=2024, university=university, is_published=True,
+            show_on_home=True, created_by=profile,
+        )
+        News.objects.create(
+            title=f'News {i}', content='word ' * 50, is_published=True, created_by=profile,
+        )
+        Job.objects.create(
+            title=f'Job {i}', description='Job', last_date=date.today(),
+            is_published=True, created_by=profile,
+        )
+        Event.objects.create(
+            name=f'Event {i}', event_start=timezone.now() + timedelta(days=i), place='Kochi',
+            category=category, district=district, is_published=True, created_by=profile,
+        )
+
+
+class APIQueryCountTests(TestCase):
+    """
+    Every API endpoint must run a fixed number of queries regardless of how
+    many rows it returns. A failure here means a serializer started following
+    a relation that the viewset's queryset does not select_related.
+    """
+
+    # endpoint -> expected number of queries for one list request
+    LIST_ENDPOINTS = {
+        '/api/universities/': 1,
+        '/api/degrees/': 1,
+        '/api/question-papers/': 1,
+        '/api/notes/': 1,
+        '/api/exams/': 1,
+        '/api/news/': 1,
+        '/api/jobs/': 1,
+        '/api/events/': 1,
+        '/api/event-categories/': 1,
+        '/api/districts/': 1,
+        '/api/featured-exams/': 1,
+        '/api/featured-jobs/': 1,
+        '/api/featured-events/': 1,
+        '/api/featured-news/': 1,
+    }
+
+    def setUp(self):
+        cache.clear()
+        # Detail requests start the flush timer; cancel it with the buffer
+        self.addCleanup(counters.buffer.take)
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, url)
+        return len(queries)
+
+    def test_list_query_count_is_independent_of_row_count(self):
+        create_catalogue(1)
+        small = {url: self.count_queries(url) for url in self.LIST_ENDPOINTS}
+        create_catalogue(4)
+        for url, expected in self.LIST_ENDPOINTS.items():
+            with self.subTest(url=url):
+                self.assertEqual(small[url], expected)
+                self.assertEqual(self.count_queries(url), expected)
+
+    def test_detail_query_count(self):
+        create_catalogue(2)
+        news = News.objects.first()
+        detail_urls = [
+            f'/api/question-papers/{QuestionPaper.objects.first().pk}/',
+            f'/api/notes/{Note.objects.first().pk}/',
+            f'/api/exams/{Exam.objects.first().pk}/',
+            f'/api/news/{news.slug}/',
+            f'/api/jobs/{Job.objects.first().pk}/',
+            f'/api/events/{Event.objects.first().pk}/',
+        ]
+        for url in detail_urls:
+            with self.subTest(url=url):
+                self.assertEqual(self.count_queries(url), 1)
+
+
+class KeysetPaginationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        create_catalogue(5)
+
+    def walk(self, url):
+        """Slugs of every page from `url` on, following the next links."""
+        slugs, pages = [], []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            pages.append(response.json())
+            slugs += [item['slug'] for item in response.json()['results']]
+            url = response.json()['next']
+        return slugs, pages
+
+    def test_cursor_round_trip(self):
+        expected = list(News.objects.filter(is_published=True).order_by('-created_at', '-id').values_list('slug', flat=True))
+        slugs, pages = self.walk('/api/news/?page_size=2')
+        self.assertEqual(slugs, expected)
+        self.assertEqual([len(page['results']) for page in pages], [2, 2, 1])
+
+        previous = self.client.get(pages[-1]['previous']).json()
+        self.assertEqual(previous['results'], pages[1]['results'])
+
+    def test_ordering_is_stable_when_timestamps_tie(self):
+        News.objects.update(created_at=timezone.now())
+        slugs, _ = self.walk('/api/news/?page_size=2')
+        self.assertEqual(len(slugs), 5)
+        self.assertEqual(len(set(slugs)), 5)
+        # id breaks the tie
+        self.assertEqual(slugs, list(News.objects.order_by('-id').values_list('slug', flat=True)))
+
+    def test_count_is_opt_in(self):
+        self.assertNotIn('count', self.client.get('/api/news/?page_size=2').json())
+        body = self.client.get('/api/news/?page_size=2&count=true').json()
+        self.assertEqual(body['count'], 5)
+        self.assertEqual(len(body['results']), 2)
+
+    def test_next_links_keep_the_filters(self):
+        Event.objects.update(event_start=timezone.now())
+        day = timezone.localdate(Event.objects.first().event_start).isoformat()
+        Event.objects.filter(pk=Event.objects.first().pk).update(event_start=timezone.now() + timedelta(days=3))
+        first = self.client.get(f'/api/events/?event_start__date={day}&page_size=2').json()
+        self.assertIn(f'event_start__date={day}', first['next'])
+        second = self.client.get(first['next']).json()
+        self.assertEqual(len(first['results']) + len(second['results']), 4)
+        self.assertIsNone(second['next'])
+
+    @override_settings(API_MAX_PAGE_SIZE=3)
+    def test_page_size_is_capped(self):
+        self.assertEqual(len(self.client.get('/api/news/?page_size=1000').json()['results']), 3)
+
+
+@skipUnless(connection.vendor == 'sqlite', 'reads SQLite EXPLAIN QUERY PLAN output')
+class APIQueryPlanTests(TestCase):
+    """
+    Every query behind the content endpoints, filtered the way the app
+    filters them, must be answered from an index (see the Meta.indexes of
+    the admindashboard models). A failure names the query that fell back to
+    scanning a whole table. Lookup tables (universities, degrees, districts,
+    categories) are small, read whole and cached, so they are not checked.
+    """
+
+    def setUp(self):
+        cache.clear()
+        create_catalogue(2)
+        degree = Degree.objects.first()
+        university = degree.university
+        self.endpoints = [
+            '/api/question-papers/',
+            f'/api/question-papers/?degree={degree.pk}',
+            f'/api/question-papers/?degree={degree.pk}&semester=1&year=2024',
+            f'/api/question-papers/?university_id={university.pk}',
+            '/api/notes/',
+            f'/api/notes/?degree={degree.pk}&semester=1',
+            '/api/exams/',
+            f'/api/exams/?degree_name={degree.pk}&semester=1&admission_year=2024',
+            f'/api/exams/?university={university.pk}',
+            '/api/featured-exams/',
+            '/api/entrance-notifications/',
+            '/api/news/',
+            '/api/featured-news/',
+            '/api/jobs/',
+            '/api/featured-jobs/',
+            '/api/events/',
+            f'/api/events/?{urlencode({"event_start": Event.objects.first().event_start.isoformat()})}',
+            '/api/featured-events/',
+            '/api/initiatives/',
+            '/api/faqs/',
+        ]
+
+    def full_scans(self, sql):
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+            plan = [row[-1] for row in cursor.fetchall()]
+        # "SCAN t" reads the table; "SCAN t USING [COVERING] INDEX i" walks an index
+        return [step for step in plan if step.startswith('SCAN ') and ' USING ' not in step]
+
+    def test_api_queries_use_indexes(self):
+        for url in self.endpoints:
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200, url)
+            for query in queries:
+                if not query['sql'].startswith('SELECT'):
+                    continue
+                with self.subTest(url=url, sql=query['sql']):
+                    self.assertEqual(self.full_scans(query['sql']), [])
+
+
+class APIResponseCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_cached_list_is_invalidated_by_model_save(self):
+        create_catalogue(1)
+        self.assertEqual(self.client.get('/api/universities/').json()['results'][0]['name'], 'University 0')
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get('/api/universities/')
+        self.assertEqual(len(queries), 0)
+
+        University.objects.update(name='Renamed')  # bypasses signals
+        University.objects.get().save()
+        self.assertEqual(self.client.get('/api/universities/').json()['results'][0]['name'], 'Renamed')
+
+    def test_query_params_are_part_of_the_key(self):
+        create_catalogue(3)
+        self.assertEqual(len(self.client.get('/api/universities/?page_size=1').json()['results']), 1)
+        self.assertEqual(len(self.client.get('/api/universities/?page_size=2').json()['results']), 2)
+
+
+class SharedCacheCheckTests(TestCase):
+    LOCMEM = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+    REDIS = {'default': {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': 'redis://cache:6379'}}
+
+    def test_process_local_cache_is_flagged_outside_debug(self):
+        with self.settings(DEBUG=False, CACHES=self.LOCMEM):
+            self.assertEqual([warning.id for warning in checks.shared_cache_check(None)], ['api.W001'])
+        with self.settings(DEBUG=True, CACHES=self.LOCMEM):
+            self.assertEqual(checks.shared_cache_check(None), [])
+        with self.settings(DEBUG=False, CACHES=self.REDIS):
+            self.assertEqual(checks.shared_cache_check(None), [])
+
+
+class APIConditionalGetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(counters.buffer.take)
+        create_catalogue(2)
+
+    def test_unchanged_list_returns_304(self):
+        response = self.client.get('/api/news/')
+        etag = response['ETag']
+        self.assertFalse(response.has_header('Last-Modified'))
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/news/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(len(queries), 0)
+
+    def test_etag_changes_when_a_row_is_unpublished_or_deleted(self):
+        etag = self.client.get('/api/news/')['ETag']
+        news = News.objects.first()
+        news.is_published = False
+        news.save()
+        unpublished = self.client.get('/api/news/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(unpublished.status_code, 200)
+
+        News.objects.last().delete()
+        self.assertEqual(self.client.get('/api/news/', HTTP_IF_NONE_MATCH=unpublished['ETag']).status_code, 200)
+
+    def test_etag_changes_when_an_author_is_renamed(self):
+        user = News.objects.first().created_by.user
+        for url in ('/api/news/', '/api/jobs/', '/api/featured-news/', '/api/featured-jobs/'):
+            etag = self.client.get(url)['ETag']
+            # Logging in does not change any response
+            user.last_login = timezone.now()
+            user.save(update_fields=['last_login'])
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+            user.username = f'{user.username}-renamed'
+            user.save()
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 200)
+            rows = response.json()
+            rows = rows['results'] if isinstance(rows, dict) else rows
+            self.assertIn(user.username, {row['created_by_username'] for row in rows})
+
+    def test_cached_response_keeps_its_etag_without_queries(self):
+        etag = self.client.get('/api/universities/')['ETag']
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/universities/')
+        self.assertEqual((response['ETag'], len(queries)), (etag, 0))
+
+    def test_etag_changes_with_content_and_params(self):
+        etag = self.client.get('/api/question-papers/')['ETag']
+        self.assertNotEqual(etag, self.client.get('/api/question-papers/?semester=1')['ETag'])
+
+        University.objects.first().save()
+        response = self.client.get('/api/question-papers/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_detail_supports_if_none_match(self):
+        url = f'/api/news/{News.objects.first().slug}/'
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+
+class HomeFeedTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        create_catalogue(6)
+
+    def test_home_feed_bundles_featured_sections(self):
+        with CaptureQueriesContext(connection) as queries:
+            data = self.client.get('/api/home/').json()
+        self.assertEqual(len(queries), 6)  # one query per section
+        for section in ('featured_jobs', 'featured_events', 'featured_news', 'featured_exams'):
+            self.assertEqual(len(data[section]), 5)
+        self.assertEqual(len(data['universities']), 6)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get('/api/home/')
+        self.assertEqual(len(queries), 0)
+
+
+class SearchTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        create_catalogue(3)
+
+    def test_search_is_ranked_prefix_match(self):
+        News.objects.create(
+            title='Scholarship results', content='Results announced', is_published=True,
+            created_by=News.objects.first().created_by,
+        )
+        data = self.client.get('/api/search/?q=scholar').json()
+        self.assertEqual([r['type'] for r in data['results']], ['news'])
+        self.assertEqual(data['results'][0]['item']['title'], 'Scholarship results')
+
+        types = {r['type'] for r in self.client.get('/api/search/?q=subject 1').json()['results']}
+        self.assertEqual(types, {'note', 'question_paper'})
+
+    def test_index_follows_saves_and_deletes(self):
+        event = Event.objects.first()
+        event.name = 'Robotics meetup'
+        event.save()
+        self.assertEqual(len(self.client.get('/api/search/?q=robotics&type=event').json()['results']), 1)
+
+        event.is_published = False
+        event.save()
+        self.assertEqual(self.client.get('/api/search/?q=robotics').json()['results'], [])
+
+        event.delete()
+        self.assertEqual(self.client.get('/api/search/?q=robotics').json()['results'], [])
+
+    def test_current_only_drops_past_events(self):
+        Event.objects.filter(name='Event 0').update(event_start=timezone.now() - timedelta(days=1))
+        Event.objects.get(name='Event 0').save()
+        names = {r['item']['name'] for r in self.client.get('/api/search/?q=event&type=event&current_only=1').json()['results']}
+        self.assertEqual(names, {'Event 1', 'Event 2'})
+
+    def test_unknown_type_is_rejected(self):
+        self.assertEqual(self.client.get('/api/search/?q=x&type=bogus').status_code, 400)
+
+    def test_counts_are_capped(self):
+        self.assertEqual(search.count('subject', ['note'], cap=2), 3)
+        self.assertEqual(search.count('subject', ['note'], cap=10), 3)
+
+    def test_migration_indexes_existing_rows(self):
+        # Rows saved before the search index existed have no documents
+        SearchDocument.objects.all().delete()
+        self.assertEqual(self.client.get('/api/search/?q=subject').json()['results'], [])
+
+        migration = import_module('admindashboard.migrations.0026_index_existing_content')
+        state = MigrationLoader(connection).project_state(('admindashboard', '0026_index_existing_content'))
+        migration.index_existing(state.apps, None)
+
+        types = {r['type'] for r in self.client.get('/api/search/?q=subject 1').json()['results']}
+        self.assertEqual(types, {'note', 'question_paper'})
+        self.assertEqual(SearchDocument.objects.count(), search.rebuild_index())
+
+
+@override_settings(SEARCH_WORKERS=3)
+class ThreadedSearchTests(TransactionTestCase):
+    """search_by_kind on the pool: needs committed rows, so no TestCase transaction."""
+
+    def setUp(self):
+        cache.clear()
+        create_catalogue(3)
+
+    def test_pool_threads_answer_and_keep_their_connections(self):
+        kinds = ['note', 'question_paper', 'event']
+        used = []
+        original = search._in_worker
+
+        def recording(func, *args, **kwargs):
+            result = original(func, *args, **kwargs)
+            used.append((threading.get_ident(), connection.connection))
+            return result
+
+        with mock.patch.object(search, '_in_worker', recording):
+            first = search.search_by_kind('subject', kinds, cap=10)
+            second = search.search_by_kind('subject', kinds, cap=10)
+
+        self.assertEqual(first, second)
+        self.assertEqual({kind: count for kind, (_, count) in first.items()}, {'note': 3, 'question_paper': 3, 'event': 0})
+        self.assertEqual(len(first['note'][0]), 3)
+        # 12 sub-queries on at most 3 pool threads, each keeping one open connection
+        self.assertEqual(len(used), 12)
+        self.assertNotIn(threading.get_ident(), {thread for thread, _ in used})
+        self.assertNotIn(None, {conn for _, conn in used})
+        self.assertLessEqual(len({id(conn) for _, conn in used}), 3)
+
+
+class ViewCounterTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(counters.buffer.take)
+        create_catalogue(2)
+
+    def test_views_are_buffered_then_flushed_in_one_update(self):
+        news = News.objects.first()
+        event = Event.objects.first()
+        for _ in range(3):
+            self.client.get(f'/news/{news.slug}/')
+            self.client.get(f'/api/events/{event.pk}/')
+        self.client.post(f'/api/news/{news.slug}/like/')
+        news.refresh_from_db()
+        self.assertEqual(news.views_count, 0)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(counters.flush(), 3)
+        self.assertEqual(len(queries), 3)  # one UPDATE per (model, field, amount)
+        news.refresh_from_db()
+        event.refresh_from_db()
+        self.assertEqual((news.views_count, news.likes_count, event.views_count), (3, 1, 3))
+
+    def test_threshold_triggers_flush(self):
+        note = Note.objects.first()
+        with self.settings(COUNTER_FLUSH_THRESHOLD=2):
+            self.client.get(f'/api/notes/{note.pk}/')
+            self.client.get(f'/api/notes/{note.pk}/')
+        note.refresh_from_db()
+        self.assertEqual(note.views_count, 2)
+
+    def test_api_news_reads_are_counted_by_slug(self):
+        news = News.objects.first()
+        url = f'/api/news/{news.slug}/'
+        etag = self.client.get(url)['ETag']
+        self.client.get(url)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(counters.flush(), 1)
+        self.assertEqual(len(queries), 1)
+        news.refresh_from_db()
+        self.assertEqual(news.views_count, 3)
+
+    def test_a_timer_flushes_a_quiet_buffer(self):
+        with self.settings(COUNTER_FLUSH_INTERVAL=3600):
+            self.client.get(f'/api/events/{Event.objects.first().pk}/')
+        timer = counters.buffer.timer
+        self.assertTrue(timer.is_alive())
+        self.assertEqual((timer.interval, timer.function), (3600, counters.buffer.flush_from_timer))
+
+        self.assertEqual(counters.flush(), 1)
+        self.assertIsNone(counters.buffer.timer)
+        self.assertTrue(timer.finished.is_set())
+
+    def test_likes_are_throttled_per_client(self):
+        url = f'/api/news/{News.objects.first().slug}/like/'
+        with mock.patch.dict(ScopedRateThrottle.THROTTLE_RATES, {'likes': '2/hour'}):
+            statuses = [self.client.post(url).status_code for _ in range(3)]
+            other_client = self.client.post(url, REMOTE_ADDR='10.0.0.2').status_code
+        self.assertEqual(statuses, [202, 202, 429])
+        self.assertEqual(other_client, 202)
+        self.assertEqual(counters.flush(), 1)
+        self.assertEqual(News.objects.first().likes_count, 3)
+
+
+class ImageVariantFieldTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.profile = User.objects.create_user('author', 'author@example.com', 'x').userprofile
+
+    def test_news_lists_variants_and_falls_back_to_a_small_thumbnail(self):
+        News.objects.create(title='Pic', content='x', is_published=True, created_by=self.profile, image='news/pic.png')
+        News.objects.create(title='Plain', content='x', is_published=True, created_by=self.profile)
+        items = {item['title']: item for item in self.client.get('/api/news/').json()['results']}
+
+        variants = items['Pic']['image_variants']
+        self.assertEqual([v['width'] for v in variants['webp']], [320, 640, 1280])
+        self.assertEqual(variants['jpeg'][0]['url'], 'http://testserver/images/320/jpeg/news/pic.png')
+        self.assertEqual(items['Pic']['thumbnail'], 'http://testserver/images/320/webp/news/pic.png')
+        self.assertIsNone(items['Plain']['image_variants'])
+        self.assertIsNone(items['Plain']['thumbnail'])
+
+
+class ChunkedUploadTests(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        overrides = override_settings(
+            MEDIA_ROOT=os.path.join(directory.name, 'media'),
+            CHUNKED_UPLOAD_DIR=os.path.join(directory.name, 'chunks'),
+            CHUNKED_UPLOAD_CHUNK_SIZE=4,
+        )
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        create_catalogue(1)
+        self.content = b'%PDF-scanned-paper'
+        self.fields = {
+            'kind': 'question_paper', 'filename': 'paper.pdf', 'size': len(self.content),
+            'sha256': hashlib.sha256(self.content).hexdigest(), 'subject': 'Maths',
+            'degree': Degree.objects.get().pk, 'semester': 1, 'year': 2024,
+            'university_id': University.objects.get().pk, 'created_by': User.objects.get().userprofile.pk,
+        }
+
+    def put_chunk(self, upload_id, start, data):
+        return self.client.put(
+            f'/api/uploads/{upload_id}/', data, content_type='application/octet-stream',
+            HTTP_CONTENT_RANGE=f'bytes {start}-{start + len(data) - 1}/{len(self.content)}',
+        )
+
+    def test_resumable_upload_creates_paper_on_completion(self):
+        upload = self.client.post('/api/uploads/', self.fields).json()
+        papers = QuestionPaper.objects.count()
+
+        self.assertEqual(self.put_chunk(upload['id'], 0, self.content[:4]).json()['offset'], 4)
+        # A gap is refused with the offset to resume from
+        response = self.put_chunk(upload['id'], 8, self.content[8:12])
+        self.assertEqual((response.status_code, response.json()['offset']), (409, 4))
+        # Re-sending a chunk is harmless
+        self.put_chunk(upload['id'], 0, self.content[:4])
+        self.assertEqual(self.client.get(f'/api/uploads/{upload["id"]}/').json()['offset'], 4)
+
+        self.assertEqual(self.client.post(f'/api/uploads/{upload["id"]}/complete/').status_code, 400)
+        self.assertEqual(QuestionPaper.objects.count(), papers)
+
+        for start in range(4, len(self.content), 4):
+            self.put_chunk(upload['id'], start, self.content[start:start + 4])
+        response = self.client.post(f'/api/uploads/{upload["id"]}/complete/')
+        self.assertEqual(response.status_code, 201)
+        paper = QuestionPaper.objects.get(pk=response.json()['id'])
+        self.assertEqual(paper.file_path.read(), self.content)
+
+    def test_second_complete_is_not_a_server_error(self):
+        upload = self.client.post('/api/uploads/', self.fields).json()
+        for start in range(0, len(self.content), 4):
+            self.put_chunk(upload['id'], start, self.content[start:start + 4])
+        # A concurrent complete that loaded the row before this one finished
+        stale = ChunkedUpload.objects.get(pk=upload['id'])
+        self.assertEqual(self.client.post(f'/api/uploads/{upload["id"]}/complete/').status_code, 201)
+
+        self.assertEqual(self.client.post(f'/api/uploads/{upload["id"]}/complete/').status_code, 404)
+        with self.assertRaisesMessage(uploads.UploadError, 'Upload already completed.'):
+            uploads.complete_upload(stale)
+        self.assertEqual(QuestionPaper.objects.filter(subject='Maths').count(), 1)
+
+    def test_empty_chunk_body_is_rejected(self):
+        upload = self.client.post('/api/uploads/', self.fields).json()
+        response = self.client.put(
+            f'/api/uploads/{upload["id"]}/', b'', content_type='application/octet-stream',
+            HTTP_CONTENT_RANGE=f'bytes 0-3/{len(self.content)}',
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_checksum_mismatch_is_rejected(self):
+        upload = self.client.post('/api/uploads/', {**self.fields, 'sha256': '0' * 64}).json()
+        for start in range(0, len(self.content), 4):
+            self.put_chunk(upload['id'], start, self.content[start:start + 4])
+        response = self.client.post(f'/api/uploads/{upload["id"]}/complete/')
+        self.assertEqual(response.json()['detail'], 'Checksum mismatch.')
+
+    def test_invalid_metadata_is_rejected_up_front(self):
+        with self.assertLogs('api.uploads', 'INFO') as logs:
+            response = self.client.post('/api/uploads/', {**self.fields, 'semester': 'first'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('Upload rejected: invalid field values', logs.output[0])
+
+    def test_unknown_profile_is_logged(self):
+        with self.assertLogs('api.uploads', 'INFO') as logs:
+            response = self.client.post('/api/uploads/', {**self.fields, 'created_by': 999})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(logs.output, ['INFO:api.uploads:Upload rejected: user profile 999 does not exist'])
+
+    def test_duplicate_content_is_stored_once(self):
+        profile = User.objects.get().userprofile.pk
+        paper_fields = {k: v for k, v in self.fields.items() if k not in ('kind', 'filename', 'size', 'sha256')}
+        note_fields = {
+            'title': 'Notes', 'degree': self.fields['degree'], 'semester': 1, 'year': 2024,
+            'university': self.fields['university_id'], 'uploaded_by': profile,
+        }
+
+        def upload(url, fields):
+            return self.client.post(url, {**fields, 'file': SimpleUploadedFile('scan.pdf', self.content)})
+
+        first = upload('/api/question-papers/upload/', paper_fields)
+        self.assertEqual(first.status_code, 201)
+        again = upload('/api/question-papers/upload/', paper_fields)
+        self.assertEqual((again.status_code, again.json()['id']), (200, first.json()['id']))
+
+        # Known content is not even transferred by the chunked API
+        response = self.client.post('/api/uploads/', self.fields)
+        self.assertEqual((response.status_code, response.json()['id']), (200, first.json()['id']))
+
+        note = upload('/api/notes/upload/', note_fields)
+        self.assertEqual(note.status_code, 201)
+        blob = FileBlob.objects.get()
+        self.assertEqual(blob.ref_count, 2)
+        self.assertEqual(Note.objects.get(pk=note.json()['id']).file.name, blob.name)
+
+        QuestionPaper.objects.get(pk=first.json()['id']).delete()
+        self.assertTrue(default_storage.exists(blob.name))
+        Note.objects.get(pk=note.json()['id']).delete()
+        self.assertFalse(default_storage.exists(blob.name))
+        self.assertFalse(FileBlob.objects.exists())
+
+    def test_concurrent_uploads_keep_the_stored_file(self):
+        sha256 = hashlib.sha256(self.content).hexdigest()
+        name = uploads.blob_name(sha256, 'scan.pdf')
+        get_or_create = FileBlob.objects.get_or_create
+
+        def racing(copy):
+            # Another upload of the same bytes registers its copy first
+            def get_or_create_after_other(**kwargs):
+                FileBlob.objects.create(sha256=sha256, name=copy, size=len(self.content))
+                return get_or_create(**kwargs)
+            return mock.patch.object(FileBlob.objects, 'get_or_create', side_effect=get_or_create_after_other)
+
+        # The other upload wrote the content-addressed file: it is not ours to delete
+        default_storage.save(name, SimpleUploadedFile('scan.pdf', self.content))
+        other = default_storage.save(name, SimpleUploadedFile('scan.pdf', self.content))
+        with racing(other):
+            blob = uploads.store_blob(SimpleUploadedFile('scan.pdf', self.content), sha256)
+        self.assertEqual(blob.name, other)
+        self.assertTrue(default_storage.exists(name))
+
+        # The copy this call wrote is removed when it loses
+        FileBlob.objects.all().delete()
+        default_storage.delete(name)
+        with racing(other):
+            uploads.store_blob(SimpleUploadedFile('scan.pdf', self.content), sha256)
+        self.assertFalse(default_storage.exists(name))
+        self.assertTrue(default_storage.exists(other))
+
+
+@override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend', TASK_RETRY_DELAY=0)
+class TaskQueueTests(TestCase):
+    def register(self):
+        return self.client.post('/api/auth/register/', {
+            'username': 'student', 'email': 'student@example.com',
+            'password': 'a-long-password-1', 'password2': 'a-long-password-1',
+        })
+
+    def test_registration_queues_verification_email(self):
+        self.assertEqual(self.register().status_code, 201)
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(QueuedTask.objects.get().task, 'send_verification_email')
+
+        self.assertEqual(task_queue.run_pending(), (1, 0))
+        self.assertEqual(mail.outbox[0].to, ['student@example.com'])
+        self.assertFalse(QueuedTask.objects.exists())
+
+    def test_failures_are_retried_then_dead_lettered(self):
+        self.register()
+        User.objects.all().delete()  # the task can no longer succeed
+        with self.settings(TASK_MAX_ATTEMPTS=2):
+            self.assertEqual(task_queue.run_pending(), (0, 1))
+            self.assertEqual(QueuedTask.objects.get().attempts, 1)
+            self.assertEqual(task_queue.run_pending(), (0, 1))
+        self.assertFalse(QueuedTask.objects.exists())
+        self.assertIn('DoesNotExist', FailedTask.objects.get().error)
+
+    def test_claimed_tasks_are_not_picked_up_twice(self):
+        self.register()
+        self.assertEqual(len(task_queue.claim(10)), 1)
+        self.assertEqual(task_queue.claim(10), [])
+
+
+class LoggingConfigTests(TestCase):
+    def test_logging_config_loads(self):
+        logging.config.dictConfig(settings.LOGGING)
+        self.assertEqual(logging.getLogger('api').level, logging.getLevelName(os.environ.get('LOG_LEVEL_API', 'INFO')))
+        # Module loggers inherit the app level and reach the console handler through the root
+        self.assertTrue(logging.getLogger('api.uploads').isEnabledFor(logging.INFO))
+        self.assertTrue(logging.getLogger('api.uploads').hasHandlers())
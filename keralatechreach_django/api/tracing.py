@@ -0,0 +1,42 @@
+import logging
+import random
+
+from django.conf import settings
+
+logger = logging.getLogger('api.trace')
+
+# Headers that must never end up in a log file
+REDACTED_HEADERS = {'authorization', 'cookie', 'x-csrftoken'}
+
+
+def should_trace(request):
+    """
+    Decide whether this request's payload gets traced.
+
+    Only API_TRACE_SAMPLE_PERCENT percent of requests are sampled, and only
+    when the ``api.trace`` logger is enabled for DEBUG, so the common case
+    costs one level check.
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return False
+    percent = getattr(settings, 'API_TRACE_SAMPLE_PERCENT', 0)
+    return percent > 0 and random.random() * 100 < percent
+
+
+def trace_request(request, view_name):
+    """Log the content type, headers, fields and files of a sampled request."""
+    if not should_trace(request):
+        return
+    headers = {
+        name: ('<redacted>' if name.lower() in REDACTED_HEADERS else value)
+        for name, value in request.headers.items()
+    }
+    files = {
+        name: (upload.name, upload.size, upload.content_type)
+        for name, upload in request.FILES.items()
+    }
+    logger.debug(
+        '%s %s %s content_type=%s headers=%s data=%s files=%s',
+        view_name, request.method, request.path, request.content_type,
+        headers, dict(request.data.items()), files,
+    )
@@ -0,0 +1,288 @@
+"""
+Creating QuestionPaper and Note rows from uploaded files.
+
+The multipart upload views and the resumable chunked upload API share the
+field validation below. Chunked uploads are written block by block to a
+temporary file under CHUNKED_UPLOAD_DIR and only become a QuestionPaper or
+Note once every byte has arrived and the SHA-256 matches.
+
+Files are stored once per content (FileBlob): the SHA-256 is computed
+while the upload streams in, a file already on disk is reused, and
+uploading a file that is already a question paper (or note) returns that
+object instead of creating another.
+"""
+import hashlib
+import logging
+import os
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.core.files.uploadhandler import MemoryFileUploadHandler, TemporaryFileUploadHandler
+from django.db import transaction
+from django.db.models import F, Q
+
+from admindashboard.models import QuestionPaper, Note, UserProfile, FileBlob
+
+logger = logging.getLogger(__name__)
+
+BLOCK_SIZE = 64 * 1024
+
+
+class UploadError(Exception):
+    def __init__(self, detail):
+        super().__init__(detail)
+        self.detail = detail
+
+
+def _require(data, names):
+    for name in names:
+        if not data.get(name):
+            raise UploadError(f'Missing {name}.')
+
+
+def _profile(profile_id):
+    try:
+        return UserProfile.objects.get(id=int(profile_id))
+    except UserProfile.DoesNotExist:
+        logger.info('Upload rejected: user profile %s does not exist', profile_id)
+        raise UploadError('Invalid user profile ID.')
+
+
+def _ints(values):
+    try:
+        return [int(value) for value in values]
+    except ValueError as e:
+        logger.info('Upload rejected: invalid field values (%s)', e)
+        raise UploadError(f'Invalid field values: {str(e)}')
+
+
+def question_paper_fields(data):
+    _require(data, ['subject', 'degree', 'semester', 'year', 'university_id'])
+    degree_id, semester, year, university_id, created_by_id = _ints([
+        data.get('degree'), data.get('semester'), data.get('year'), data.get('university_id'),
+        data.get('created_by', 1),  # Default to admin user if no created_by is provided
+    ])
+    logger.debug(
+        'Creating QuestionPaper degree_id=%s semester=%s year=%s university_id=%s',
+        degree_id, semester, year, university_id,
+    )
+    return {
+        'subject': data.get('subject'),
+        'degree_id': degree_id,
+        'semester': semester,
+        'year': year,
+        'university_id_id': university_id,
+        'is_published': True,
+        'created_by': _profile(created_by_id),
+    }
+
+
+def note_fields(data):
+    _require(data, ['title', 'degree', 'semester', 'year', 'university'])
+    degree_id, semester, year, university_id, uploaded_by_id = _ints([
+        data.get('degree'), data.get('semester'), data.get('year'), data.get('university'),
+        data.get('uploaded_by', 1),  # Default to admin user if no uploaded_by is provided
+    ])
+    logger.debug(
+        'Creating Note title=%s degree_id=%s semester=%s year=%s university_id=%s',
+        data.get('title'), degree_id, semester, year, university_id,
+    )
+    return {
+        'title': data.get('title'),
+        # Try subject first, then module
+        'subject': data.get('subject') or data.get('module', ''),
+        'degree_id': degree_id,
+        'semester': semester,
+        'year': year,
+        'university_id': university_id,
+        'uploaded_by': _profile(uploaded_by_id),
+        'is_published': True,
+    }
+
+
+# kind -> (model, file field, fields from form data)
+UPLOAD_TARGETS = {
+    'question_paper': (QuestionPaper, 'file_path', question_paper_fields),
+    'note': (Note, 'file', note_fields),
+}
+
+
+# Content-addressed storage
+
+class HashingUploadHandlerMixin:
+    """Sets `sha256` on the uploaded file, computed from the chunks this handler stores."""
+
+    def new_file(self, *args, **kwargs):
+        self.digest = hashlib.sha256()
+        super().new_file(*args, **kwargs)
+
+    def receive_data_chunk(self, raw_data, start):
+        remaining = super().receive_data_chunk(raw_data, start)
+        if remaining is None:  # stored by this handler
+            self.digest.update(raw_data)
+        return remaining
+
+    def file_complete(self, file_size):
+        file_obj = super().file_complete(file_size)
+        if file_obj is not None:
+            file_obj.sha256 = self.digest.hexdigest()
+        return file_obj
+
+
+class HashingMemoryFileUploadHandler(HashingUploadHandlerMixin, MemoryFileUploadHandler):
+    pass
+
+
+class HashingTemporaryFileUploadHandler(HashingUploadHandlerMixin, TemporaryFileUploadHandler):
+    pass
+
+
+class HashingUploadMixin:
+    """For upload views: hash files as the multipart body is parsed."""
+
+    def initialize_request(self, request, *args, **kwargs):
+        request.upload_handlers = [
+            HashingMemoryFileUploadHandler(request),
+            HashingTemporaryFileUploadHandler(request),
+        ]
+        return super().initialize_request(request, *args, **kwargs)
+
+
+def blob_name(sha256, filename):
+    extension = os.path.splitext(filename)[1].lower()
+    return f'files/{sha256[:2]}/{sha256}{extension}'
+
+
+def find_duplicate(kind, sha256):
+    """The existing QuestionPaper or Note of this kind with the same content, if any."""
+    model, file_field, _ = UPLOAD_TARGETS[kind]
+    blob = FileBlob.objects.filter(sha256=sha256).first()
+    if blob is None:
+        return None
+    return model.objects.filter(**{file_field: blob.name}).first()
+
+
+def store_blob(file_obj, sha256):
+    """
+    Return the FileBlob for this content, writing the file only if it is new.
+
+    A file already stored under the content-addressed name holds these
+    bytes: admindashboard.pdfs moves linearized PDFs to the name of their
+    new hash while the FileBlob keeps the upload's hash. It is reused, not
+    saved again under a suffixed name.
+    """
+    name = blob_name(sha256, file_obj.name)
+    blob = FileBlob.objects.filter(Q(sha256=sha256) | Q(name=name)).first()
+    if blob is not None:
+        return blob
+    saved = not default_storage.exists(name)
+    if saved:
+        name = default_storage.save(name, file_obj)
+    blob, created = FileBlob.objects.get_or_create(sha256=sha256, defaults={'name': name, 'size': file_obj.size})
+    if saved and not created and blob.name != name:
+        # A concurrent upload of the same content won; only the copy this
+        # call wrote is ours to delete
+        default_storage.delete(name)
+    return blob
+
+
+def release_blob(name):
+    """Drop one reference to the stored file `name`, deleting it with the last one."""
+    if not name:
+        return
+    FileBlob.objects.filter(name=name, ref_count__gt=0).update(ref_count=F('ref_count') - 1)
+    for blob in FileBlob.objects.filter(name=name, ref_count=0):
+        default_storage.delete(blob.name)
+        blob.delete()
+
+
+def create_from_upload(kind, data, file_obj, sha256=None):
+    """
+    Validate `data` and create the QuestionPaper or Note for `file_obj`.
+
+    Returns (object, created); created is False when the same file was
+    already uploaded as this kind. Raises UploadError.
+    """
+    model, file_field, fields = UPLOAD_TARGETS[kind]
+    values = fields(data)
+
+    sha256 = sha256 or getattr(file_obj, 'sha256', None)
+    if sha256 is None:
+        digest = hashlib.sha256()
+        for chunk in file_obj.chunks():
+            digest.update(chunk)
+        sha256 = digest.hexdigest()
+
+    duplicate = find_duplicate(kind, sha256)
+    if duplicate is not None:
+        return duplicate, False
+
+    blob = store_blob(file_obj, sha256)
+    with transaction.atomic():
+        obj = model.objects.create(**{file_field: blob.name}, **values)
+        FileBlob.objects.filter(pk=blob.pk).update(ref_count=F('ref_count') + 1)
+    return obj, True
+
+
+# Chunked uploads
+
+def chunk_path(upload):
+    return os.path.join(settings.CHUNKED_UPLOAD_DIR, f'{upload.pk}.part')
+
+
+def write_chunk(upload, start, stream, length):
+    """
+    Copy `length` bytes from `stream` into the upload's file at `start`.
+
+    Writing at an explicit offset makes re-sending a chunk after a dropped
+    connection harmless. Returns the number of bytes written.
+    """
+    path = chunk_path(upload)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    written = 0
+    with open(path, 'r+b' if os.path.exists(path) else 'wb') as destination:
+        destination.seek(start)
+        while written < length:
+            block = stream.read(min(BLOCK_SIZE, length - written))
+            if not block:
+                break
+            destination.write(block)
+            written += len(block)
+    return written
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as source:
+        for block in iter(lambda: source.read(BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def discard_chunks(upload):
+    try:
+        os.remove(chunk_path(upload))
+    except FileNotFoundError:
+        pass
+
+
+def complete_upload(upload):
+    """Verify the assembled file and create its QuestionPaper or Note (see create_from_upload)."""
+    if upload.received != upload.size:
+        raise UploadError(f'Upload incomplete: {upload.received} of {upload.size} bytes received.')
+
+    path = chunk_path(upload)
+    try:
+        sha256 = file_sha256(path)
+    except FileNotFoundError:
+        # Another request completed (or discarded) this upload meanwhile
+        raise UploadError('Upload already completed.')
+    if sha256 != upload.sha256.lower():
+        raise UploadError('Checksum mismatch.')
+
+    with open(path, 'rb') as source:
+        obj, created = create_from_upload(upload.kind, upload.metadata, File(source, name=upload.filename), sha256)
+    discard_chunks(upload)
+    upload.delete()
+    return obj, created
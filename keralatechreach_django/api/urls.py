@@ -14,7 +14,13 @@ from .views import (
     JobViewSet,
     QuestionPaperUploadView,
     NoteUploadView,
+    ChunkedUploadView,
+    ChunkedUploadChunkView,
+    ChunkedUploadCompleteView,
     ContactMessageView,
+    CacheStatsView,
+    HomeFeedView,
+    SearchView,
     AffiliateProductViewSet,
     AffiliateCategoryViewSet,
     EventViewSet,
@@ -64,7 +70,13 @@ urlpatterns = [
     # Upload endpoints - these must come before router.urls to avoid conflicts
     path('question-papers/upload/', QuestionPaperUploadView.as_view(), name='questionpaper-upload'),
     path('notes/upload/', NoteUploadView.as_view(), name='note-upload'),
+    path('uploads/', ChunkedUploadView.as_view(), name='chunked-upload'),
+    path('uploads/<uuid:pk>/', ChunkedUploadChunkView.as_view(), name='chunked-upload-chunk'),
+    path('uploads/<uuid:pk>/complete/', ChunkedUploadCompleteView.as_view(), name='chunked-upload-complete'),
     path('contact/', ContactMessageView.as_view(), name='contact-message'),
+    path('cache-stats/', CacheStatsView.as_view(), name='cache-stats'),
+    path('home/', HomeFeedView.as_view(), name='home-feed'),
+    path('search/', SearchView.as_view(), name='search'),
     
     # Include router URLs last
     path('', include(router.urls)),
@@ -1,5 +1,7 @@
 from rest_framework import viewsets, filters, permissions
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticatedOrReadOnly, AllowAny
+from rest_framework.throttling import ScopedRateThrottle
 from django_filters.rest_framework import DjangoFilterBackend
 from admindashboard.models import (
     QuestionPaper,
@@ -19,7 +21,8 @@ from admindashboard.models import (
     Initiative,
     FAQ,
     ContactUs,
-    UserProfile
+    UserProfile,
+    ChunkedUpload
 )
 from .serializers import (
     QuestionPaperSerializer,
@@ -49,155 +52,156 @@ from datetime import timedelta
 from django.utils import timezone
 from django.template.loader import render_to_string
 from django.utils.html import strip_tags
+from django.contrib.auth import get_user_model
 from django.shortcuts import get_object_or_404, render
+from django.db import transaction
 from django.http import Http404
+import logging
+import os
+import re
+from .tracing import trace_request
+from .cache import CachedResponseMixin, cache_stats
+from .conditional import ConditionalGetMixin
+from .view_counts import ViewCountMixin
+from .uploads import (
+    UPLOAD_TARGETS, UploadError, HashingUploadMixin, create_from_upload, find_duplicate,
+    write_chunk, complete_upload,
+)
+from admindashboard import counters
+from admindashboard.task_queue import enqueue
+from admindashboard.home_feed import build_home_feed
+from admindashboard.search import SEARCHABLE, search, load_objects
+
+logger = logging.getLogger(__name__)
+
+CONTENT_RANGE = re.compile(r'^bytes (\d+)-(\d+)/(\d+)$')
 
-class UniversityViewSet(viewsets.ReadOnlyModelViewSet):
+# News and jobs show created_by_username, read through these
+AUTHOR_MODELS = (UserProfile, get_user_model())
+
+class UniversityViewSet(ConditionalGetMixin, CachedResponseMixin, viewsets.ReadOnlyModelViewSet):
     queryset = University.objects.all()
     serializer_class = UniversitySerializer
+    cache_models = (University,)
+    pagination_ordering = ('name', 'id')
     permission_classes = [AllowAny]
     filter_backends = [filters.SearchFilter]
     search_fields = ['name']
 
-class DegreeViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = Degree.objects.all()
+class DegreeViewSet(ConditionalGetMixin, CachedResponseMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = Degree.objects.select_related('university')
     serializer_class = DegreeSerializer
+    cache_models = (Degree, University)
+    pagination_ordering = ('name', 'id')
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter]
     filterset_fields = ['university']
     search_fields = ['name']
 
-class QuestionPaperViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = QuestionPaper.objects.filter(is_published=True)
+class QuestionPaperViewSet(ViewCountMixin, ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = QuestionPaper.objects.filter(is_published=True).select_related('degree', 'university_id')
     serializer_class = QuestionPaperSerializer
+    conditional_models = (QuestionPaper, Degree, University)
+    pagination_ordering = ('-updated_at', '-id')
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter]
     filterset_fields = ['degree', 'semester', 'year', 'university_id']
     search_fields = ['subject']
 
-class NoteViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = Note.objects.all()
+class NoteViewSet(ViewCountMixin, ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = Note.objects.select_related('degree', 'university')
     serializer_class = NoteSerializer
+    conditional_models = (Note, Degree, University)
+    pagination_ordering = ('-uploaded_at', '-id')
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter]
     filterset_fields = ['degree', 'semester', 'year', 'university']
     search_fields = ['title', 'module']
 
-class ExamViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = Exam.objects.filter(is_published=True)
+class ExamViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = Exam.objects.filter(is_published=True).select_related('degree_name', 'university')
     serializer_class = ExamSerializer
+    conditional_models = (Exam, Degree, University)
+    pagination_ordering = ('-updated_at', '-id')
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter]
     filterset_fields = ['degree_name', 'semester', 'admission_year', 'university']
     search_fields = ['exam_name']
 
-class EntranceNotificationViewSet(viewsets.ReadOnlyModelViewSet):
+class EntranceNotificationViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = EntranceNotification.objects.filter(is_published=True)
     serializer_class = EntranceNotificationSerializer
+    pagination_ordering = ('-published_date', '-id')
     permission_classes = [AllowAny]
     filter_backends = [filters.SearchFilter]
     search_fields = ['title', 'description']
 
-class NewsViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = News.objects.filter(is_published=True)
+class NewsViewSet(ViewCountMixin, ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = News.objects.filter(is_published=True).select_related('created_by__user')
     serializer_class = NewsSerializer
+    conditional_models = (News, *AUTHOR_MODELS)
+    pagination_ordering = ('-created_at', '-id')
     permission_classes = [AllowAny]
     filter_backends = [filters.SearchFilter]
     search_fields = ['title', 'content', 'excerpt']
     lookup_field = 'slug'
+    throttle_scope = 'likes'  # only `like` uses ScopedRateThrottle
+
+    # Anonymous likes are allowed, but each client only gets a few per hour
+    @action(detail=True, methods=['post'], throttle_classes=[ScopedRateThrottle])
+    def like(self, request, slug=None):
+        counters.increment(self.get_object(), 'likes_count')
+        return Response(status=status.HTTP_202_ACCEPTED)
 
-class JobViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = Job.objects.filter(is_published=True)
+class JobViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = Job.objects.filter(is_published=True).select_related('created_by__user')
     serializer_class = JobSerializer
+    conditional_models = (Job, *AUTHOR_MODELS)
+    pagination_ordering = ('-updated_at', '-id')
     permission_classes = [AllowAny]
     filter_backends = [filters.SearchFilter]
     search_fields = ['title', 'description']
 
-class InitiativeViewSet(viewsets.ReadOnlyModelViewSet):
+class InitiativeViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Initiative.objects.filter(is_published=True)
     serializer_class = InitiativeSerializer
+    pagination_ordering = ('-updated_at', '-id')
     permission_classes = [AllowAny]
     filter_backends = [filters.SearchFilter]
     search_fields = ['name', 'description']
 
-class FAQViewSet(viewsets.ReadOnlyModelViewSet):
+class FAQViewSet(ConditionalGetMixin, CachedResponseMixin, viewsets.ReadOnlyModelViewSet):
     queryset = FAQ.objects.filter(is_published=True)
     serializer_class = FAQSerializer
+    cache_models = (FAQ,)
+    pagination_ordering = ('display_order', 'id')
     permission_classes = [AllowAny]
     filter_backends = [filters.SearchFilter]
     search_fields = ['question', 'answer']
 
-class QuestionPaperUploadView(views.APIView):
+def duplicate_response(obj):
+    return Response({'detail': 'File already uploaded.', 'id': obj.id, 'duplicate': True}, status=status.HTTP_200_OK)
+
+class QuestionPaperUploadView(HashingUploadMixin, views.APIView):
     parser_classes = [MultiPartParser, FormParser]
     permission_classes = [AllowAny]  # Allow any user to upload for now
 
     def post(self, request, *args, **kwargs):
-        print("="*80)
-        print("QuestionPaperUploadView.post() called")
-        print(f"Request content type: {request.content_type}")
-        print(f"Request headers: {request.headers}")
-        print(f"Request method: {request.method}")
-        print(f"Request data: {request.data}")
-        print(f"Request files: {request.FILES}")
-        print("="*80)
-        
+        trace_request(request, 'QuestionPaperUploadView')
+
         file_obj = request.FILES.get('file')
-        subject = request.data.get('subject')
-        degree = request.data.get('degree')
-        semester = request.data.get('semester')
-        year = request.data.get('year')
-        university_id = request.data.get('university_id')
-        
-        # Default to admin user if no created_by is provided
-        created_by_id = request.data.get('created_by', 1)
-        
         if not file_obj:
             return Response({'detail': 'Missing file.'}, status=status.HTTP_400_BAD_REQUEST)
-        if not subject:
-            return Response({'detail': 'Missing subject.'}, status=status.HTTP_400_BAD_REQUEST)
-        if not degree:
-            return Response({'detail': 'Missing degree.'}, status=status.HTTP_400_BAD_REQUEST)
-        if not semester:
-            return Response({'detail': 'Missing semester.'}, status=status.HTTP_400_BAD_REQUEST)
-        if not year:
-            return Response({'detail': 'Missing year.'}, status=status.HTTP_400_BAD_REQUEST)
-        if not university_id:
-            return Response({'detail': 'Missing university_id.'}, status=status.HTTP_400_BAD_REQUEST)
-        
+
         try:
-            # Convert to integers if they're strings
-            degree_id = int(degree)
-            semester_val = int(semester)
-            year_val = int(year)
-            university_id_val = int(university_id)
-            created_by_id_val = int(created_by_id)
-            
-            print(f"Creating QuestionPaper with: degree_id={degree_id}, semester={semester_val}, year={year_val}, university_id={university_id_val}")
-            
-            # Get the user profile for created_by
-            user_profile = UserProfile.objects.get(id=created_by_id_val)
-            
-            paper = QuestionPaper.objects.create(
-                file_path=file_obj,
-                subject=subject,
-                degree_id=degree_id,
-                semester=semester_val,
-                year=year_val,
-                university_id_id=university_id_val,
-                is_published=True,
-                created_by=user_profile
-            )
+            paper, created = create_from_upload('question_paper', request.data, file_obj)
+            if not created:
+                return duplicate_response(paper)
             return Response({'detail': 'File uploaded successfully.', 'id': paper.id}, status=status.HTTP_201_CREATED)
-        except UserProfile.DoesNotExist:
-            print("UserProfile does not exist")
-            return Response({'detail': 'Invalid user profile ID.'}, status=status.HTTP_400_BAD_REQUEST)
-        except ValueError as e:
-            print(f"ValueError: {str(e)}")
-            return Response({'detail': f'Invalid field values: {str(e)}'}, status=status.HTTP_400_BAD_REQUEST)
+        except UploadError as e:
+            return Response({'detail': e.detail}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
-            print(f"Exception: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception('Upload failed')
             return Response({'detail': str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
     # Add this to debug why OPTIONS/GET requests might be coming through
@@ -207,84 +211,29 @@ class QuestionPaperUploadView(views.APIView):
     
     def options(self, request, *args, **kwargs):
         response = super().options(request, *args, **kwargs)
-        print("OPTIONS request received", response)
+        logger.debug('OPTIONS %s -> %s', request.path, response.status_code)
         return response
 
-class NoteUploadView(views.APIView):
+class NoteUploadView(HashingUploadMixin, views.APIView):
     parser_classes = [MultiPartParser, FormParser]
     permission_classes = [AllowAny]  # Allow any user to upload for now
 
     def post(self, request, *args, **kwargs):
-        print("="*80)
-        print("NoteUploadView.post() called")
-        print(f"Request content type: {request.content_type}")
-        print(f"Request headers: {request.headers}")
-        print(f"Request method: {request.method}")
-        print(f"Request data: {request.data}")
-        print(f"Request files: {request.FILES}")
-        print("="*80)
-        
+        trace_request(request, 'NoteUploadView')
+
         file_obj = request.FILES.get('file')
-        title = request.data.get('title')
-        subject = request.data.get('subject') or request.data.get('module', '')  # Try subject first, then module
-        module = request.data.get('module', '')  # Get module if available
-        degree = request.data.get('degree')
-        semester = request.data.get('semester')
-        year = request.data.get('year')
-        university = request.data.get('university')
-        
-        # Default to admin user if no uploaded_by is provided
-        uploaded_by_id = request.data.get('uploaded_by', 1)
-        
         if not file_obj:
             return Response({'detail': 'Missing file.'}, status=status.HTTP_400_BAD_REQUEST)
-        if not title:
-            return Response({'detail': 'Missing title.'}, status=status.HTTP_400_BAD_REQUEST)
-        if not degree:
-            return Response({'detail': 'Missing degree.'}, status=status.HTTP_400_BAD_REQUEST)
-        if not semester:
-            return Response({'detail': 'Missing semester.'}, status=status.HTTP_400_BAD_REQUEST)
-        if not year:
-            return Response({'detail': 'Missing year.'}, status=status.HTTP_400_BAD_REQUEST)
-        if not university:
-            return Response({'detail': 'Missing university.'}, status=status.HTTP_400_BAD_REQUEST)
-        
+
         try:
-            # Convert to integers if they're strings
-            degree_id = int(degree)
-            semester_val = int(semester)
-            year_val = int(year)
-            university_id = int(university)
-            uploaded_by_id_val = int(uploaded_by_id)
-            
-            print(f"Creating Note with: title={title}, degree_id={degree_id}, semester={semester_val}, year={year_val}, university_id={university_id}")
-            
-            # Get the user profile for uploaded_by
-            user_profile = UserProfile.objects.get(id=uploaded_by_id_val)
-            
-            # Create the note with all required fields
-            note = Note.objects.create(
-                file=file_obj,
-                title=title,
-                subject=subject or module,  # Use subject if available, otherwise module
-                degree_id=degree_id,
-                semester=semester_val,
-                year=year_val,
-                university_id=university_id,
-                uploaded_by=user_profile,
-                is_published=True
-            )
+            note, created = create_from_upload('note', request.data, file_obj)
+            if not created:
+                return duplicate_response(note)
             return Response({'detail': 'File uploaded successfully.', 'id': note.id}, status=status.HTTP_201_CREATED)
-        except UserProfile.DoesNotExist:
-            print("UserProfile does not exist")
-            return Response({'detail': 'Invalid user profile ID.'}, status=status.HTTP_400_BAD_REQUEST)
-        except ValueError as e:
-            print(f"ValueError: {str(e)}")
-            return Response({'detail': f'Invalid field values: {str(e)}'}, status=status.HTTP_400_BAD_REQUEST)
+        except UploadError as e:
+            return Response({'detail': e.detail}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
-            print(f"Exception: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception('Upload failed')
             return Response({'detail': str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
     # Add this to debug why OPTIONS/GET requests might be coming through
@@ -294,9 +243,202 @@ class NoteUploadView(views.APIView):
     
     def options(self, request, *args, **kwargs):
         response = super().options(request, *args, **kwargs)
-        print("OPTIONS request received", response)
+        logger.debug('OPTIONS %s -> %s', request.path, response.status_code)
         return response
 
+class ChunkedUploadView(views.APIView):
+    """
+    Start a resumable upload.
+
+    POST {kind, filename, size, sha256, <question paper / note fields>}
+    returns the upload id; the file is then sent with PUT requests to
+    /api/uploads/<id>/ and finished with POST /api/uploads/<id>/complete/.
+    """
+    permission_classes = [AllowAny]  # Same as the multipart upload views
+
+    def post(self, request, *args, **kwargs):
+        trace_request(request, 'ChunkedUploadView')
+
+        kind = request.data.get('kind')
+        if kind not in UPLOAD_TARGETS:
+            return Response({'detail': 'Invalid kind.'}, status=status.HTTP_400_BAD_REQUEST)
+        for name in ('filename', 'size', 'sha256'):
+            if not request.data.get(name):
+                return Response({'detail': f'Missing {name}.'}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            size = int(request.data['size'])
+        except ValueError:
+            return Response({'detail': 'Invalid size.'}, status=status.HTTP_400_BAD_REQUEST)
+        if size <= 0 or size > settings.CHUNKED_UPLOAD_MAX_SIZE:
+            return Response({'detail': 'Invalid size.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        metadata = {
+            name: value for name, value in request.data.items()
+            if name not in ('kind', 'filename', 'size', 'sha256')
+        }
+        try:
+            # Reject bad metadata now rather than after the whole file arrived
+            UPLOAD_TARGETS[kind][2](metadata)
+        except UploadError as e:
+            return Response({'detail': e.detail}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Same content already uploaded: nothing needs to be sent
+        duplicate = find_duplicate(kind, request.data['sha256'].lower())
+        if duplicate is not None:
+            return duplicate_response(duplicate)
+
+        upload = ChunkedUpload.objects.create(
+            kind=kind,
+            filename=os.path.basename(request.data['filename']),
+            size=size,
+            sha256=request.data['sha256'],
+            metadata=metadata,
+        )
+        return Response({
+            'id': str(upload.pk),
+            'offset': 0,
+            'chunk_size': settings.CHUNKED_UPLOAD_CHUNK_SIZE,
+        }, status=status.HTTP_201_CREATED)
+
+class ChunkedUploadChunkView(views.APIView):
+    """
+    GET reports how many bytes have arrived (to resume). PUT writes the raw
+    request body at the offset given by its Content-Range header
+    ("bytes <start>-<end>/<size>"); the body is streamed to disk, never
+    buffered whole.
+    """
+    permission_classes = [AllowAny]
+
+    def progress(self, upload, status_code=status.HTTP_200_OK):
+        return Response({'id': str(upload.pk), 'offset': upload.received, 'size': upload.size}, status=status_code)
+
+    def get(self, request, pk, *args, **kwargs):
+        return self.progress(get_object_or_404(ChunkedUpload, pk=pk))
+
+    def put(self, request, pk, *args, **kwargs):
+        upload = get_object_or_404(ChunkedUpload, pk=pk)
+        match = CONTENT_RANGE.match(request.headers.get('Content-Range', ''))
+        if not match:
+            return Response({'detail': 'Missing or invalid Content-Range.'}, status=status.HTTP_400_BAD_REQUEST)
+        start, end, total = (int(group) for group in match.groups())
+        length = end - start + 1
+        if total != upload.size or end >= upload.size or length <= 0:
+            return Response({'detail': 'Content-Range does not match the upload.'}, status=status.HTTP_400_BAD_REQUEST)
+        if length > settings.CHUNKED_UPLOAD_CHUNK_SIZE:
+            return Response({'detail': 'Chunk too large.'}, status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        if start > upload.received:
+            # A chunk is missing; tell the client where to resume
+            return self.progress(upload, status.HTTP_409_CONFLICT)
+
+        # DRF's stream is None for an empty body; the length check rejects it
+        written = write_chunk(upload, start, request.stream, length) if request.stream is not None else 0
+        if written != length:
+            return Response({'detail': 'Chunk body shorter than Content-Range.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        ChunkedUpload.objects.filter(pk=upload.pk, received__lt=end + 1).update(
+            received=end + 1, updated_at=timezone.now()
+        )
+        upload.refresh_from_db()
+        return self.progress(upload)
+
+class ChunkedUploadCompleteView(views.APIView):
+    permission_classes = [AllowAny]
+
+    def post(self, request, pk, *args, **kwargs):
+        try:
+            with transaction.atomic():
+                # A concurrent complete waits here, then finds the upload gone
+                upload = get_object_or_404(ChunkedUpload.objects.select_for_update(), pk=pk)
+                obj, created = complete_upload(upload)
+        except UploadError as e:
+            return Response({'detail': e.detail}, status=status.HTTP_400_BAD_REQUEST)
+        if not created:
+            return duplicate_response(obj)
+        return Response({'detail': 'File uploaded successfully.', 'id': obj.id}, status=status.HTTP_201_CREATED)
+
+class HomeFeedView(views.APIView):
+    """
+    API endpoint that returns every home screen section in one response
+    """
+    permission_classes = [AllowAny]
+
+    sections = {
+        'featured_jobs': (5, JobSerializer),
+        'featured_events': (5, EventSerializer),
+        'featured_news': (5, NewsSerializer),
+        'featured_exams': (5, ExamSerializer),
+        'universities': (None, UniversitySerializer),
+        'faqs': (None, FAQSerializer),
+    }
+
+    def get(self, request, *args, **kwargs):
+        feed = build_home_feed({name: limit for name, (limit, _) in self.sections.items()})
+        context = {'request': request}
+        return Response({
+            name: serializer_class(feed[name], many=True, context=context).data
+            for name, (_, serializer_class) in self.sections.items()
+        })
+
+class SearchView(views.APIView):
+    """
+    API endpoint for ranked full-text search across content types
+    """
+    permission_classes = [AllowAny]
+    max_limit = 50
+
+    serializers = {
+        'news': NewsSerializer,
+        'event': EventSerializer,
+        'exam': ExamSerializer,
+        'note': NoteSerializer,
+        'question_paper': QuestionPaperSerializer,
+        'initiative': InitiativeSerializer,
+        'entrance_notification': EntranceNotificationSerializer,
+    }
+
+    def get_int(self, name, default):
+        try:
+            return max(int(self.request.query_params.get(name, default)), 0)
+        except ValueError:
+            return default
+
+    def get(self, request, *args, **kwargs):
+        query = request.query_params.get('q', '')
+        kinds = [kind for kind in request.query_params.get('type', '').split(',') if kind]
+        unknown = set(kinds) - set(SEARCHABLE)
+        if unknown:
+            return Response(
+                {'error': f"Unknown type: {', '.join(sorted(unknown))}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        limit = min(self.get_int('limit', 20), self.max_limit)
+        offset = self.get_int('offset', 0)
+        current_only = request.query_params.get('current_only', '').lower() in ('1', 'true')
+        hits = search(query, kinds=kinds, current_only=current_only, limit=limit, offset=offset)
+
+        context = {'request': request}
+        return Response({
+            'query': query,
+            'results': [
+                {
+                    'type': kind,
+                    'score': score,
+                    'item': self.serializers[kind](obj, context=context).data,
+                }
+                for kind, obj, score in load_objects(hits)
+            ],
+        })
+
+class CacheStatsView(views.APIView):
+    """
+    Hit/miss counters of the API response cache
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        return Response(cache_stats())
+
 class ContactMessageView(views.APIView):
     permission_classes = [AllowAny]  # Changed from IsAuthenticatedOrReadOnly to AllowAny
 
@@ -311,72 +453,97 @@ class ContactMessageView(views.APIView):
             )
             return Response({'detail': 'Message sent successfully.'}, status=status.HTTP_201_CREATED)
         except Exception as e:
-            print(f"Error sending message: {str(e)}")
+            logger.exception('Error saving contact message')
             return Response({'detail': f'Failed to send message: {str(e)}'}, status=status.HTTP_400_BAD_REQUEST)
 
-class AffiliateProductViewSet(viewsets.ReadOnlyModelViewSet):
+class AffiliateProductViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = AffiliateProduct.objects.all()
     serializer_class = AffiliateProductSerializer
+    pagination_ordering = ('-id',)
     permission_classes = [IsAuthenticatedOrReadOnly]
 
-class AffiliateCategoryViewSet(viewsets.ReadOnlyModelViewSet):
+class AffiliateCategoryViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = AffiliateCategory.objects.all()
     serializer_class = AffiliateCategorySerializer
+    pagination_ordering = ('name', 'id')
     permission_classes = [IsAuthenticatedOrReadOnly]
 
-class EventViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = Event.objects.filter(is_published=True)
+class EventViewSet(ViewCountMixin, ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = Event.objects.filter(is_published=True).select_related('category', 'district')
     serializer_class = EventSerializer
+    conditional_models = (Event, EventCategory, District)
+    pagination_ordering = ('-updated_at', '-id')
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter]
-    filterset_fields = ['category', 'district', 'event_start']
+    # event_start__date lets the app filter by day and still page through the matches
+    filterset_fields = {'category': ['exact'], 'district': ['exact'], 'event_start': ['exact', 'date']}
     search_fields = ['name', 'description', 'place']
 
-class EventCategoryViewSet(viewsets.ReadOnlyModelViewSet):
+class EventCategoryViewSet(ConditionalGetMixin, CachedResponseMixin, viewsets.ReadOnlyModelViewSet):
     queryset = EventCategory.objects.all()
     serializer_class = EventCategorySerializer
+    cache_models = (EventCategory,)
+    pagination_ordering = ('category', 'id')
     permission_classes = [AllowAny]
     filter_backends = [filters.SearchFilter]
     search_fields = ['category']
 
-class DistrictViewSet(viewsets.ReadOnlyModelViewSet):
+class DistrictViewSet(ConditionalGetMixin, CachedResponseMixin, viewsets.ReadOnlyModelViewSet):
     queryset = District.objects.filter(is_active=True)
     serializer_class = DistrictSerializer
+    cache_models = (District,)
+    pagination_ordering = ('name', 'id')
     permission_classes = [AllowAny]
     filter_backends = [filters.SearchFilter]
     search_fields = ['name']
 
-class FeaturedExamsViewSet(viewsets.ReadOnlyModelViewSet):
+class FeaturedExamsViewSet(ConditionalGetMixin, CachedResponseMixin, viewsets.ReadOnlyModelViewSet):
     """
     API endpoint that returns exams marked to show on the home page
     """
-    queryset = Exam.objects.filter(show_on_home=True, is_published=True).order_by('exam_date')[:5]
+    queryset = Exam.objects.filter(show_on_home=True, is_published=True).select_related(
+        'degree_name', 'university'
+    ).order_by('exam_date')[:5]
     serializer_class = ExamSerializer
+    cache_models = (Exam, Degree, University)
     permission_classes = [permissions.AllowAny]
+    pagination_class = None  # already capped at 5 rows
 
-class FeaturedJobsViewSet(viewsets.ReadOnlyModelViewSet):
+class FeaturedJobsViewSet(ConditionalGetMixin, CachedResponseMixin, viewsets.ReadOnlyModelViewSet):
     """
     API endpoint that returns jobs marked to show on the home page
     """
-    queryset = Job.objects.filter(is_published=True).order_by('-updated_at')[:5]
+    queryset = Job.objects.filter(is_published=True).select_related(
+        'created_by__user'
+    ).order_by('-updated_at')[:5]
     serializer_class = JobSerializer
+    cache_models = (Job, *AUTHOR_MODELS)
     permission_classes = [permissions.AllowAny]
+    pagination_class = None  # already capped at 5 rows
 
-class FeaturedEventsViewSet(viewsets.ReadOnlyModelViewSet):
+class FeaturedEventsViewSet(ConditionalGetMixin, CachedResponseMixin, viewsets.ReadOnlyModelViewSet):
     """
     API endpoint that returns events marked to show on the home page
     """
-    queryset = Event.objects.filter(is_published=True).order_by('event_start')[:5]
+    queryset = Event.objects.filter(is_published=True).select_related(
+        'category', 'district'
+    ).order_by('event_start')[:5]
     serializer_class = EventSerializer
+    cache_models = (Event, EventCategory, District)
     permission_classes = [permissions.AllowAny]
+    pagination_class = None  # already capped at 5 rows
 
-class FeaturedNewsViewSet(viewsets.ReadOnlyModelViewSet):
+class FeaturedNewsViewSet(ConditionalGetMixin, CachedResponseMixin, viewsets.ReadOnlyModelViewSet):
     """
     API endpoint that returns news articles marked to show on the home page
     """
-    queryset = News.objects.filter(is_published=True).order_by('-created_at')[:5]
+    queryset = News.objects.filter(is_published=True).select_related(
+        'created_by__user'
+    ).order_by('-created_at')[:5]
     serializer_class = NewsSerializer
+    cache_models = (News, *AUTHOR_MODELS)
     permission_classes = [permissions.AllowAny]
+    pagination_class = None  # already capped at 5 rows
 
 # api/views/auth.py
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
@@ -417,30 +584,8 @@ class RegisterView(generics.CreateAPIView):
             user_profile.is_verified = False # Ensure is_verified is False on registration
             user_profile.save()
 
-            # Construct verification URL - **NOTE: Update settings.BASE_URL with your actual domain/IP**
-            base_url = getattr(settings, 'BASE_URL', 'http://localhost:8000') # Default if not set
-            verification_link = f"{base_url}/api/auth/verify-email/{token}/"
-
-            # Send verification email using templates
-            subject = 'Verify Your Email Address'
-            from_email = settings.DEFAULT_FROM_EMAIL
-            recipient_list = [user.email]
-
-            # Render email templates
-            context = {'username': user.username, 'verification_link': verification_link}
-            text_content = render_to_string('emails/verification_email.txt', context)
-            html_content = render_to_string('emails/verification_email.html', context)
-
-            try:
-                # Create the email with both plain text and HTML parts
-                email = EmailMultiAlternatives(subject, text_content, from_email, recipient_list)
-                email.attach_alternative(html_content, "text/html")
-                email.send(fail_silently=False)
-                print(f"Verification email sent to {user.email}")
-            except Exception as e:
-                print(f"Error sending verification email to {user.email}: {e}")
-                # Consider logging this error properly and potentially informing the user
-                # or marking the user for later email retry.
+            # Sent by the run_tasks worker so a slow mail server can't hold up registration
+            enqueue('send_verification_email', user_id=user.id, token=token)
 
             refresh = RefreshToken.for_user(user)
             access_token = str(refresh.access_token)
@@ -454,11 +599,7 @@ class RegisterView(generics.CreateAPIView):
             }, status=status.HTTP_201_CREATED)
         except Exception as e:
             # Log the error with traceback for debugging
-            import traceback
-            print("="*80)
-            print("An unexpected error occurred during registration:")
-            traceback.print_exc()
-            print("="*80)
+            logger.exception('An unexpected error occurred during registration')
 
             # Return a generic error message to the user, or a more specific one if appropriate
             return Response({
@@ -518,27 +659,6 @@ class ResendVerificationEmailView(views.APIView):
         user_profile.verification_token_expires_at = timezone.now() + timedelta(hours=24)
         user_profile.save()
 
-        # Construct verification URL - **NOTE: Update settings.BASE_URL with your actual domain/IP**
-        base_url = getattr(settings, 'BASE_URL', 'http://localhost:8000')
-        verification_link = f"{base_url}/api/auth/verify-email/{token}/"
-
-        # Send new verification email using templates
-        subject = 'Verify Your Email Address - Resent'
-        from_email = settings.DEFAULT_FROM_EMAIL
-        recipient_list = [user.email]
-
-        # Render email templates
-        context = {'username': user.username, 'verification_link': verification_link}
-        text_content = render_to_string('emails/verification_email.txt', context)
-        html_content = render_to_string('emails/verification_email.html', context)
-
-        try:
-            # Create the email with both plain text and HTML parts
-            email = EmailMultiAlternatives(subject, text_content, from_email, recipient_list)
-            email.attach_alternative(html_content, "text/html")
-            email.send(fail_silently=False)
-            print(f"Resent verification email to {user.email}")
-            return Response({'detail': 'Verification email resent.'}, status=status.HTTP_200_OK)
-        except Exception as e:
-            print(f"Error resending verification email to {user.email}: {e}")
-            return Response({'detail': 'Failed to resend verification email.'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
+        # Sent by the run_tasks worker
+        enqueue('send_verification_email', user_id=user.id, token=token, subject='Verify Your Email Address - Resent')
+        return Response({'detail': 'Verification email resent.'}, status=status.HTTP_200_OK)
\ No newline at end of file
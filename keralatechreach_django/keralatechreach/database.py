@@ -0,0 +1,82 @@
+"""
+DATABASES['default'] built from environment variables.
+
+DB_ENGINE=sqlite (the default) uses DB_NAME or db.sqlite3 next to
+manage.py, with the pragmas below applied to every new connection:
+
+- journal_mode=WAL lets readers continue while a view counter flush or an
+  upload is being written;
+- synchronous=NORMAL only syncs at checkpoints, which is safe with WAL;
+- busy_timeout makes a writer wait for the lock instead of failing with
+  "database is locked";
+- mmap_size serves reads from the page cache without read() calls.
+
+Transactions start with BEGIN IMMEDIATE, so a transaction that writes takes
+the lock up front rather than failing when it upgrades from a read.
+
+DB_ENGINE=postgres reads DB_NAME, DB_USER, DB_PASSWORD, DB_HOST and DB_PORT
+(psycopg 3). Connections persist for DB_CONN_MAX_AGE seconds and are checked
+before reuse; DB_POOL=1 uses a psycopg_pool connection pool of
+DB_POOL_MIN_SIZE to DB_POOL_MAX_SIZE connections per process instead.
+"""
+import os
+
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': 5000,  # ms
+    'mmap_size': 128 * 1024 * 1024,
+    'cache_size': -20000,  # KiB
+}
+
+
+def sqlite_database(name, tuned=True, conn_max_age=60):
+    database = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': name,
+        'CONN_MAX_AGE': conn_max_age,
+        'OPTIONS': {},
+    }
+    if tuned:
+        database['OPTIONS'] = {
+            'init_command': ';'.join(f'PRAGMA {pragma}={value}' for pragma, value in SQLITE_PRAGMAS.items()),
+            'transaction_mode': 'IMMEDIATE',
+        }
+    return database
+
+
+def postgres_database(env, conn_max_age=60):
+    database = {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': env.get('DB_NAME', 'keralatechreach'),
+        'USER': env.get('DB_USER', ''),
+        'PASSWORD': env.get('DB_PASSWORD', ''),
+        'HOST': env.get('DB_HOST', ''),
+        'PORT': env.get('DB_PORT', ''),
+        'CONN_MAX_AGE': conn_max_age,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {},
+    }
+    if env.get('DB_POOL') == '1':
+        # A pool replaces persistent connections; Django rejects both at once
+        database['CONN_MAX_AGE'] = 0
+        database['OPTIONS']['pool'] = {
+            'min_size': int(env.get('DB_POOL_MIN_SIZE', 2)),
+            'max_size': int(env.get('DB_POOL_MAX_SIZE', 10)),
+            'timeout': int(env.get('DB_POOL_TIMEOUT', 10)),
+        }
+    return database
+
+
+def database_from_env(base_dir, env=os.environ):
+    conn_max_age = int(env.get('DB_CONN_MAX_AGE', 60))
+    engine = env.get('DB_ENGINE', 'sqlite')
+    if engine == 'postgres':
+        return postgres_database(env, conn_max_age)
+    if engine != 'sqlite':
+        raise ValueError(f'Unknown DB_ENGINE {engine!r}; use sqlite or postgres')
+    return sqlite_database(
+        env.get('DB_NAME') or base_dir / 'db.sqlite3',
+        tuned=env.get('DB_SQLITE_TUNED', '1') == '1',
+        conn_max_age=conn_max_age,
+    )
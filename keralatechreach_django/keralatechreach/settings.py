@@ -17,6 +17,8 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 
 import os
 
+from .database import database_from_env
+
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.2/howto/deployment/checklist/
 
@@ -53,6 +55,7 @@ INSTALLED_APPS = [
     'django.contrib.staticfiles',
     'rest_framework',
     'admindashboard',
+    'api',
     'publicpage',
     'widget_tweaks',
 
@@ -64,6 +67,8 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    # After authentication so rate limits can budget per signed-in user
+    'admindashboard.middleware.SecurityMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -91,11 +96,10 @@ WSGI_APPLICATION = 'keralatechreach.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# SQLite with WAL by default; DB_ENGINE=postgres for PostgreSQL. See
+# keralatechreach/database.py for the variables.
 DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }
+    'default': database_from_env(BASE_DIR),
 }
 
 
@@ -143,6 +147,28 @@ STATICFILES_DIRS = [
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# Media delivery (admindashboard.media). MEDIA_SENDFILE hands the file to the
+# front proxy: 'x-accel-redirect' for nginx (an internal location serving
+# MEDIA_ROOT at MEDIA_ACCEL_REDIRECT_PREFIX) or 'x-sendfile'; None streams
+# it from Django. Content-addressed files are always cached for a year.
+MEDIA_SENDFILE = os.environ.get('MEDIA_SENDFILE') or None
+MEDIA_ACCEL_REDIRECT_PREFIX = '/protected-media/'
+MEDIA_CACHE_MAX_AGE = 60 * 60 * 24
+
+# Widths of the WebP/JPEG variants of uploaded images (admindashboard.images)
+IMAGE_VARIANT_WIDTHS = (320, 640, 1280)
+
+# Uploaded PDFs are linearized and previewed by admindashboard.pdfs (needs
+# pikepdf; previews need poppler's pdftoppm, looked up on PATH when None)
+PDFTOPPM = os.environ.get('PDFTOPPM') or None
+PDF_PREVIEW_WIDTH = 640
+
+# Resumable uploads (/api/uploads/): partial files live outside MEDIA_ROOT
+# until completed
+CHUNKED_UPLOAD_DIR = os.path.join(BASE_DIR, 'chunked_uploads')
+CHUNKED_UPLOAD_CHUNK_SIZE = 1024 * 1024
+CHUNKED_UPLOAD_MAX_SIZE = 100 * 1024 * 1024
+
 # Authentication settings
 LOGIN_URL = '/admindashboard/login/'
 LOGIN_REDIRECT_URL = '/admindashboard/dashboard/'
@@ -162,6 +188,14 @@ EMAIL_HOST_PASSWORD = 'Asha@2006'  # Replace with your app-specific password
 EMAIL_USE_SSL = True
 EMAIL_TIMEOUT = 10
 
+# Background tasks (admindashboard.task_queue), run by `manage.py run_tasks`.
+# A failed task is retried after TASK_RETRY_DELAY * 2 ** (attempt - 1)
+# seconds and moved to FailedTask after TASK_MAX_ATTEMPTS.
+TASK_QUEUE_EAGER = False
+TASK_MAX_ATTEMPTS = 5
+TASK_RETRY_DELAY = 30
+TASK_LEASE_SECONDS = 300
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
@@ -174,6 +208,7 @@ REST_FRAMEWORK = {
     'DEFAULT_THROTTLE_RATES': {
         'user': '10000/day',
         'anon': '1000/day',
+        'likes': '30/hour',  # NewsViewSet.like
     },
     # Add authentication and permission classes if not already present
     'DEFAULT_AUTHENTICATION_CLASSES': (
@@ -182,6 +217,119 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticatedOrReadOnly',
     ),
+    # Keyset pagination: list endpoints return {next, previous, results}
+    'DEFAULT_PAGINATION_CLASS': 'api.pagination.KeysetCursorPagination',
+    'PAGE_SIZE': 50,
 }
 
-
+# Upper bound for ?page_size= on API list endpoints
+API_MAX_PAGE_SIZE = 200
+
+# Cache shared by every worker process: API responses and their
+# generation counters (api.cache), rate-limit counters and dashboard stats.
+# Production needs REDIS_URL (pip install redis) or MEMCACHED_LOCATION
+# (pip install pymemcache); without either each process has its own
+# in-memory cache, which is only right for a single-process dev server.
+if os.environ.get('REDIS_URL'):
+    CACHES = {'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ['REDIS_URL'],
+    }}
+elif os.environ.get('MEMCACHED_LOCATION'):
+    CACHES = {'default': {
+        'BACKEND': 'django.core.cache.backends.memcached.PyMemcacheCache',
+        'LOCATION': os.environ['MEMCACHED_LOCATION'],
+    }}
+else:
+    CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+# Response cache for rarely-changing API endpoints (api.cache). Entries are
+# invalidated by model signals, which only reach other workers through a
+# shared cache; with a per-process cache the timeout bounds how long another
+# worker can serve a stale response.
+API_CACHE = 'default'
+API_CACHE_TIMEOUT = 60 if CACHES['default']['BACKEND'].endswith('LocMemCache') else 60 * 60
+
+# Home page / /api/home/ feed (admindashboard.home_feed)
+HOME_FEED_CACHE_TIMEOUT = 60
+
+# Admin dashboard counters (admindashboard.stats); edits invalidate early
+DASHBOARD_STATS_CACHE_TIMEOUT = 60
+
+# Site search (admindashboard.search): per-type sub-queries run on a pool
+# of SEARCH_WORKERS threads and stop counting past SEARCH_COUNT_CAP. SQLite
+# serialises them on the file anyway, so there they run one after another.
+SEARCH_WORKERS = 1 if DATABASES['default']['ENGINE'].endswith('sqlite3') else 5
+SEARCH_COUNT_CAP = 100
+
+# Write-behind view/like counters (admindashboard.counters) are flushed to
+# the database after this many seconds or pending increments, and at exit
+COUNTER_FLUSH_INTERVAL = 10
+COUNTER_FLUSH_THRESHOLD = 1000
+
+# Admin activity log entries (admindashboard.activity_buffer) are written in
+# batches; ACTIVITY_LOG_SYNC = True saves each one immediately instead
+ACTIVITY_LOG_BATCH_SIZE = 100
+ACTIVITY_LOG_FLUSH_INTERVAL = 5
+ACTIVITY_LOG_SYNC = False
+
+# `manage.py archive_activity_log` moves older entries to monthly .jsonl.gz files
+ACTIVITY_LOG_RETENTION_DAYS = 90
+ACTIVITY_LOG_ARCHIVE_DIR = os.path.join(BASE_DIR, 'archive', 'activity_log')
+
+
+# Rate limiting (admindashboard.middleware.SecurityMiddleware)
+# Counters live in RATE_LIMIT_CACHE; point it at a shared backend such as
+# Redis or Memcached in production so every worker sees the same budget.
+RATE_LIMIT_CACHE = 'default'
+RATE_LIMIT_RULES = [
+    # Longest matching prefix wins. anon = per IP, user = per signed-in user.
+    {'prefix': '/api/auth/', 'anon': 20, 'user': 20, 'period': 60},
+    {'prefix': '/api/', 'anon': 120, 'user': 600, 'period': 60},
+    {'prefix': '/admindashboard/', 'anon': 60, 'user': 600, 'period': 60},
+    {'prefix': '/', 'anon': 100, 'user': 300, 'period': 60},
+]
+# Reverse proxies in front of the app that append to X-Forwarded-For (e.g. 1
+# behind nginx). 0 uses REMOTE_ADDR and ignores the header, which a client
+# can set to anything.
+TRUSTED_PROXY_COUNT = int(os.environ.get('TRUSTED_PROXY_COUNT', 0))
+
+# Logging
+# Each app logs under its own module name; override a level per module with
+# LOG_LEVEL_<NAME>, e.g. LOG_LEVEL_API=DEBUG.
+API_TRACE_SAMPLE_PERCENT = float(os.environ.get('API_TRACE_SAMPLE_PERCENT', 0))  # request payload tracing, 0-100
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'structured': {
+            'format': '{asctime} {levelname} {name} {message}',
+            'style': '{',
+        },
+    },
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+            'formatter': 'structured',
+        },
+    },
+    'root': {
+        'handlers': ['console'],
+        'level': os.environ.get('LOG_LEVEL', 'WARNING'),
+    },
+    'loggers': {
+        'api': {
+            'level': os.environ.get('LOG_LEVEL_API', 'INFO'),
+        },
+        'api.trace': {
+            'level': os.environ.get('LOG_LEVEL_API_TRACE', 'DEBUG'),
+        },
+        'admindashboard': {
+            'level': os.environ.get('LOG_LEVEL_ADMINDASHBOARD', 'INFO'),
+        },
+        'publicpage': {
+            'level': os.environ.get('LOG_LEVEL_PUBLICPAGE', 'INFO'),
+        },
+    },
+}
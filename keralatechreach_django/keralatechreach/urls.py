@@ -1,9 +1,11 @@
 from django.contrib import admin
 from django.conf import settings
 from django.conf.urls.static import static
-from django.urls import path, include
+from django.urls import path, re_path, include
 from django.contrib.auth import views as auth_views
 from django.views.generic import RedirectView
+from admindashboard.images import image_variant
+from admindashboard.media import serve_media
 
 urlpatterns = [
     # Django default admin
@@ -14,11 +16,15 @@ urlpatterns = [
     path('', include('publicpage.urls')),  # Landing page for non-logged-in users
     path('api/', include('api.urls')),
 
+    # Uploaded files, with Range and conditional requests (admindashboard.media)
+    re_path(r'^%s(?P<path>.+)$' % settings.MEDIA_URL.lstrip('/'), serve_media, name='media'),
+    # Resized WebP/JPEG versions of uploaded images (admindashboard.images)
+    path('images/<int:width>/<str:fmt>/<path:path>', image_variant, name='image_variant'),
+
     # Redirect root to admin dashboard login
     # path('', RedirectView.as_view(url='/admindashboard/login/', permanent=False), name='root'),
 ]
 
-# Serve media and static files during development
+# Serve static files during development
 if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
     urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
\ No newline at end of file
@@ -0,0 +1,19 @@
+from django import template
+
+from admindashboard.images import variant_url, widths
+
+register = template.Library()
+
+
+@register.filter
+def variant(field_file, width):
+    """URL of the `width`-pixel WebP variant of an image: {{ news.image|variant:640 }}"""
+    return variant_url(field_file, int(width)) or ''
+
+
+@register.filter
+def srcset(field_file):
+    """srcset listing every WebP variant of an image."""
+    if not field_file:
+        return ''
+    return ', '.join(f'{variant_url(field_file, width)} {width}w' for width in widths())
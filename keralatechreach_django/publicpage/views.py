@@ -3,12 +3,16 @@ from django.contrib.auth.decorators import login_required
 from django.utils import timezone
 from datetime import timedelta
 from django.contrib import messages
+from django.conf import settings
 from django.db.models import Q
 from django.core.paginator import Paginator
 from django.utils.text import slugify
 from itertools import chain
 
 from django.contrib.auth import get_user_model
+from admindashboard import counters
+from admindashboard.home_feed import build_home_feed
+from admindashboard.search import search_by_kind, load_objects
 from admindashboard.models import News, Event, QuestionPaper, Testimonial, FAQ, Initiative, Exam, EntranceNotification, ContactUs, AdSettings # Import FAQ model and AdSettings
 from .forms import NewsletterSignupForm # Import the newsletter form
 from .models import NewsletterSubscriber # Import the newsletter model
@@ -21,46 +25,18 @@ def home(request):
     
     newsletter_form = NewsletterSignupForm() # Instantiate the form
     
-    now = timezone.now()
-    
     context = {
         'newsletter_form': newsletter_form, # Add form to context
-        # Get latest published events
-        'upcoming_events': Event.objects.filter(
-            event_start__gte=now,
-            is_published=True
-        ).order_by('event_start')[:3],
-        
-        # Get latest published news
-        'latest_news': News.objects.filter(
-            is_published=True
-        ).order_by('-created_at')[:3],
-        
-        # Get published initiatives
-        'initiatives': Initiative.objects.filter(
-            is_published=True
-        ).order_by('-updated_at')[:2],
-        
-        # Get latest exams and notifications
-        'latest_exams': Exam.objects.filter(
-            is_published=True,
-            exam_date__gte=now
-        ).order_by('exam_date')[:4],
-        
-        'entrance_notifications': EntranceNotification.objects.filter(
-            is_published=True,
-            deadline__gte=now
-        ).order_by('deadline')[:4],
-        
-        # Get testimonials and FAQs
-        'testimonials': Testimonial.objects.filter(
-            is_approved=True
-        ).order_by('-created_at')[:3],
-        
-        'faqs': FAQ.objects.filter(
-            is_published=True
-        ).order_by('display_order')[:5],
     }
+    context.update(build_home_feed({
+        'upcoming_events': 3,
+        'latest_news': 3,
+        'initiatives': 2,
+        'latest_exams': 4,
+        'entrance_notifications': 4,
+        'testimonials': 3,
+        'faqs': 5,
+    }))
 
     return render(request, 'publicpage/home.html', context)
 
@@ -89,9 +65,8 @@ def news_detail(request, slug):
         'between_content': AdSettings.objects.filter(location='between_content', is_active=True).first(),
     }
     
-    # Increment view count
-    news_article.views_count += 1
-    news_article.save()
+    # Buffered; written back in batches by admindashboard.counters
+    counters.increment(news_article, 'views_count')
     
     context = {
         'news_article': news_article,
@@ -102,61 +77,44 @@ def news_detail(request, slug):
 
 def event_detail(request, pk):
     event = get_object_or_404(Event, pk=pk, is_published=True)
+    counters.increment(event, 'views_count')
     return render(request, 'publicpage/event_detail.html', {'event': event})
 
 def questionpaper_detail(request, pk):
     question_paper = get_object_or_404(QuestionPaper, pk=pk, is_published=True)
+    counters.increment(question_paper, 'views_count')
     return render(request, 'publicpage/questionpaper_detail.html', {'question_paper': question_paper})
 
 def search(request):
     query = request.GET.get('q', '')
-    now = timezone.now()
-    
+    kinds = ['event', 'news', 'exam', 'initiative', 'entrance_notification']
+    results = {kind: [] for kind in kinds}
+    counts = {}
+    total_results = 0
+
     if query:
-        # Search in multiple models
-        events = Event.objects.filter(
-            Q(name__icontains=query) | Q(description__icontains=query),
-            is_published=True,
-            event_start__gte=now
-        ).order_by('event_start')
-
-        news = News.objects.filter(
-            Q(title__icontains=query) | Q(content__icontains=query),
-            is_published=True
-        ).order_by('-created_at')
-
-        exams = Exam.objects.filter(
-            Q(exam_name__icontains=query) | Q(degree_name__name__icontains=query),
-            is_published=True,
-            exam_date__gte=now
-        ).order_by('exam_date')
-
-        initiatives = Initiative.objects.filter(
-            Q(name__icontains=query) | Q(description__icontains=query),
-            is_published=True
-        ).order_by('-updated_at')
-
-        entrance_notifications = EntranceNotification.objects.filter(
-            Q(title__icontains=query) | Q(description__icontains=query),
-            is_published=True,
-            deadline__gte=now
-        ).order_by('deadline')
-
-    else:
-        events = Event.objects.none()
-        news = News.objects.none()
-        exams = Exam.objects.none()
-        initiatives = Initiative.objects.none()
-        entrance_notifications = EntranceNotification.objects.none()
+        # Past events, exams and notifications are dropped by current_only
+        cap = getattr(settings, 'SEARCH_COUNT_CAP', 100)
+        sections = search_by_kind(query, kinds, current_only=True, limit=5, cap=cap)
+        top_hits = []
+        for kind, (hits, count) in sections.items():
+            top_hits.extend(hits)
+            counts[kind] = f'{cap}+' if count > cap else count
+            total_results += min(count, cap)
+        for kind, obj, _ in load_objects(top_hits):
+            results[kind].append(obj)
+        if any(count > cap for _, count in sections.values()):
+            total_results = f'{total_results}+'
 
     context = {
         'query': query,
-        'events': events[:5],
-        'news': news[:5],
-        'exams': exams[:5],
-        'initiatives': initiatives[:5],
-        'entrance_notifications': entrance_notifications[:5],
-        'total_results': len(events) + len(news) + len(exams) + len(initiatives) + len(entrance_notifications)
+        'events': results['event'],
+        'news': results['news'],
+        'exams': results['exam'],
+        'initiatives': results['initiative'],
+        'entrance_notifications': results['entrance_notification'],
+        'counts': counts,
+        'total_results': total_results
     }
 
     return render(request, 'publicpage/search_results.html', context)
@@ -0,0 +1,42 @@
+import 'event.dart';
+import 'exam.dart';
+import 'faq.dart';
+import 'job.dart';
+import 'news.dart';
+import 'university.dart';
+
+// All home screen sections, fetched in one request from /api/home/
+class HomeFeed {
+  final List<Job> featuredJobs;
+  final List<Event> featuredEvents;
+  final List<News> featuredNews;
+  final List<Exam> featuredExams;
+  final List<University> universities;
+  final List<FAQ> faqs;
+
+  HomeFeed({
+    required this.featuredJobs,
+    required this.featuredEvents,
+    required this.featuredNews,
+    required this.featuredExams,
+    required this.universities,
+    required this.faqs,
+  });
+
+  factory HomeFeed.fromJson(Map<String, dynamic> json) {
+    List<T> parse<T>(String key, T Function(Map<String, dynamic>) fromJson) {
+      return (json[key] as List<dynamic>? ?? [])
+          .map((item) => fromJson(item as Map<String, dynamic>))
+          .toList();
+    }
+
+    return HomeFeed(
+      featuredJobs: parse('featured_jobs', Job.fromJson),
+      featuredEvents: parse('featured_events', Event.fromJson),
+      featuredNews: parse('featured_news', News.fromJson),
+      featuredExams: parse('featured_exams', Exam.fromJson),
+      universities: parse('universities', University.fromJson),
+      faqs: parse('faqs', FAQ.fromJson),
+    );
+  }
+}
@@ -0,0 +1,13 @@
+class PagedResult<T> {
+  final List<T> items;
+  final String? nextUrl;
+  final int? count;
+
+  PagedResult({
+    required this.items,
+    this.nextUrl,
+    this.count,
+  });
+
+  bool get hasMore => nextUrl != null;
+}
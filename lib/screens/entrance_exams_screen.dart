@@ -13,56 +13,89 @@ class EntranceExamsScreen extends StatefulWidget {
 
 class _EntranceExamsScreenState extends State<EntranceExamsScreen> {
   final ApiService _apiService = ApiService();
+  final ScrollController _scrollController = ScrollController();
   List<Exam> _exams = [];
-  List<Exam> _filtered = [];
+  String? _nextUrl; // Next page of the current listing or search
   bool _isLoading = true;
+  bool _isLoadingMore = false;
   String _search = '';
 
   @override
   void initState() {
     super.initState();
+    _scrollController.addListener(_onScroll);
     _loadExams();
   }
 
+  @override
+  void dispose() {
+    _scrollController.dispose();
+    super.dispose();
+  }
+
+  // First page of every exam, or of the server-side search for `_search`
   Future<void> _loadExams() async {
+    final search = _search;
+    setState(() {
+      _isLoading = true;
+      _nextUrl = null;
+    });
     try {
+      final page = search.isEmpty
+          ? await _apiService.getExams()
+          : await _apiService.searchExams(search);
+      // Further typing started another search meanwhile
+      if (!mounted || search != _search) return;
       setState(() {
-        _isLoading = true;
-      });
-      
-      final exams = await _apiService.getExams();
-      print('DEBUG: Loaded ${exams.length} exams successfully');
-      
-      setState(() {
-        _exams = exams;
-        _filtered = exams;
+        _exams = page.items;
+        _nextUrl = page.nextUrl;
         _isLoading = false;
       });
     } catch (e) {
-      print('ERROR: Failed to load exams: $e');
+      if (!mounted || search != _search) return;
       setState(() {
         _isLoading = false;
         _exams = [];
-        _filtered = [];
       });
-      
-      if (mounted) {
-        ScaffoldMessenger.of(context).showSnackBar(
-          SnackBar(
-            content: Text('Failed to load exams: $e'),
-            backgroundColor: Colors.red,
-            duration: const Duration(seconds: 5),
-          ),
-        );
-      }
+      ScaffoldMessenger.of(context).showSnackBar(
+        SnackBar(
+          content: Text('Failed to load exams: $e'),
+          backgroundColor: Colors.red,
+          duration: const Duration(seconds: 5),
+        ),
+      );
+    }
+  }
+
+  // Fetch the next page once the list is scrolled close to its end
+  void _onScroll() {
+    final position = _scrollController.position;
+    if (position.pixels >= position.maxScrollExtent - 400) {
+      _loadMore();
+    }
+  }
+
+  Future<void> _loadMore() async {
+    final nextUrl = _nextUrl;
+    if (nextUrl == null || _isLoadingMore || _isLoading) return;
+    setState(() => _isLoadingMore = true);
+    try {
+      final page = await _apiService.getExams(nextUrl: nextUrl);
+      if (!mounted || _nextUrl != nextUrl) return;
+      setState(() {
+        _exams.addAll(page.items);
+        _nextUrl = page.nextUrl;
+      });
+    } catch (e) {
+      // The spinner row stays; scrolling again retries
+    } finally {
+      if (mounted) setState(() => _isLoadingMore = false);
     }
   }
 
   void _onSearch(String value) {
-    setState(() {
-      _search = value;
-      _filtered = _exams.where((e) => e.examName.toLowerCase().contains(value.toLowerCase())).toList();
-    });
+    _search = value;
+    _loadExams();
   }
 
   void _onTap(Exam exam) {
@@ -78,38 +111,46 @@ class _EntranceExamsScreenState extends State<EntranceExamsScreen> {
   Widget build(BuildContext context) {
     return Scaffold(
       appBar: AppBar(title: const Text('Entrance Exams')),
-      body: _isLoading
-          ? const Center(child: CircularProgressIndicator())
-          : Column(
-              children: [
-                Padding(
-                  padding: const EdgeInsets.all(8.0),
-                  child: TextField(
-                    decoration: const InputDecoration(
-                      labelText: 'Search Exams',
-                      prefixIcon: Icon(Icons.search),
-                    ),
-                    onChanged: _onSearch,
-                  ),
-                ),
-                Expanded(
-                  child: _filtered.isEmpty
-                      ? const Center(child: Text('No entrance exams found.'))
-                      : ListView.builder(
-                          itemCount: _filtered.length,
-                          itemBuilder: (context, index) {
-                            final exam = _filtered[index];
-                            return ListTile(
-                              title: Text(exam.examName),
-                              subtitle: Text('${DateFormat('yyyy-MM-dd').format(exam.examDate)} | ${exam.degreeNameStr} | ${exam.universityName}'),
-                              trailing: const Icon(Icons.chevron_right),
-                              onTap: () => _onTap(exam),
-                            );
-                          },
-                        ),
-                ),
-              ],
+      body: Column(
+        children: [
+          Padding(
+            padding: const EdgeInsets.all(8.0),
+            child: TextField(
+              decoration: const InputDecoration(
+                labelText: 'Search Exams',
+                prefixIcon: Icon(Icons.search),
+              ),
+              onChanged: _onSearch,
             ),
+          ),
+          Expanded(
+            child: _isLoading
+                ? const Center(child: CircularProgressIndicator())
+                : _exams.isEmpty
+                    ? const Center(child: Text('No entrance exams found.'))
+                    : ListView.builder(
+                        controller: _scrollController,
+                        // One extra row for the spinner while the next page loads
+                        itemCount: _exams.length + (_nextUrl != null ? 1 : 0),
+                        itemBuilder: (context, index) {
+                          if (index == _exams.length) {
+                            return const Padding(
+                              padding: EdgeInsets.all(16.0),
+                              child: Center(child: CircularProgressIndicator()),
+                            );
+                          }
+                          final exam = _exams[index];
+                          return ListTile(
+                            title: Text(exam.examName),
+                            subtitle: Text('${DateFormat('yyyy-MM-dd').format(exam.examDate)} | ${exam.degreeNameStr} | ${exam.universityName}'),
+                            trailing: const Icon(Icons.chevron_right),
+                            onTap: () => _onTap(exam),
+                          );
+                        },
+                      ),
+          ),
+        ],
+      ),
     );
   }
 }
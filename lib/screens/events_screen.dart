@@ -25,6 +25,9 @@ class EventsScreen extends StatefulWidget {
 class _EventsScreenState extends State<EventsScreen> with SingleTickerProviderStateMixin {
   final ApiService _apiService = ApiService();
   List<Event> _allEvents = [];
+  String? _nextUrl; // Next page for the current filters
+  bool _isLoadingMore = false;
+  final ScrollController _eventsScrollController = ScrollController();
   List<SavedEvent> _savedEvents = [];
   List<Map<String, dynamic>> _eventCategories = [];
   List<District> _districts = [];
@@ -43,6 +46,7 @@ class _EventsScreenState extends State<EventsScreen> with SingleTickerProviderSt
   @override
   void initState() {
     super.initState();
+    _eventsScrollController.addListener(_onEventsScroll);
     _loadEvents();
     _loadEventCategories();
     _loadDistricts();
@@ -51,20 +55,29 @@ class _EventsScreenState extends State<EventsScreen> with SingleTickerProviderSt
     _initRewardedAd();
   }
 
+  @override
+  void dispose() {
+    _eventsScrollController.dispose();
+    super.dispose();
+  }
+
+  // First page of events matching the filters; the server filters, so
+  // every match is reachable by scrolling
   Future<void> _loadEvents() async {
     setState(() {
       _isLoading = true;
       _errorMessage = '';
+      _nextUrl = null;
     });
     try {
-      print('DEBUG: Fetching events from API');
-      final events = await _apiService.getEvents();
-      print('DEBUG: Received ${events.length} events from API');
-      if (events.isNotEmpty) {
-        print('DEBUG: First event: ${events[0].title}, ID: ${events[0].id}, categoryId: ${events[0].categoryId}, districtId: ${events[0].districtId}');
-      }
+      final page = await _apiService.getEvents(
+        categoryId: _categoryFilter,
+        districtId: _districtFilter,
+        date: _dateFilter,
+      );
       setState(() {
-        _allEvents = events;
+        _allEvents = page.items;
+        _nextUrl = page.nextUrl;
         _isLoading = false;
       });
     } catch (e) {
@@ -197,13 +210,31 @@ class _EventsScreenState extends State<EventsScreen> with SingleTickerProviderSt
     Share.share('Check out this event: ${event.title}\n${event.description ?? ''}\n${event.link ?? ''}');
   }
 
-  List<Event> get _filteredEvents {
-    return _allEvents.where((event) {
-      final matchesCategory = _categoryFilter == null || event.categoryId == _categoryFilter;
-      final matchesDistrict = _districtFilter == null || event.districtId == _districtFilter;
-      final matchesDate = _dateFilter == null || (event.date.year == _dateFilter!.year && event.date.month == _dateFilter!.month && event.date.day == _dateFilter!.day);
-      return matchesCategory && matchesDistrict && matchesDate;
-    }).toList();
+  // Fetch the next page once the list is scrolled close to its end
+  void _onEventsScroll() {
+    final position = _eventsScrollController.position;
+    if (position.pixels >= position.maxScrollExtent - 400) {
+      _loadMoreEvents();
+    }
+  }
+
+  Future<void> _loadMoreEvents() async {
+    final nextUrl = _nextUrl;
+    if (nextUrl == null || _isLoadingMore || _isLoading) return;
+    setState(() => _isLoadingMore = true);
+    try {
+      final page = await _apiService.getEvents(nextUrl: nextUrl);
+      // A filter change meanwhile started a fresh listing
+      if (!mounted || _nextUrl != nextUrl) return;
+      setState(() {
+        _allEvents.addAll(page.items);
+        _nextUrl = page.nextUrl;
+      });
+    } catch (e) {
+      if (mounted) setState(() => _errorMessage = 'Failed to load more events: ${e.toString()}');
+    } finally {
+      if (mounted) setState(() => _isLoadingMore = false);
+    }
   }
 
   void _onEventTap(Event event) async {
@@ -359,6 +390,7 @@ class _EventsScreenState extends State<EventsScreen> with SingleTickerProviderSt
                                 setState(() {
                                   _categoryFilter = value;
                                 });
+                                _loadEvents();
                               },
                             ),
                           ),
@@ -384,6 +416,7 @@ class _EventsScreenState extends State<EventsScreen> with SingleTickerProviderSt
                                 setState(() {
                                   _districtFilter = value;
                                 });
+                                _loadEvents();
                               },
                             ),
                           ),
@@ -404,6 +437,7 @@ class _EventsScreenState extends State<EventsScreen> with SingleTickerProviderSt
                                 );
                                 if (picked != null) {
                                   setState(() => _dateFilter = picked);
+                                  _loadEvents();
                                 }
                               },
                               child: InputDecorator(
@@ -420,11 +454,14 @@ class _EventsScreenState extends State<EventsScreen> with SingleTickerProviderSt
                           ElevatedButton.icon(
                             icon: const Icon(Icons.clear),
                             label: const Text('Clear'),
-                            onPressed: () => setState(() {
-                              _categoryFilter = null;
-                              _districtFilter = null;
-                              _dateFilter = null;
-                            }),
+                            onPressed: () {
+                              setState(() {
+                                _categoryFilter = null;
+                                _districtFilter = null;
+                                _dateFilter = null;
+                              });
+                              _loadEvents();
+                            },
                           ),
                         ],
                       ),
@@ -445,7 +482,7 @@ class _EventsScreenState extends State<EventsScreen> with SingleTickerProviderSt
                     onRefresh: _loadEvents,
                     child: _isLoading
                         ? const Center(child: CircularProgressIndicator())
-                        : _filteredEvents.isEmpty
+                        : _allEvents.isEmpty
                             ? Center(
                                 child: Column(
                                   mainAxisAlignment: MainAxisAlignment.center,
@@ -460,9 +497,17 @@ class _EventsScreenState extends State<EventsScreen> with SingleTickerProviderSt
                                 ),
                               )
                             : ListView.builder(
-                                itemCount: _filteredEvents.length,
+                                controller: _eventsScrollController,
+                                // One extra row for the spinner while the next page loads
+                                itemCount: _allEvents.length + (_nextUrl != null ? 1 : 0),
                                 itemBuilder: (context, index) {
-                                  final event = _filteredEvents[index];
+                                  if (index == _allEvents.length) {
+                                    return const Padding(
+                                      padding: EdgeInsets.all(16.0),
+                                      child: Center(child: CircularProgressIndicator()),
+                                    );
+                                  }
+                                  final event = _allEvents[index];
                                   final isSaved = _savedEvents.any((se) => se.event.id == event.id);
                                   return Card(
                                     margin: const EdgeInsets.symmetric(horizontal: 8, vertical: 4),
@@ -99,10 +99,7 @@ class _HomeScreenState extends State<HomeScreen> with TickerProviderStateMixin {
     super.initState();
     _loadTechPicks();
     _loadAdSliders();
-    _loadFeaturedJobs();
-    _loadFeaturedEvents();
-    _loadFeaturedNews();
-    _loadFeaturedExams();
+    _loadHomeFeed();
     _startAutoSlider();
     
     // Initialize animation controller
@@ -263,67 +260,32 @@ class _HomeScreenState extends State<HomeScreen> with TickerProviderStateMixin {
     }
   }
   
-  Future<void> _loadFeaturedJobs() async {
+  Future<void> _loadHomeFeed() async {
     try {
-      final jobs = await _apiService.getFeaturedJobs();
+      final feed = await _apiService.getHomeFeed();
       setState(() {
-        _featuredJobs = jobs;
+        _featuredJobs = feed.featuredJobs;
+        _featuredEvents = feed.featuredEvents;
+        _featuredNews = feed.featuredNews;
+        _featuredExams = feed.featuredExams;
         _isLoadingFeaturedJobs = false;
-      });
-      _jobsAnimationController.forward(); // Start animation after loading
-    } catch (e) {
-      setState(() {
-        _isLoadingFeaturedJobs = false;
-      });
-      print('Error loading featured jobs: $e');
-    }
-  }
-  
-  Future<void> _loadFeaturedEvents() async {
-    try {
-      final events = await _apiService.getFeaturedEvents();
-      setState(() {
-        _featuredEvents = events;
         _isLoadingFeaturedEvents = false;
-      });
-      _eventsAnimationController.forward(); // Start animation after loading
-    } catch (e) {
-      setState(() {
-        _isLoadingFeaturedEvents = false;
-      });
-      print('Error loading featured events: $e');
-    }
-  }
-  
-  Future<void> _loadFeaturedNews() async {
-    try {
-      final news = await _apiService.getFeaturedNews();
-      setState(() {
-        _featuredNews = news;
-        _isLoadingFeaturedNews = false;
-      });
-      _newsAnimationController.forward(); // Start animation after loading
-    } catch (e) {
-      setState(() {
         _isLoadingFeaturedNews = false;
-      });
-      print('Error loading featured news: $e');
-    }
-  }
-  
-  Future<void> _loadFeaturedExams() async {
-    try {
-      final exams = await _apiService.getFeaturedExams();
-      setState(() {
-        _featuredExams = exams;
         _isLoadingFeaturedExams = false;
       });
-      _examsAnimationController.forward(); // Start animation after loading
+      // Start animations after loading
+      _jobsAnimationController.forward();
+      _eventsAnimationController.forward();
+      _newsAnimationController.forward();
+      _examsAnimationController.forward();
     } catch (e) {
       setState(() {
+        _isLoadingFeaturedJobs = false;
+        _isLoadingFeaturedEvents = false;
+        _isLoadingFeaturedNews = false;
         _isLoadingFeaturedExams = false;
       });
-      print('Error loading featured exams: $e');
+      print('Error loading home feed: $e');
     }
   }
 
@@ -360,10 +322,7 @@ class _HomeScreenState extends State<HomeScreen> with TickerProviderStateMixin {
           await Future.wait([
             _loadTechPicks(),
             _loadAdSliders(),
-            _loadFeaturedJobs(),
-            _loadFeaturedEvents(),
-            _loadFeaturedNews(),
-            _loadFeaturedExams(),
+            _loadHomeFeed(),
           ]);
         },
         child: ListView(
@@ -13,13 +13,53 @@ class NewsListScreen extends StatefulWidget {
 }
 
 class _NewsListScreenState extends State<NewsListScreen> {
-  late Future<List<News>> _newsListFuture;
   final ApiService _apiService = ApiService();
+  final ScrollController _scrollController = ScrollController();
+  final List<News> _newsList = [];
+  String? _nextUrl;
+  bool _isLoading = false;
+  bool _hasMore = true;
+  Object? _error;
 
   @override
   void initState() {
     super.initState();
-    _newsListFuture = _apiService.getNews();
+    _scrollController.addListener(_onScroll);
+    _loadMore();
+  }
+
+  @override
+  void dispose() {
+    _scrollController.dispose();
+    super.dispose();
+  }
+
+  // Fetch the next page once the list is scrolled close to its end
+  void _onScroll() {
+    final position = _scrollController.position;
+    if (position.pixels >= position.maxScrollExtent - 400) {
+      _loadMore();
+    }
+  }
+
+  Future<void> _loadMore() async {
+    if (_isLoading || !_hasMore) return;
+    setState(() => _isLoading = true);
+    try {
+      final page = await _apiService.getNewsPage(nextUrl: _nextUrl);
+      if (!mounted) return;
+      setState(() {
+        _newsList.addAll(page.items);
+        _nextUrl = page.nextUrl;
+        _hasMore = page.hasMore;
+        _error = null;
+      });
+    } catch (e) {
+      if (!mounted) return;
+      setState(() => _error = e);
+    } finally {
+      if (mounted) setState(() => _isLoading = false);
+    }
   }
 
   @override
@@ -28,27 +68,34 @@ class _NewsListScreenState extends State<NewsListScreen> {
       appBar: AppBar(
         title: const Text('News'),
       ),
-      body: FutureBuilder<List<News>>(
-        future: _newsListFuture,
-        builder: (context, snapshot) {
-          if (snapshot.connectionState == ConnectionState.waiting) {
+      body: Builder(
+        builder: (context) {
+          if (_newsList.isEmpty && _isLoading) {
             return const Center(
               child: CircularProgressIndicator(),
             );
-          } else if (snapshot.hasError) {
+          } else if (_newsList.isEmpty && _error != null) {
             return Center(
-              child: Text('Error: ${snapshot.error}'),
+              child: Text('Error: $_error'),
             );
-          } else if (!snapshot.hasData || snapshot.data!.isEmpty) {
+          } else if (_newsList.isEmpty) {
             return const Center(
               child: Text('No news available.'),
             );
           } else {
             // Data has been loaded successfully
-            List<News> newsList = snapshot.data!;
+            List<News> newsList = _newsList;
             return ListView.builder(
-              itemCount: newsList.length,
+              controller: _scrollController,
+              // One extra row for the spinner while the next page loads
+              itemCount: newsList.length + (_hasMore ? 1 : 0),
               itemBuilder: (context, index) {
+                if (index == newsList.length) {
+                  return const Padding(
+                    padding: EdgeInsets.all(16.0),
+                    child: Center(child: CircularProgressIndicator()),
+                  );
+                }
                 News news = newsList[index];
                 // Use Card and InkWell for a visually appealing and tappable list item
                 return Card(
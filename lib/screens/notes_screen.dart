@@ -38,6 +38,9 @@ class _NotesScreenState extends State<NotesScreen> {
   List<University> _universities = [];
   List<Degree> _degrees = [];
   List<Note> _allNotes = []; // Renamed from _notes
+  String? _nextUrl; // Next page of the current listing or search
+  bool _isLoadingMore = false;
+  final ScrollController _notesScrollController = ScrollController();
   List<SavedNote> _savedNotes = []; // List for saved notes
   University? _selectedUniversity;
   Degree? _selectedDegree;
@@ -50,6 +53,7 @@ class _NotesScreenState extends State<NotesScreen> {
   @override
   void initState() {
     super.initState();
+    _notesScrollController.addListener(_onNotesScroll);
     _loadUniversities();
     _loadUserSelections();
     _loadSavedNotes(); // Load saved notes on init
@@ -85,16 +89,20 @@ class _NotesScreenState extends State<NotesScreen> {
   }
 
   Future<void> _loadNotes() async {
-    setState(() => _isLoading = true);
+    setState(() {
+      _isLoading = true;
+      _nextUrl = null;
+    });
     try {
-      final notes = await _apiService.getNotes(
+      final page = await _apiService.getNotes(
         degreeId: _selectedDegree?.id,
         semester: _selectedSemester,
         year: _selectedYear,
         universityId: _selectedUniversity?.id,
       );
       setState(() {
-        _allNotes = notes; // Update _allNotes
+        _allNotes = page.items; // Update _allNotes
+        _nextUrl = page.nextUrl;
         _isLoading = false;
       });
     } catch (e) {
@@ -108,11 +116,15 @@ class _NotesScreenState extends State<NotesScreen> {
       _loadNotes(); // Search applies to all notes
       return;
     }
-    setState(() => _isLoading = true);
+    setState(() {
+      _isLoading = true;
+      _nextUrl = null;
+    });
     try {
-      final notes = await _apiService.searchNotes(query);
+      final page = await _apiService.searchNotes(query);
       setState(() {
-        _allNotes = notes; // Search results update _allNotes
+        _allNotes = page.items; // Search results update _allNotes
+        _nextUrl = page.nextUrl;
         _isLoading = false;
       });
     } catch (e) {
@@ -121,6 +133,33 @@ class _NotesScreenState extends State<NotesScreen> {
     }
   }
 
+  // Fetch the next page once the list is scrolled close to its end
+  void _onNotesScroll() {
+    final position = _notesScrollController.position;
+    if (position.pixels >= position.maxScrollExtent - 400) {
+      _loadMoreNotes();
+    }
+  }
+
+  Future<void> _loadMoreNotes() async {
+    final nextUrl = _nextUrl;
+    if (nextUrl == null || _isLoadingMore || _isLoading) return;
+    setState(() => _isLoadingMore = true);
+    try {
+      final page = await _apiService.getNotes(nextUrl: nextUrl);
+      // A filter change or new search meanwhile started a fresh listing
+      if (!mounted || _nextUrl != nextUrl) return;
+      setState(() {
+        _allNotes.addAll(page.items);
+        _nextUrl = page.nextUrl;
+      });
+    } catch (e) {
+      if (mounted) _showError('Failed to load more notes');
+    } finally {
+      if (mounted) setState(() => _isLoadingMore = false);
+    }
+  }
+
   Future<void> _pickAndUploadPDF() async {
     Navigator.push(
       context,
@@ -263,6 +302,7 @@ class _NotesScreenState extends State<NotesScreen> {
       _selectedSemester = null;
       _selectedYear = null;
       _allNotes = []; // Clear all notes on filter change
+      _nextUrl = null;
       _degrees = []; // Clear degrees when university changes
     });
     _saveUserSelections();
@@ -277,6 +317,7 @@ class _NotesScreenState extends State<NotesScreen> {
       _selectedSemester = null;
       _selectedYear = null;
       _allNotes = []; // Clear all notes on filter change
+      _nextUrl = null;
     });
     _saveUserSelections();
   }
@@ -286,6 +327,7 @@ class _NotesScreenState extends State<NotesScreen> {
       _selectedSemester = semester;
       _selectedYear = null;
       _allNotes = []; // Clear all notes on filter change
+      _nextUrl = null;
     });
     _saveUserSelections();
   }
@@ -294,6 +336,7 @@ class _NotesScreenState extends State<NotesScreen> {
     setState(() {
       _selectedYear = year;
       _allNotes = []; // Clear all notes on filter change
+      _nextUrl = null;
     });
     _saveUserSelections();
     _loadNotesIfReady();
@@ -485,8 +528,16 @@ class _NotesScreenState extends State<NotesScreen> {
                         : _allNotes.isEmpty
                           ? const Center(child: Text('No notes found'))
                           : ListView.builder(
-                                itemCount: _allNotes.length,
+                                controller: _notesScrollController,
+                                // One extra row for the spinner while the next page loads
+                                itemCount: _allNotes.length + (_nextUrl != null ? 1 : 0),
                               itemBuilder: (context, index) {
+                                  if (index == _allNotes.length) {
+                                    return const Padding(
+                                      padding: EdgeInsets.all(16.0),
+                                      child: Center(child: CircularProgressIndicator()),
+                                    );
+                                  }
                                   final note = _allNotes[index];
                                   final isSaved = _savedNotes.any((sn) => sn.note.id == note.id); // Check if note is saved
                                 return Card(
@@ -539,6 +590,7 @@ class _NotesScreenState extends State<NotesScreen> {
 
   @override
   void dispose() {
+    _notesScrollController.dispose();
     _searchController.dispose();
     super.dispose();
   }
@@ -44,6 +44,9 @@ class _QuestionPapersScreenState extends State<QuestionPapersScreen> with Single
   List<University> _universities = [];
   List<Degree> _degrees = [];
   List<QuestionPaper> _allQuestionPapers = []; // Renamed from _questionPapers
+  String? _nextUrl; // Next page of the current listing or search
+  bool _isLoadingMore = false;
+  final ScrollController _papersScrollController = ScrollController();
   List<SavedQuestionPaper> _savedQuestionPapers = []; // List for saved question papers
   University? _selectedUniversity;
   Degree? _selectedDegree;
@@ -60,6 +63,7 @@ class _QuestionPapersScreenState extends State<QuestionPapersScreen> with Single
   @override
   void initState() {
     super.initState();
+    _papersScrollController.addListener(_onPapersScroll);
     _loadUniversities();
     _loadAdCounter();
     _initRewardedAd();
@@ -97,16 +101,20 @@ class _QuestionPapersScreenState extends State<QuestionPapersScreen> with Single
   }
 
   Future<void> _loadQuestionPapers() async {
-    setState(() => _isLoading = true);
+    setState(() {
+      _isLoading = true;
+      _nextUrl = null;
+    });
     try {
-      final papers = await _apiService.getQuestionPapers(
+      final page = await _apiService.getQuestionPapers(
         degreeId: _selectedDegree?.id,
         semester: _selectedSemester,
         year: _selectedYear,
         universityId: _selectedUniversity?.id,
       );
       setState(() {
-        _allQuestionPapers = papers; // Update _allQuestionPapers
+        _allQuestionPapers = page.items; // Update _allQuestionPapers
+        _nextUrl = page.nextUrl;
         _isLoading = false;
       });
     } catch (e) {
@@ -120,11 +128,15 @@ class _QuestionPapersScreenState extends State<QuestionPapersScreen> with Single
       _loadQuestionPapers(); // Search applies to all question papers
       return;
     }
-    setState(() => _isLoading = true);
+    setState(() {
+      _isLoading = true;
+      _nextUrl = null;
+    });
     try {
-      final papers = await _apiService.searchQuestionPapers(query);
+      final page = await _apiService.searchQuestionPapers(query);
       setState(() {
-        _allQuestionPapers = papers; // Search results update _allQuestionPapers
+        _allQuestionPapers = page.items; // Search results update _allQuestionPapers
+        _nextUrl = page.nextUrl;
         _isLoading = false;
       });
     } catch (e) {
@@ -133,6 +145,33 @@ class _QuestionPapersScreenState extends State<QuestionPapersScreen> with Single
     }
   }
 
+  // Fetch the next page once the list is scrolled close to its end
+  void _onPapersScroll() {
+    final position = _papersScrollController.position;
+    if (position.pixels >= position.maxScrollExtent - 400) {
+      _loadMoreQuestionPapers();
+    }
+  }
+
+  Future<void> _loadMoreQuestionPapers() async {
+    final nextUrl = _nextUrl;
+    if (nextUrl == null || _isLoadingMore || _isLoading) return;
+    setState(() => _isLoadingMore = true);
+    try {
+      final page = await _apiService.getQuestionPapers(nextUrl: nextUrl);
+      // A filter change or new search meanwhile started a fresh listing
+      if (!mounted || _nextUrl != nextUrl) return;
+      setState(() {
+        _allQuestionPapers.addAll(page.items);
+        _nextUrl = page.nextUrl;
+      });
+    } catch (e) {
+      if (mounted) _showError('Failed to load more question papers');
+    } finally {
+      if (mounted) setState(() => _isLoadingMore = false);
+    }
+  }
+
   void _showError(String message) {
     ScaffoldMessenger.of(context).showSnackBar(
       SnackBar(content: Text(message)),
@@ -296,6 +335,7 @@ class _QuestionPapersScreenState extends State<QuestionPapersScreen> with Single
       _selectedSemester = null;
       _selectedYear = null;
       _allQuestionPapers = []; // Clear all question papers on filter change
+      _nextUrl = null;
     });
     _saveUserSelections();
     _loadDegrees();
@@ -307,6 +347,7 @@ class _QuestionPapersScreenState extends State<QuestionPapersScreen> with Single
       _selectedSemester = null;
       _selectedYear = null;
       _allQuestionPapers = []; // Clear all question papers on filter change
+      _nextUrl = null;
     });
     _saveUserSelections();
   }
@@ -316,6 +357,7 @@ class _QuestionPapersScreenState extends State<QuestionPapersScreen> with Single
       _selectedSemester = semester;
       _selectedYear = null;
       _allQuestionPapers = []; // Clear all question papers on filter change
+      _nextUrl = null;
     });
     _saveUserSelections();
   }
@@ -324,6 +366,7 @@ class _QuestionPapersScreenState extends State<QuestionPapersScreen> with Single
     setState(() {
       _selectedYear = year;
       _allQuestionPapers = []; // Clear all question papers on filter change
+      _nextUrl = null;
     });
     _saveUserSelections();
     _loadQuestionPapersIfReady();
@@ -531,8 +574,16 @@ class _QuestionPapersScreenState extends State<QuestionPapersScreen> with Single
                         : _allQuestionPapers.isEmpty
                           ? const Center(child: Text('No question papers found'))
                           : ListView.builder(
-                                itemCount: _allQuestionPapers.length,
+                                controller: _papersScrollController,
+                                // One extra row for the spinner while the next page loads
+                                itemCount: _allQuestionPapers.length + (_nextUrl != null ? 1 : 0),
                               itemBuilder: (context, index) {
+                                  if (index == _allQuestionPapers.length) {
+                                    return const Padding(
+                                      padding: EdgeInsets.all(16.0),
+                                      child: Center(child: CircularProgressIndicator()),
+                                    );
+                                  }
                                   final paper = _allQuestionPapers[index];
                                   final isSaved = _savedQuestionPapers.any((sqp) => sqp.paper.id == paper.id); // Check if paper is saved
                                 return Card(
@@ -619,6 +670,7 @@ class _QuestionPapersScreenState extends State<QuestionPapersScreen> with Single
 
   @override
   void dispose() {
+    _papersScrollController.dispose();
     _searchController.dispose();
     super.dispose();
   }
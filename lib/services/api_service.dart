@@ -3,6 +3,7 @@ import 'dart:io';
 import 'package:http/http.dart' as http;
 import 'package:dio/dio.dart';
 import 'package:dio/io.dart';  // Import for IOHttpClientAdapter
+import 'package:crypto/crypto.dart';
 import '../models/university.dart';
 import '../models/degree.dart';
 import '../models/question_paper.dart';
@@ -18,6 +19,8 @@ import '../models/faq.dart';
 import '../models/tech_pick.dart';
 import '../models/ad_slider.dart';
 import '../models/district.dart'; // Import District model
+import '../models/paged_result.dart';
+import '../models/home_feed.dart';
 import '../utils/app_exception.dart';
 import '../utils/logger.dart';
 import 'auth_service.dart';
@@ -141,6 +144,78 @@ class ApiService {
     return headers;
   }
 
+  // List endpoints are cursor-paginated: {next, previous, results}.
+  // Collects every page by following `next`. Only for the small lookup
+  // lists (universities, degrees, categories, FAQs, ...): every page is a
+  // request against the rate limit. Long lists load page by page through
+  // getPage as the user scrolls.
+  // Older deployments return a bare JSON array, so accept both.
+  Future<List<dynamic>> _allResults(http.Response response, {Map<String, String>? headers}) async {
+    var decoded = json.decode(response.body);
+    if (decoded is! Map<String, dynamic> || !decoded.containsKey('results')) {
+      return decoded as List<dynamic>;
+    }
+    final results = <dynamic>[...decoded['results'] as List<dynamic>];
+    var next = decoded['next'] as String?;
+    while (next != null) {
+      final page = await http.get(Uri.parse(next), headers: headers);
+      if (page.statusCode != 200) {
+        AppLogger.error('API error [${page.statusCode}]: $next', page.body);
+        throw AppException('Failed to load data',
+          details: 'Status code: ${page.statusCode}',
+          type: AppExceptionType.server);
+      }
+      decoded = json.decode(page.body) as Map<String, dynamic>;
+      results.addAll(decoded['results'] as List<dynamic>);
+      next = decoded['next'] as String?;
+    }
+    return results;
+  }
+
+  // Fetch a single page of a list endpoint. Pass the returned
+  // `nextUrl` back in as `url` to load the following page. The lists are
+  // public, so an expired session is refreshed or, failing that, dropped.
+  Future<PagedResult<T>> getPage<T>(
+    String url,
+    T Function(dynamic) fromJson, {
+    int? pageSize,
+  }) async {
+    final uri = Uri.parse(url);
+    final pagedUri = pageSize == null
+        ? uri
+        : uri.replace(queryParameters: {
+            ...uri.queryParameters,
+            'page_size': '$pageSize',
+          });
+    var response = await http.get(pagedUri, headers: await _getAuthHeaders());
+    if (response.statusCode == 401) {
+      Map<String, String> headers;
+      try {
+        await _authService.refreshToken();
+        headers = await _getAuthHeaders();
+      } catch (e) {
+        AppLogger.error('Token refresh failed', e);
+        headers = {'Content-Type': 'application/json'};
+      }
+      response = await http.get(pagedUri, headers: headers);
+    }
+    if (response.statusCode != 200) {
+      AppLogger.error('API error [${response.statusCode}]: $pagedUri', response.body);
+      throw AppException('Failed to load data',
+        details: 'Status code: ${response.statusCode}',
+        type: AppExceptionType.server);
+    }
+    final decoded = json.decode(response.body);
+    if (decoded is List) {
+      return PagedResult(items: decoded.map(fromJson).toList());
+    }
+    return PagedResult(
+      items: (decoded['results'] as List<dynamic>).map(fromJson).toList(),
+      nextUrl: decoded['next'] as String?,
+      count: decoded['count'] as int?,
+    );
+  }
+
   // Generic GET method
   Future<List<T>> _getList<T>(String url, T Function(dynamic) fromJson) async {
     try {
@@ -149,7 +224,7 @@ class ApiService {
       final response = await http.get(Uri.parse(url), headers: headers);
       AppLogger.debug('Response [${response.statusCode}]: $url');
       if (response.statusCode == 200) {
-        List<dynamic> data = json.decode(response.body);
+        List<dynamic> data = await _allResults(response, headers: headers);
         return data.map((json) => fromJson(json)).toList();
       } else if (response.statusCode == 401) {
         // Token expired, try to refresh
@@ -213,7 +288,7 @@ class ApiService {
       AppLogger.info('Fetching universities without auth requirement');
       final response = await http.get(Uri.parse('$baseUrl/universities/'));
       if (response.statusCode == 200) {
-        List<dynamic> data = json.decode(response.body);
+        List<dynamic> data = await _allResults(response);
         return data.map((json) => University.fromJson(json)).toList();
       } else {
         AppLogger.error('Failed to load universities [${response.statusCode}]', response.body);
@@ -240,7 +315,7 @@ class ApiService {
       AppLogger.info('Fetching degrees without auth requirement: $url');
       final response = await http.get(Uri.parse(url));
       if (response.statusCode == 200) {
-        List<dynamic> data = json.decode(response.body);
+        List<dynamic> data = await _allResults(response);
         return data.map((json) => Degree.fromJson(json)).toList();
       } else {
         AppLogger.error('Failed to load degrees [${response.statusCode}]', response.body);
@@ -257,42 +332,96 @@ class ApiService {
   }
 
   // Question Papers
-  Future<List<QuestionPaper>> getQuestionPapers({
+  Future<PagedResult<QuestionPaper>> getQuestionPapers({
     int? degreeId,
     int? semester,
     int? year,
     int? universityId,
-  }) async {
-    try {
-      String url = '$baseUrl/question-papers/';
-      List<String> params = [];
-      
-      if (degreeId != null) params.add('degree=$degreeId');
-      if (semester != null) params.add('semester=$semester');
-      if (year != null) params.add('year=$year');
-      if (universityId != null) params.add('university_id=$universityId');
-      
-      if (params.isNotEmpty) {
-        url += '?${params.join('&')}';
-      }
+    String? nextUrl,
+  }) {
+    String url = '$baseUrl/question-papers/';
+    List<String> params = [];
 
-      AppLogger.info('Fetching question papers without auth requirement: $url');
-      final response = await http.get(Uri.parse(url));
-      if (response.statusCode == 200) {
-        List<dynamic> data = json.decode(response.body);
-        return data.map((json) => QuestionPaper.fromJson(json)).toList();
-      } else {
-        AppLogger.error('Failed to load question papers [${response.statusCode}]', response.body);
-        throw AppException('Failed to load question papers',
-          details: 'Status code: ${response.statusCode}',
-          type: AppExceptionType.server);
+    if (degreeId != null) params.add('degree=$degreeId');
+    if (semester != null) params.add('semester=$semester');
+    if (year != null) params.add('year=$year');
+    if (universityId != null) params.add('university_id=$universityId');
+
+    if (params.isNotEmpty) {
+      url += '?${params.join('&')}';
+    }
+    return getPage(nextUrl ?? url, (json) => QuestionPaper.fromJson(json));
+  }
+
+  // Chunked upload via /uploads/: initiate, PUT each chunk at its offset,
+  // then complete. Failed chunks are retried from the offset the server
+  // reports. Returns the id of the created object.
+  Future<int> _chunkedUpload({
+    required File file,
+    required String kind,
+    required Map<String, dynamic> fields,
+    required String token,
+    int maxRetries = 3,
+  }) async {
+    final headers = {'Authorization': 'Bearer $token'};
+    final size = await file.length();
+    final checksum = await sha256.bind(file.openRead()).first;
+
+    final initiated = await _dio.post(
+      '$baseUrl/uploads/',
+      data: {
+        'kind': kind,
+        'filename': file.path.split(Platform.pathSeparator).last,
+        'size': size,
+        'sha256': checksum.toString(),
+        ...fields,
+      },
+      options: Options(headers: headers),
+    );
+    if (initiated.data['duplicate'] == true) {
+      // The server already has this file
+      return initiated.data['id'];
+    }
+    final String uploadId = initiated.data['id'];
+    final int chunkSize = initiated.data['chunk_size'];
+
+    var offset = 0;
+    var retries = 0;
+    while (offset < size) {
+      final end = (offset + chunkSize < size ? offset + chunkSize : size) - 1;
+      final chunk = await file
+          .openRead(offset, end + 1)
+          .fold<BytesBuilder>(BytesBuilder(copy: false), (builder, data) => builder..add(data))
+          .then((builder) => builder.takeBytes());
+      try {
+        final response = await _dio.put(
+          '$baseUrl/uploads/$uploadId/',
+          data: Stream.fromIterable([chunk]),
+          options: Options(headers: {
+            ...headers,
+            'Content-Type': 'application/octet-stream',
+            'Content-Length': chunk.length,
+            'Content-Range': 'bytes $offset-$end/$size',
+          }),
+        );
+        offset = response.data['offset'];
+        retries = 0;
+      } on DioException catch (e) {
+        if (++retries > maxRetries || e.response?.statusCode == 401) rethrow;
+        AppLogger.warning('Upload chunk failed, resuming (attempt $retries)');
+        final status = await _dio.get(
+          '$baseUrl/uploads/$uploadId/',
+          options: Options(headers: headers),
+        );
+        offset = status.data['offset'];
       }
-    } catch (e) {
-      AppLogger.error('Error fetching question papers', e);
-      throw AppException('Failed to load question papers', 
-        details: e.toString(), 
-        type: AppExceptionType.unknown);
     }
+
+    final completed = await _dio.post(
+      '$baseUrl/uploads/$uploadId/complete/',
+      options: Options(headers: headers),
+    );
+    return completed.data['id'];
   }
 
   // Secure file upload for question papers
@@ -329,26 +458,20 @@ class ApiService {
           type: AppExceptionType.authentication);
       }
       
-      // Create form data
-      final formData = FormData.fromMap({
-        'file': await MultipartFile.fromFile(file.path),
-        'subject': subject,
-        'degree': degreeId,
-        'semester': semester,
-        'year': year,
-        'university_id': universityId,
-      });
-      
-      // Upload file
-      final response = await _dio.post(
-        '$baseUrl/question-papers/upload/',
-        data: formData,
-        options: Options(
-          headers: {'Authorization': 'Bearer $token'},
-        ),
+      // Resumable upload: a dropped connection only re-sends the current chunk
+      await _chunkedUpload(
+        file: file,
+        kind: 'question_paper',
+        fields: {
+          'subject': subject,
+          'degree': degreeId,
+          'semester': semester,
+          'year': year,
+          'university_id': universityId,
+        },
+        token: token,
       );
-      
-      return response.statusCode == 200 || response.statusCode == 201;
+      return true;
     } on DioException catch (e) {
       AppLogger.error('File upload error', e);
       if (e.response?.statusCode == 401) {
@@ -369,123 +492,54 @@ class ApiService {
   }
 
   // Notes
-  Future<List<Note>> getNotes({
+  Future<PagedResult<Note>> getNotes({
     int? degreeId,
     int? semester,
     int? year,
     int? universityId,
-  }) async {
-    try {
-      String url = '$baseUrl/notes/';
-      List<String> params = [];
-      
-      if (degreeId != null) params.add('degree=$degreeId');
-      if (semester != null) params.add('semester=$semester');
-      if (year != null) params.add('year=$year');
-      if (universityId != null) params.add('university=$universityId');
-      
-      if (params.isNotEmpty) {
-        url += '?${params.join('&')}';
-      }
+    String? nextUrl,
+  }) {
+    String url = '$baseUrl/notes/';
+    List<String> params = [];
 
-      AppLogger.info('Fetching notes without auth requirement: $url');
-      print('DEBUG: Calling getNotes with URL: $url');
-      
-      final response = await http.get(Uri.parse(url));
-      print('DEBUG: getNotes response status: ${response.statusCode}');
-      
-      if (response.statusCode == 200) {
-        print('DEBUG: getNotes response body: ${response.body}');
-        List<dynamic> data = json.decode(response.body);
-        print('DEBUG: getNotes parsed JSON data: $data');
-        
-        final notes = data.map((json) {
-          print('DEBUG: Parsing note JSON: $json');
-          try {
-            final note = Note.fromJson(json);
-            print('DEBUG: Successfully parsed note: id=${note.id}, title=${note.title}, subject=${note.subject}');
-            return note;
-          } catch (e) {
-            print('DEBUG: Error parsing note: $e');
-            rethrow;
-          }
-        }).toList();
-        
-        print('DEBUG: getNotes returning ${notes.length} notes');
-        return notes;
-      } else {
-        AppLogger.error('Failed to load notes [${response.statusCode}]', response.body);
-        print('DEBUG: getNotes error response: ${response.body}');
-        throw AppException('Failed to load notes',
-          details: 'Status code: ${response.statusCode}',
-          type: AppExceptionType.server);
-      }
-    } catch (e) {
-      AppLogger.error('Error fetching notes', e);
-      print('DEBUG: getNotes exception: $e');
-      throw AppException('Failed to load notes', 
-        details: e.toString(), 
-        type: AppExceptionType.unknown);
+    if (degreeId != null) params.add('degree=$degreeId');
+    if (semester != null) params.add('semester=$semester');
+    if (year != null) params.add('year=$year');
+    if (universityId != null) params.add('university=$universityId');
+
+    if (params.isNotEmpty) {
+      url += '?${params.join('&')}';
     }
+    return getPage(nextUrl ?? url, (json) => Note.fromJson(json));
   }
 
   // Exams
-  Future<List<Exam>> getExams({
+  Future<PagedResult<Exam>> getExams({
     int? degreeId,
     String? semester,
     int? admissionYear,
     int? universityId,
-  }) async {
+    String? nextUrl,
+  }) {
     String url = '$baseUrl/exams/';
     List<String> params = [];
-    
+
     if (degreeId != null) params.add('degree_name=$degreeId');
     if (semester != null) params.add('semester=$semester');
     if (admissionYear != null) params.add('admission_year=$admissionYear');
     if (universityId != null) params.add('university=$universityId');
-    
+
     if (params.isNotEmpty) {
       url += '?${params.join('&')}';
     }
-
-    try {
-      print('DEBUG: Fetching exams from $url');
-      final response = await http.get(Uri.parse(url));
-      
-      if (response.statusCode == 200) {
-        List<dynamic> data = json.decode(response.body);
-        print('DEBUG: Exams data received: ${data.length} items');
-        
-        // Print the first item to debug
-        if (data.isNotEmpty) {
-          print('DEBUG: First exam item: ${data[0]}');
-        }
-        
-        List<Exam> exams = [];
-        for (var i = 0; i < data.length; i++) {
-          try {
-            exams.add(Exam.fromJson(data[i]));
-          } catch (e) {
-            print('DEBUG: Error parsing exam at index $i: $e');
-            print('DEBUG: Problematic data: ${data[i]}');
-          }
-        }
-        return exams;
-      } else {
-        print('DEBUG: API error: ${response.statusCode} - ${response.body}');
-        throw Exception('Failed to load exams: ${response.statusCode}');
-      }
-    } catch (e) {
-      print('DEBUG: Exception in getExams: $e');
-      throw Exception('Failed to load exams: $e');
-    }
+    return getPage(nextUrl ?? url, (json) => Exam.fromJson(json));
   }
 
   // Entrance Notifications
   Future<List<EntranceNotification>> getEntranceNotifications() async {
     final response = await http.get(Uri.parse('$baseUrl/entrance-notifications/'));
     if (response.statusCode == 200) {
-      List<dynamic> data = json.decode(response.body);
+      List<dynamic> data = await _allResults(response);
       return data.map((json) => EntranceNotification.fromJson(json)).toList();
     } else {
       throw Exception('Failed to load entrance notifications');
@@ -496,13 +550,18 @@ class ApiService {
   Future<List<News>> getNews() async {
     final response = await http.get(Uri.parse('$baseUrl/news/'));
     if (response.statusCode == 200) {
-      List<dynamic> data = json.decode(response.body);
+      List<dynamic> data = await _allResults(response);
       return data.map((json) => News.fromJson(json)).toList();
     } else {
       throw Exception('Failed to load news');
     }
   }
 
+  // One page of the news feed; pass the previous page's nextUrl to continue
+  Future<PagedResult<News>> getNewsPage({String? nextUrl}) {
+    return getPage(nextUrl ?? '$baseUrl/news/', (json) => News.fromJson(json));
+  }
+
   Future<News> getNewsDetail(String slug) async {
     final response = await http.get(Uri.parse('$baseUrl/news/$slug/'));
     if (response.statusCode == 200) {
@@ -519,7 +578,7 @@ class ApiService {
   Future<List<Job>> getJobs() async {
     final response = await http.get(Uri.parse('$baseUrl/jobs/'));
     if (response.statusCode == 200) {
-      List<dynamic> data = json.decode(response.body);
+      List<dynamic> data = await _allResults(response);
       return data.map((json) => Job.fromJson(json)).toList();
     } else {
       throw Exception('Failed to load jobs');
@@ -540,7 +599,7 @@ class ApiService {
   Future<List<Initiative>> getInitiatives() async {
     final response = await http.get(Uri.parse('$baseUrl/initiatives/'));
     if (response.statusCode == 200) {
-      List<dynamic> data = json.decode(response.body);
+      List<dynamic> data = await _allResults(response);
       return data.map((json) => Initiative.fromJson(json)).toList();
     } else {
       throw Exception('Failed to load initiatives');
@@ -551,7 +610,7 @@ class ApiService {
   Future<List<Gallery>> getGallery() async {
     final response = await http.get(Uri.parse('$baseUrl/gallery/'));
     if (response.statusCode == 200) {
-      List<dynamic> data = json.decode(response.body);
+      List<dynamic> data = await _allResults(response);
       return data.map((json) => Gallery.fromJson(json)).toList();
     } else {
       throw Exception('Failed to load gallery');
@@ -559,137 +618,80 @@ class ApiService {
   }
 
   // Search functions
-  Future<List<QuestionPaper>> searchQuestionPapers(String query) async {
-    final response = await http.get(
-      Uri.parse('$baseUrl/question-papers/?search=$query'),
+  Future<PagedResult<QuestionPaper>> searchQuestionPapers(String query, {String? nextUrl}) {
+    return getPage(
+      nextUrl ?? '$baseUrl/question-papers/?search=${Uri.encodeQueryComponent(query)}',
+      (json) => QuestionPaper.fromJson(json),
     );
-    if (response.statusCode == 200) {
-      List<dynamic> data = json.decode(response.body);
-      return data.map((json) => QuestionPaper.fromJson(json)).toList();
-    } else {
-      throw Exception('Failed to search question papers');
-    }
   }
 
-  Future<List<Note>> searchNotes(String query) async {
-    final response = await http.get(
-      Uri.parse('$baseUrl/notes/?search=$query'),
+  Future<PagedResult<Note>> searchNotes(String query, {String? nextUrl}) {
+    return getPage(
+      nextUrl ?? '$baseUrl/notes/?search=${Uri.encodeQueryComponent(query)}',
+      (json) => Note.fromJson(json),
     );
-    if (response.statusCode == 200) {
-      List<dynamic> data = json.decode(response.body);
-      return data.map((json) => Note.fromJson(json)).toList();
-    } else {
-      throw Exception('Failed to search notes');
-    }
   }
 
-  Future<List<Exam>> searchExams(String query) async {
-    final response = await http.get(
-      Uri.parse('$baseUrl/exams/?search=$query'),
+  Future<PagedResult<Exam>> searchExams(String query, {String? nextUrl}) {
+    return getPage(
+      nextUrl ?? '$baseUrl/exams/?search=${Uri.encodeQueryComponent(query)}',
+      (json) => Exam.fromJson(json),
     );
-    if (response.statusCode == 200) {
-      List<dynamic> data = json.decode(response.body);
-      return data.map((json) => Exam.fromJson(json)).toList();
-    } else {
-      throw Exception('Failed to search exams');
-    }
   }
 
-  Future<List<EntranceNotification>> searchEntranceNotifications(String query) async {
-    final response = await http.get(
-      Uri.parse('$baseUrl/entrance-notifications/?search=$query'),
+  Future<PagedResult<EntranceNotification>> searchEntranceNotifications(String query, {String? nextUrl}) {
+    return getPage(
+      nextUrl ?? '$baseUrl/entrance-notifications/?search=${Uri.encodeQueryComponent(query)}',
+      (json) => EntranceNotification.fromJson(json),
     );
-    if (response.statusCode == 200) {
-      List<dynamic> data = json.decode(response.body);
-      return data.map((json) => EntranceNotification.fromJson(json)).toList();
-    } else {
-      throw Exception('Failed to search entrance notifications');
-    }
   }
 
-  Future<List<News>> searchNews(String query) async {
-    final response = await http.get(
-      Uri.parse('$baseUrl/news/?search=$query'),
+  Future<PagedResult<News>> searchNews(String query, {String? nextUrl}) {
+    return getPage(
+      nextUrl ?? '$baseUrl/news/?search=${Uri.encodeQueryComponent(query)}',
+      (json) => News.fromJson(json),
     );
-    if (response.statusCode == 200) {
-      List<dynamic> data = json.decode(response.body);
-      return data.map((json) => News.fromJson(json)).toList();
-    } else {
-      throw Exception('Failed to search news');
-    }
   }
 
-  Future<List<Job>> searchJobs(String query) async {
-    final response = await http.get(
-      Uri.parse('$baseUrl/jobs/?search=$query'),
+  Future<PagedResult<Job>> searchJobs(String query, {String? nextUrl}) {
+    return getPage(
+      nextUrl ?? '$baseUrl/jobs/?search=${Uri.encodeQueryComponent(query)}',
+      (json) => Job.fromJson(json),
     );
-    if (response.statusCode == 200) {
-      List<dynamic> data = json.decode(response.body);
-      return data.map((json) => Job.fromJson(json)).toList();
-    } else {
-      throw Exception('Failed to search jobs');
-    }
   }
 
-  Future<List<Initiative>> searchInitiatives(String query) async {
-    final response = await http.get(
-      Uri.parse('$baseUrl/initiatives/?search=$query'),
+  Future<PagedResult<Initiative>> searchInitiatives(String query, {String? nextUrl}) {
+    return getPage(
+      nextUrl ?? '$baseUrl/initiatives/?search=${Uri.encodeQueryComponent(query)}',
+      (json) => Initiative.fromJson(json),
     );
-    if (response.statusCode == 200) {
-      List<dynamic> data = json.decode(response.body);
-      return data.map((json) => Initiative.fromJson(json)).toList();
-    } else {
-      throw Exception('Failed to search initiatives');
-    }
   }
 
   // Events
-  Future<List<Event>> getEvents() async {
-    try {
-      print('DEBUG: Making GET request to $baseUrl/events/');
-      final response = await http.get(Uri.parse('$baseUrl/events/'));
-      print('DEBUG: Events API response status: ${response.statusCode}');
-      
-      if (response.statusCode == 200) {
-        print('DEBUG: Events API response body: ${response.body}');
-        List<dynamic> data = json.decode(response.body);
-        print('DEBUG: Parsed JSON data count: ${data.length}');
-        
-        final events = data.map((json) {
-          print('DEBUG: Processing event JSON: $json');
-          try {
-            final event = Event.fromJson(json);
-            print('DEBUG: Successfully parsed event: id=${event.id}, title=${event.title}, categoryId=${event.categoryId}, districtId=${event.districtId}');
-            return event;
-          } catch (e) {
-            print('DEBUG: Error parsing event: $e');
-            rethrow;
-          }
-        }).toList();
-        
-        print('DEBUG: Returning ${events.length} events');
-        return events;
-      } else {
-        AppLogger.error('Failed to load events [${response.statusCode}]', response.body);
-        print('DEBUG: Events API error response: ${response.body}');
-        throw AppException('Failed to load events',
-          details: 'Status code: ${response.statusCode}',
-          type: AppExceptionType.server);
-      }
-    } catch (e) {
-      AppLogger.error('Error fetching events', e);
-      print('DEBUG: Exception in getEvents: $e');
-      throw AppException('Failed to load events', 
-        details: e.toString(), 
-        type: AppExceptionType.unknown);
+  Future<PagedResult<Event>> getEvents({
+    int? categoryId,
+    int? districtId,
+    DateTime? date,
+    String? nextUrl,
+  }) {
+    String url = '$baseUrl/events/';
+    List<String> params = [];
+
+    if (categoryId != null) params.add('category=$categoryId');
+    if (districtId != null) params.add('district=$districtId');
+    if (date != null) params.add('event_start__date=${date.toIso8601String().substring(0, 10)}');
+
+    if (params.isNotEmpty) {
+      url += '?${params.join('&')}';
     }
+    return getPage(nextUrl ?? url, (json) => Event.fromJson(json));
   }
 
   Future<List<Map<String, dynamic>>> getEventCategories() async {
     try {
       final response = await http.get(Uri.parse('$baseUrl/event-categories/'));
       if (response.statusCode == 200) {
-        List<dynamic> data = json.decode(response.body);
+        List<dynamic> data = await _allResults(response);
         return data.map((json) => json as Map<String, dynamic>).toList();
       } else {
         AppLogger.error('Failed to load event categories [${response.statusCode}]', response.body);
@@ -710,7 +712,7 @@ class ApiService {
       AppLogger.info('Fetching districts without auth requirement');
       final response = await http.get(Uri.parse('$baseUrl/districts/'));
       if (response.statusCode == 200) {
-        List<dynamic> data = json.decode(response.body);
+        List<dynamic> data = await _allResults(response);
         return data.map((json) => District.fromJson(json)).toList();
       } else {
         AppLogger.error('Failed to load districts [${response.statusCode}]', response.body);
@@ -745,14 +747,11 @@ class ApiService {
     }
   }
 
-  Future<List<Event>> searchEvents(String query) async {
-    final response = await http.get(Uri.parse('$baseUrl/events/?search=$query'));
-    if (response.statusCode == 200) {
-      List<dynamic> data = json.decode(response.body);
-      return data.map((json) => Event.fromJson(json)).toList();
-    } else {
-      throw Exception('Failed to search events');
-    }
+  Future<PagedResult<Event>> searchEvents(String query, {String? nextUrl}) {
+    return getPage(
+      nextUrl ?? '$baseUrl/events/?search=${Uri.encodeQueryComponent(query)}',
+      (json) => Event.fromJson(json),
+    );
   }
 
   // FAQs
@@ -764,7 +763,7 @@ class ApiService {
       
       if (response.statusCode == 200) {
         print('DEBUG: FAQs API response body: ${response.body}');
-        List<dynamic> data = json.decode(response.body);
+        List<dynamic> data = await _allResults(response);
         print('DEBUG: Parsed JSON data count: ${data.length}');
         
         final faqs = data.map((json) {
@@ -797,42 +796,11 @@ class ApiService {
     }
   }
 
-  Future<List<FAQ>> searchFaqs(String query) async {
-    try {
-      print('DEBUG: Making GET request to $baseUrl/faqs/?search=$query');
-      final response = await http.get(Uri.parse('$baseUrl/faqs/?search=$query'));
-      print('DEBUG: FAQs search API response status: ${response.statusCode}');
-      
-      if (response.statusCode == 200) {
-        print('DEBUG: FAQs search API response body: ${response.body}');
-        List<dynamic> data = json.decode(response.body);
-        print('DEBUG: Parsed JSON data count: ${data.length}');
-        
-        final faqs = data.map((json) {
-          try {
-            return FAQ.fromJson(json);
-          } catch (e) {
-            print('DEBUG: Error parsing FAQ during search: $e');
-            rethrow;
-          }
-        }).toList();
-        
-        print('DEBUG: Returning ${faqs.length} FAQs from search');
-        return faqs;
-      } else {
-        AppLogger.error('Failed to search FAQs [${response.statusCode}]', response.body);
-        print('DEBUG: FAQs search API error response: ${response.body}');
-        throw AppException('Failed to search FAQs',
-          details: 'Status code: ${response.statusCode}',
-          type: AppExceptionType.server);
-      }
-    } catch (e) {
-      AppLogger.error('Error searching FAQs', e);
-      print('DEBUG: Exception in searchFaqs: $e');
-      throw AppException('Failed to search FAQs', 
-        details: e.toString(), 
-        type: AppExceptionType.unknown);
-    }
+  Future<PagedResult<FAQ>> searchFaqs(String query, {String? nextUrl}) {
+    return getPage(
+      nextUrl ?? '$baseUrl/faqs/?search=${Uri.encodeQueryComponent(query)}',
+      (json) => FAQ.fromJson(json),
+    );
   }
 
   Future<void> sendMessageUs({required String name, required String email, required String subject, required String message}) async {
@@ -871,7 +839,7 @@ class ApiService {
   Future<List<TechPick>> getTechPicks() async {
     final response = await http.get(Uri.parse('$baseUrl/affiliate-products/'));
     if (response.statusCode == 200) {
-      List<dynamic> data = json.decode(response.body);
+      List<dynamic> data = await _allResults(response);
       return data.map((json) => TechPick.fromJson(json)).toList();
     } else {
       throw Exception('Failed to load tech picks');
@@ -881,7 +849,7 @@ class ApiService {
   Future<List<String>> getTechPickCategories() async {
     final response = await http.get(Uri.parse('$baseUrl/affiliate-categories/'));
     if (response.statusCode == 200) {
-      List<dynamic> data = json.decode(response.body);
+      List<dynamic> data = await _allResults(response);
       return data.map<String>((json) => json['name'] as String).toList();
     } else {
       throw Exception('Failed to load tech pick categories');
@@ -894,7 +862,7 @@ class ApiService {
       AppLogger.info('Fetching ad sliders without auth requirement');
       final response = await http.get(Uri.parse('$baseUrl/ad-sliders/'));
       if (response.statusCode == 200) {
-        List<dynamic> data = json.decode(response.body);
+        List<dynamic> data = await _allResults(response);
         return data.map((json) => AdSlider.fromJson(json)).toList();
       } else {
         AppLogger.error('Failed to load ad sliders [${response.statusCode}]', response.body);
@@ -910,13 +878,34 @@ class ApiService {
     }
   }
   
+  // Home screen sections in a single round trip
+  Future<HomeFeed> getHomeFeed() async {
+    try {
+      AppLogger.info('Fetching home feed');
+      final response = await http.get(Uri.parse('$baseUrl/home/'));
+      if (response.statusCode == 200) {
+        return HomeFeed.fromJson(json.decode(response.body));
+      } else {
+        AppLogger.error('Failed to load home feed [${response.statusCode}]', response.body);
+        throw AppException('Failed to load home feed',
+          details: 'Status code: ${response.statusCode}',
+          type: AppExceptionType.server);
+      }
+    } catch (e) {
+      AppLogger.error('Error fetching home feed', e);
+      throw AppException('Failed to load home feed',
+        details: e.toString(),
+        type: AppExceptionType.unknown);
+    }
+  }
+
   // Featured Jobs for Home Page
   Future<List<Job>> getFeaturedJobs() async {
     try {
       AppLogger.info('Fetching featured jobs for home page');
       final response = await http.get(Uri.parse('$baseUrl/featured-jobs/'));
       if (response.statusCode == 200) {
-        List<dynamic> data = json.decode(response.body);
+        List<dynamic> data = await _allResults(response);
         return data.map((json) => Job.fromJson(json)).toList();
       } else {
         AppLogger.error('Failed to load featured jobs [${response.statusCode}]', response.body);
@@ -938,7 +927,7 @@ class ApiService {
       AppLogger.info('Fetching featured events for home page');
       final response = await http.get(Uri.parse('$baseUrl/featured-events/'));
       if (response.statusCode == 200) {
-        List<dynamic> data = json.decode(response.body);
+        List<dynamic> data = await _allResults(response);
         return data.map((json) => Event.fromJson(json)).toList();
       } else {
         AppLogger.error('Failed to load featured events [${response.statusCode}]', response.body);
@@ -960,7 +949,7 @@ class ApiService {
       AppLogger.info('Fetching featured news for home page');
       final response = await http.get(Uri.parse('$baseUrl/featured-news/'));
       if (response.statusCode == 200) {
-        List<dynamic> data = json.decode(response.body);
+        List<dynamic> data = await _allResults(response);
         return data.map((json) => News.fromJson(json)).toList();
       } else {
         AppLogger.error('Failed to load featured news [${response.statusCode}]', response.body);
@@ -982,7 +971,7 @@ class ApiService {
       AppLogger.info('Fetching featured exams for home page');
       final response = await http.get(Uri.parse('$baseUrl/featured-exams/'));
       if (response.statusCode == 200) {
-        List<dynamic> data = json.decode(response.body);
+        List<dynamic> data = await _allResults(response);
         return data.map((json) => Exam.fromJson(json)).toList();
       } else {
         AppLogger.error('Failed to load featured exams [${response.statusCode}]', response.body);
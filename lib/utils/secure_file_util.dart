@@ -96,7 +96,7 @@ class SecureFileUtil {
         };
       }
       
-      await dio.download(url, filePath);
+      await _resumableDownload(dio, url, filePath, dir.path);
       
       // Verify downloaded file
       final file = File(filePath);
@@ -112,6 +112,53 @@ class SecureFileUtil {
     }
   }
   
+  // Download `url` to `filePath`, resuming an interrupted earlier attempt.
+  // The partial file is keyed by the URL and remembered together with the
+  // server's ETag; the server only answers the Range request with the
+  // remaining bytes (206) if the file is unchanged, otherwise it sends the
+  // whole file (200) and we start over.
+  static Future<void> _resumableDownload(Dio dio, String url, String filePath, String dirPath) async {
+    final key = sha256.convert(utf8.encode(url)).toString();
+    final partial = File('$dirPath/partial_$key.part');
+    final etagFile = File('$dirPath/partial_$key.etag');
+
+    var offset = await partial.exists() ? await partial.length() : 0;
+    final etag = await etagFile.exists() ? await etagFile.readAsString() : null;
+    if (etag == null) offset = 0;
+
+    final response = await dio.get<ResponseBody>(
+      url,
+      options: Options(
+        responseType: ResponseType.stream,
+        headers: offset > 0 ? {'Range': 'bytes=$offset-', 'If-Range': etag} : null,
+        validateStatus: (status) => status == 200 || status == 206,
+      ),
+    );
+
+    final resumed = response.statusCode == 206;
+    final newEtag = response.headers.value('etag');
+    if (newEtag != null) {
+      await etagFile.writeAsString(newEtag);
+    } else if (await etagFile.exists()) {
+      await etagFile.delete();
+    }
+    if (resumed) {
+      AppLogger.info('Resuming download at byte $offset');
+    }
+
+    final sink = partial.openWrite(mode: resumed ? FileMode.append : FileMode.write);
+    try {
+      await sink.addStream(response.data!.stream);
+    } finally {
+      await sink.close();
+    }
+
+    await partial.rename(filePath);
+    if (await etagFile.exists()) {
+      await etagFile.delete();
+    }
+  }
+
   // Securely save file
   static Future<File> secureSave(Uint8List data, String filename) async {
     try {